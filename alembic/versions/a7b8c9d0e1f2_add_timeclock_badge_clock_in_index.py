@@ -0,0 +1,31 @@
+"""Add timeclock badge number and clock-in index
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for per-employee clock-in range queries."""
+    op.create_index(
+        'ix_timeclock_badge_number_clock_in',
+        'timeclock',
+        ['badge_number', 'clock_in'],
+    )
+
+
+def downgrade() -> None:
+    """Remove per-employee clock-in index."""
+    op.drop_index('ix_timeclock_badge_number_clock_in', 'timeclock')
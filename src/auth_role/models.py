@@ -81,9 +81,12 @@ class AuthRole(Base):
         secondary=MEMBERSHIP_IDENTIFIER,
         back_populates="auth_roles",
     )
+    # Loaded with the role: permission checks walk every role of a user,
+    # which would otherwise issue one query per role
     permissions: Mapped[list[AuthRolePermission]] = relationship(
         AuthRolePermission,
         cascade="all, delete",
+        lazy="selectin",
     )
 
     __tablename__ = IDENTIFIER
@@ -31,6 +31,7 @@ class Settings(BaseSettings):
         ENVIRONMENT (str): The environment in which the application is running.
         DATABASE_URL (str): The database URL.
         CORS_ORIGINS (str): Comma-separated list of allowed CORS origins.
+        PASSWORD_HASH_ROUNDS (int): bcrypt cost factor for password hashes.
 
     """
 
@@ -44,6 +45,7 @@ class Settings(BaseSettings):
     GITHUB_TOKEN: str = ""  # Optional PAT for private repos
     AUTO_CHECK_UPDATES: bool = True
     UPDATE_CHECK_INTERVAL_HOURS: int = 6
+    PASSWORD_HASH_ROUNDS: int = 12
 
     def get_database_url(self) -> str:
         """Get the database URL based on environment.
@@ -111,10 +111,11 @@ def filter_logs_by_permissions(
 
     """
     # Build a set of permissions the user has
-    user_permissions = set()
-    for role in user.auth_roles:
-        for permission in role.permissions:
-            user_permissions.add(permission.resource)
+    user_permissions = {
+        permission.resource
+        for role in user.auth_roles
+        for permission in role.permissions
+    }
 
     # Define which permissions allow viewing which types of logs
     permission_to_log_keywords = {
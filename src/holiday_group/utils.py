@@ -1,14 +1,19 @@
 """Utility functions for holiday generation and management."""
 
 from calendar import monthrange
-from datetime import date, timedelta
+from datetime import date
+from functools import lru_cache
 
 
+@lru_cache(maxsize=4096)
 def get_nth_weekday_of_month(
     year: int, month: int, weekday: int, n: int,
 ) -> date:
     """Get the nth occurrence of a weekday in a month.
 
+    Results are cached; the same few holiday rules are looked up for the
+    same years over and over.
+
     Args:
         year (int): Year.
         month (int): Month (1-12).
@@ -20,30 +25,15 @@ def get_nth_weekday_of_month(
         date: The date of the nth occurrence of the weekday.
 
     """
-    if n == 5:  # Last occurrence
-        # Start from the end of the month and work backwards
-        last_day = monthrange(year, month)[1]
-        day = date(year, month, last_day)
-
-        # Go backwards until we find the target weekday
-        while day.weekday() != weekday:
-            day -= timedelta(days=1)
-
-        return day
-    else:
-        # Start from the first day of the month
-        first_day = date(year, month, 1)
+    first_weekday, last_day = monthrange(year, month)
 
-        # Calculate days until the first occurrence of the target weekday
-        days_ahead = weekday - first_day.weekday()
-        if days_ahead < 0:
-            days_ahead += 7
-
-        # Get the first occurrence
-        first_occurrence = first_day + timedelta(days=days_ahead)
+    if n == 5:  # Last occurrence
+        # Step back from the last day of the month to the target weekday
+        last_weekday = (first_weekday + last_day - 1) % 7
+        return date(year, month, last_day - (last_weekday - weekday) % 7)
 
-        # Add weeks to get to the nth occurrence
-        return first_occurrence + timedelta(weeks=(n - 1))
+    # Step forward from the first day of the month, then add whole weeks
+    return date(year, month, 1 + (weekday - first_weekday) % 7 + (n - 1) * 7)
 
 
 def generate_holiday_for_year(
@@ -69,21 +59,55 @@ def generate_holiday_for_year(
     Returns:
         tuple[date, date]: Start and end dates for the holiday.
 
+    """
+    return _generate_holiday_dates(
+        year,
+        recurrence_type,
+        recurrence_month,
+        recurrence_day,
+        recurrence_week,
+        recurrence_weekday,
+    )
+
+
+@lru_cache(maxsize=2048)
+def _generate_holiday_dates(
+    year: int,
+    recurrence_type: str,
+    recurrence_month: int,
+    recurrence_day: int | None,
+    recurrence_week: int | None,
+    recurrence_weekday: int | None,
+) -> tuple[date, date]:
+    """Cached core of `generate_holiday_for_year`.
+
+    The holiday name does not affect the dates, so it is left out of the
+    cache key.
+
+    Args:
+        year (int): Year to generate the holiday for.
+        recurrence_type (str): Type of recurrence ('fixed' or 'relative').
+        recurrence_month (int): Month of the holiday (1-12).
+        recurrence_day (int | None): Day of month for fixed holidays.
+        recurrence_week (int | None): Week of month for relative holidays.
+        recurrence_weekday (int | None): Weekday for relative holidays.
+
+    Returns:
+        tuple[date, date]: Start and end dates for the holiday.
+
     """
     if recurrence_type == "fixed":
         # Fixed date (e.g., December 25)
         start_date = date(year, recurrence_month, recurrence_day)
-        end_date = start_date
     elif recurrence_type == "relative":
         # Relative date (e.g., First Monday in September)
         start_date = get_nth_weekday_of_month(
             year, recurrence_month, recurrence_weekday, recurrence_week
         )
-        end_date = start_date
     else:
         raise ValueError(f"Invalid recurrence type: {recurrence_type}")
 
-    return start_date, end_date
+    return start_date, start_date
 
 
 def get_holidays_for_year(holidays: list, year: int) -> list[dict]:
@@ -98,32 +122,39 @@ def get_holidays_for_year(holidays: list, year: int) -> list[dict]:
             name, start_date, end_date.
 
     """
-    result = []
-
-    for holiday in holidays:
-        if holiday.is_recurring:
-            # Generate the holiday for this specific year
-            start_date, end_date = generate_holiday_for_year(
-                holiday.name,
-                year,
-                holiday.recurrence_type,
-                holiday.recurrence_month,
-                holiday.recurrence_day,
-                holiday.recurrence_week,
-                holiday.recurrence_weekday,
-            )
-            result.append({
-                "name": holiday.name,
-                "start_date": start_date,
-                "end_date": end_date,
-            })
-        else:
-            # One-time holiday - only include if it falls in this year
-            if holiday.start_date.year == year:
-                result.append({
-                    "name": holiday.name,
-                    "start_date": holiday.start_date,
-                    "end_date": holiday.end_date,
-                })
-
-    return result
+    return [
+        _holiday_instance(holiday, year)
+        for holiday in holidays
+        # One-time holidays are only included if they fall in this year
+        if holiday.is_recurring or holiday.start_date.year == year
+    ]
+
+
+def _holiday_instance(holiday, year: int) -> dict:
+    """Get a holiday's name and dates for a specific year.
+
+    Args:
+        holiday: Holiday model instance.
+        year (int): Year to generate the holiday for.
+
+    Returns:
+        dict: Holiday dict with name, start_date, end_date.
+
+    """
+    if holiday.is_recurring:
+        start_date, end_date = generate_holiday_for_year(
+            holiday.name,
+            year,
+            holiday.recurrence_type,
+            holiday.recurrence_month,
+            holiday.recurrence_day,
+            holiday.recurrence_week,
+            holiday.recurrence_weekday,
+        )
+    else:
+        start_date, end_date = holiday.start_date, holiday.end_date
+    return {
+        "name": holiday.name,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
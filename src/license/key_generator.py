@@ -18,7 +18,9 @@ License keys can be in two formats:
 2. Hex format: 128-character hex string (compact)
 """
 
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -36,13 +38,19 @@ MCowBQYDK2VwAyEAG+75HW6g1TbJNZQDMR26D/vWszI9aYF/QUQHr+6tg4s=
 
 # Message prefix for activation key signatures (must match license server)
 ACTIVATION_MESSAGE_PREFIX = b"TAP-Activation-v2:"
+_ACTIVATION_MESSAGE_PREFIX = ACTIVATION_MESSAGE_PREFIX.decode("ascii")
 
+# A hex-format license key: 64 bytes as 128 hex digits
+_HEX_KEY_PATTERN = re.compile(r"[0-9a-fA-F]{128}")
 
+
+@lru_cache(maxsize=1)
 def get_machine_id() -> str:
     """Get the current machine's unique identifier.
 
     This is used internally for license activation and should not
-    be exposed to users.
+    be exposed to users. The ID cannot change while the process runs, so
+    it is only read from the OS once.
 
     Returns:
         str: The machine's unique ID (hashed for privacy).
@@ -60,11 +68,32 @@ def get_activation_message(license_key: str, machine_id: str) -> bytes:
     Returns:
         bytes: The message that should have been signed.
     """
-    return ACTIVATION_MESSAGE_PREFIX + f"{license_key}:{machine_id}".encode(
+    return f"{_ACTIVATION_MESSAGE_PREFIX}{license_key}:{machine_id}".encode(
         "utf-8"
     )
 
 
+@lru_cache(maxsize=4)
+def _load_public_key(pem: bytes) -> Ed25519PublicKey:
+    """Parse the license server's PEM public key, caching the result.
+
+    Keyed on the PEM bytes, so a replaced PUBLIC_KEY_PEM is parsed afresh.
+
+    Args:
+        pem: PEM-encoded Ed25519 public key.
+
+    Returns:
+        Ed25519PublicKey: The parsed public key.
+
+    Raises:
+        ValueError: If the PEM is invalid or not an Ed25519 key.
+    """
+    public_key = serialization.load_pem_public_key(pem)
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise ValueError("Invalid public key type")
+    return public_key
+
+
 def _load_word_list() -> List[str]:
     """Load word list from words.txt file.
 
@@ -86,13 +115,21 @@ def _load_word_list() -> List[str]:
 
 # Load word list - we need exactly 256 words for 1-byte-per-word encoding
 _FULL_WORD_LIST = _load_word_list()
-WORD_LIST = (
-    _FULL_WORD_LIST[:256] if len(_FULL_WORD_LIST) >= 256 else _FULL_WORD_LIST
-)
+# Immutable, with interned words so key lookups compare by identity first
+WORD_LIST = tuple(sys.intern(word) for word in _FULL_WORD_LIST[:256])
 
 # Create reverse lookup
 WORD_TO_INDEX = {word: i for i, word in enumerate(WORD_LIST)}
 
+# Maps whitespace between word groups to the dash used within groups
+_SEPARATOR_TABLE = str.maketrans(dict.fromkeys(" \t\n\r\f\v", "-"))
+
+# Separator following each of the 64 words of a key: dashes within a group
+# of four, a space between groups and nothing after the last word
+_WORD_SEPARATORS = tuple(
+    "" if i == 63 else " " if i % 4 == 3 else "-" for i in range(64)
+)
+
 
 def hex_to_words(hex_key: str) -> str:
     """Convert a hex license key to word format.
@@ -111,14 +148,10 @@ def hex_to_words(hex_key: str) -> str:
         raise ValueError("Hex key must be 128 characters")
 
     key_bytes = bytes.fromhex(hex_key)
-    words = [WORD_LIST[b] for b in key_bytes]
-
-    groups = []
-    for i in range(0, 64, 4):
-        group = "-".join(words[i : i + 4])
-        groups.append(group)
-
-    return " ".join(groups)
+    return "".join(
+        WORD_LIST[b] + separator
+        for b, separator in zip(key_bytes, _WORD_SEPARATORS)
+    )
 
 
 def words_to_hex(word_key: str) -> str:
@@ -133,30 +166,22 @@ def words_to_hex(word_key: str) -> str:
     Raises:
         ValueError: If the word format is invalid or contains unknown words
     """
-    word_key = word_key.upper().strip()
-
-    if " " in word_key:
-        groups = word_key.split()
-        words = []
-        for group in groups:
-            words.extend(group.split("-"))
-    else:
-        words = word_key.split("-")
-
-    words = [w for w in words if w]
+    # Groups are separated by whitespace and words within a group by dashes
+    words = [
+        word
+        for word in word_key.upper().translate(_SEPARATOR_TABLE).split("-")
+        if word
+    ]
 
     if len(words) != 64:
         raise ValueError(
             f"Word key must contain exactly 64 words, got {len(words)}"
         )
 
-    key_bytes = bytearray()
-    for word in words:
-        if word not in WORD_TO_INDEX:
-            raise ValueError(f"Unknown word in license key: {word}")
-        key_bytes.append(WORD_TO_INDEX[word])
-
-    return key_bytes.hex()
+    try:
+        return bytes(WORD_TO_INDEX[word] for word in words).hex()
+    except KeyError as e:
+        raise ValueError(f"Unknown word in license key: {e.args[0]}") from None
 
 
 def is_word_format(license_key: str) -> bool:
@@ -168,22 +193,21 @@ def is_word_format(license_key: str) -> bool:
     Returns:
         bool: True if the key appears to be in word format
     """
-    normalized = license_key.upper().strip()
+    normalized = license_key.strip()
 
-    if len(normalized) == 128:
-        try:
-            bytes.fromhex(normalized)
-            return False
-        except ValueError:
-            pass
+    if _HEX_KEY_PATTERN.fullmatch(normalized):
+        return False
 
     return "-" in normalized or " " in normalized
 
 
+@lru_cache(maxsize=1)
 def normalize_license_key(license_key: str) -> str:
     """Normalize a license key to hex format.
 
-    Accepts both word format and hex format, returns hex format.
+    Accepts both word format and hex format, returns hex format. The most
+    recent result is kept, as one activation request normalizes the same
+    key several times.
 
     Args:
         license_key: License key in either format
@@ -210,14 +234,19 @@ def validate_license_key_format(license_key: str) -> bool:
     Returns:
         bool: True if the license key is valid format
     """
-    try:
-        normalized = normalize_license_key(license_key)
-        if len(normalized) != 128:
-            return False
-        bytes.fromhex(normalized)
+    license_key = license_key.strip()
+
+    # Hex keys need no conversion; checking the pattern is enough
+    if _HEX_KEY_PATTERN.fullmatch(license_key):
         return True
-    except (ValueError, KeyError):
+    if not is_word_format(license_key):
+        return False
+
+    try:
+        words_to_hex(license_key)
+    except ValueError:
         return False
+    return True
 
 
 def verify_activation_key(
@@ -253,9 +282,7 @@ def verify_activation_key(
             machine_id = get_machine_id()
 
         # Load public key
-        public_key = serialization.load_pem_public_key(PUBLIC_KEY_PEM)
-        if not isinstance(public_key, Ed25519PublicKey):
-            raise ValueError("Invalid public key type")
+        public_key = _load_public_key(PUBLIC_KEY_PEM)
 
         # Decode activation key from hex
         signature_bytes = bytes.fromhex(activation_key)
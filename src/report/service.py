@@ -304,6 +304,13 @@ def _calculate_employee_summary(
     # Track hours by week for overtime calculation
     weekly_hours = {}
 
+    # Expand holiday ranges once so each entry is a set lookup
+    holiday_dates = {
+        h.start_date + timedelta(days=offset)
+        for h in holidays
+        for offset in range((h.end_date - h.start_date).days + 1)
+    }
+
     for entry in entries:
         hours = _calculate_period_hours(entry)
         total_hours += hours
@@ -313,10 +320,7 @@ def _calculate_employee_summary(
         days_worked_set.add(entry_date)
 
         # Check if this is a holiday
-        is_holiday = any(
-            h.start_date <= entry_date <= h.end_date for h in holidays
-        )
-        if is_holiday:
+        if entry_date in holiday_dates:
             holiday_hours += hours
 
         # Track weekly hours (week starts on Monday)
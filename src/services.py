@@ -8,6 +8,7 @@ This module defines the service layer for handling CRUD
 import os
 import random
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
 import bcrypt
 import jwt
@@ -263,7 +264,7 @@ def hash_password(password: str) -> str:
 
     """
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS)
     hashed_password = bcrypt.hashpw(password_bytes, salt).decode("utf-8")
     return hashed_password
 
@@ -328,6 +329,49 @@ def generate_refresh_token(user: User) -> str:
     return token
 
 
+@lru_cache(maxsize=1024)
+def _verify_jwt_signature(token: str, key: bytes) -> dict:
+    """Verify a JWT token's signature, caching successful results.
+
+    The verifying key is part of the cache key, so tokens checked against a
+    key replaced by `load_keys` are verified again. Failures raise and are
+    never cached.
+
+    Args:
+        token (str): The JWT token to verify.
+        key (bytes): The public key to verify the signature with.
+
+    Returns:
+        dict: The verified token payload.
+
+    """
+    return jwt.decode(token, key, algorithms=[algorithm])
+
+
+def verify_jwt_token(token: str) -> dict:
+    """Verify a JWT token and return its payload.
+
+    The RSA signature check runs once per token; expiry is checked on every
+    call, so a cached token still stops working once it expires.
+
+    Args:
+        token (str): The JWT token to verify.
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired.
+        jwt.InvalidTokenError: If the token is otherwise invalid.
+
+    Returns:
+        dict: A copy of the verified token payload.
+
+    """
+    payload = _verify_jwt_signature(token, verifying_bytes)
+    exp = payload.get("exp")
+    if exp is not None and exp <= datetime.now(timezone.utc).timestamp():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return dict(payload)
+
+
 def decode_jwt_token(token: str) -> dict:
     """Decode a JWT token for testing purposes.
 
@@ -338,7 +382,7 @@ def decode_jwt_token(token: str) -> dict:
         dict: The decoded token payload.
 
     """
-    payload = jwt.decode(token, verifying_bytes, algorithms=[algorithm])
+    payload = verify_jwt_token(token)
     # Add 'sub' field for compatibility with tests
     # expecting standard JWT claims
     if "badge_number" in payload and "sub" not in payload:
@@ -377,12 +421,11 @@ def get_scopes_from_user(user: User) -> list[str]:
         list[str]: The scopes for the user.
 
     """
-    scopes = set()
-    for role in user.auth_roles:
-        for permission in role.permissions:
-            scopes.add(permission.resource)
-
-    return list(scopes)
+    return list({
+        permission.resource
+        for role in user.auth_roles
+        for permission in role.permissions
+    })
 
 
 def requires_permission(
@@ -405,7 +448,7 @@ def requires_permission(
 
     """
     try:
-        payload = jwt.decode(token, verifying_bytes, algorithms=[algorithm])
+        payload = verify_jwt_token(token)
         badge_number: str = payload.get("badge_number")
         if badge_number is None:
             raise HTTPException(
@@ -442,6 +485,7 @@ def create_event_log(
     log_args: dict,
     caller_badge: str,
     db: Session,
+    messages: dict | None = None,
 ):
     """Create an event log entry.
 
@@ -451,9 +495,13 @@ def create_event_log(
         log_args (dict): Arguments to format the log message.
         caller_badge (str): The badge number of the user.
         db (Session): Database session for the current request.
+        messages (dict | None): Message templates keyed by identifier and
+            action. Defaults to EVENT_LOG_MSGS.
 
     """
-    message_template = EVENT_LOG_MSGS[identifier][action]
+    if messages is None:
+        messages = EVENT_LOG_MSGS
+    message_template = messages[identifier][action]
     message = message_template.format(**log_args)
 
     event_log = EventLog(
@@ -7,7 +7,7 @@ Classes:
 
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -38,3 +38,10 @@ class TimeclockEntry(Base):
     )
 
     __tablename__ = IDENTIFIER
+    __table_args__ = (
+        Index(
+            "ix_timeclock_badge_number_clock_in",
+            "badge_number",
+            "clock_in",
+        ),
+    )
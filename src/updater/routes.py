@@ -24,13 +24,20 @@ from src.updater.constants import (
     EXC_MSG_NOT_FROZEN,
     IDENTIFIER,
 )
-from src.updater.schemas import ReleaseInfo, UpdateStatus
+from src.updater.schemas import (
+    DownloadResult,
+    ReleaseInfo,
+    UpdateActionResult,
+    UpdateStatus,
+)
 from src.updater.service import (
+    UpdaterState,
     apply_update,
     check_for_update,
     download_update,
     get_backup_path,
     get_status,
+    get_updater_state,
     rollback,
 )
 
@@ -48,6 +55,7 @@ def _get_settings() -> Settings:
 )
 def check_for_updates(
     settings: Settings = Depends(_get_settings),
+    updater_state: UpdaterState = Depends(get_updater_state),
     caller_badge: str = Security(
         requires_permission, scopes=["system.update"]
     ),
@@ -57,6 +65,7 @@ def check_for_updates(
 
     Args:
         settings (Settings): Application settings.
+        updater_state (UpdaterState): Updater state to record the check in.
         caller_badge (str): Badge of the calling user.
 
     Returns:
@@ -69,7 +78,7 @@ def check_for_updates(
         status.HTTP_400_BAD_REQUEST,
     )
 
-    release_info = check_for_update(settings)
+    release_info = check_for_update(settings, updater_state)
     validate(
         release_info is not None,
         EXC_MSG_NO_UPDATE_AVAILABLE,
@@ -85,6 +94,7 @@ def check_for_updates(
     response_model=UpdateStatus,
 )
 def get_update_status(
+    updater_state: UpdaterState = Depends(get_updater_state),
     caller_badge: str = Security(
         requires_permission, scopes=["system.update"]
     ),
@@ -92,19 +102,24 @@ def get_update_status(
 ):
     """Get the current update status.
 
+    Args:
+        updater_state (UpdaterState): Updater state to report on.
+
     Returns:
         UpdateStatus: Current state of the updater.
 
     """
-    return get_status()
+    return get_status(updater_state)
 
 
 @router.post(
     "/download",
     status_code=status.HTTP_202_ACCEPTED,
+    response_model=DownloadResult,
 )
 def download_latest_update(
     settings: Settings = Depends(_get_settings),
+    updater_state: UpdaterState = Depends(get_updater_state),
     caller_badge: str = Security(
         requires_permission, scopes=["system.update"]
     ),
@@ -114,10 +129,11 @@ def download_latest_update(
 
     Args:
         settings (Settings): Application settings.
+        updater_state (UpdaterState): Updater state to track the download in.
         caller_badge (str): Badge of the calling user.
 
     Returns:
-        dict: Status message with download path.
+        DownloadResult: Status message with download path.
 
     """
     validate(
@@ -126,21 +142,21 @@ def download_latest_update(
         status.HTTP_400_BAD_REQUEST,
     )
 
-    current_status = get_status()
+    current_status = get_status(updater_state)
     validate(
         current_status.state != "downloading",
         EXC_MSG_DOWNLOAD_IN_PROGRESS,
         status.HTTP_409_CONFLICT,
     )
 
-    release_info = check_for_update(settings)
+    release_info = check_for_update(settings, updater_state)
     validate(
         release_info is not None,
         EXC_MSG_NO_UPDATE_AVAILABLE,
         status.HTTP_404_NOT_FOUND,
     )
 
-    file_path = download_update(release_info, settings)
+    file_path = download_update(release_info, settings, updater_state)
 
     return {
         "status": "downloaded",
@@ -152,8 +168,10 @@ def download_latest_update(
 @router.post(
     "/apply",
     status_code=status.HTTP_200_OK,
+    response_model=UpdateActionResult,
 )
 def apply_downloaded_update(
+    updater_state: UpdaterState = Depends(get_updater_state),
     caller_badge: str = Security(
         requires_permission, scopes=["system.update"]
     ),
@@ -165,10 +183,11 @@ def apply_downloaded_update(
     replaces the backend files and restarts the service.
 
     Args:
+        updater_state (UpdaterState): Updater state holding the download.
         caller_badge (str): Badge of the calling user.
 
     Returns:
-        dict: Status message.
+        UpdateActionResult: Status message.
 
     """
     validate(
@@ -177,14 +196,14 @@ def apply_downloaded_update(
         status.HTTP_400_BAD_REQUEST,
     )
 
-    current_status = get_status()
+    current_status = get_status(updater_state)
     validate(
         current_status.state == "ready" and current_status.downloaded_file,
         EXC_MSG_NO_DOWNLOAD_READY,
         status.HTTP_400_BAD_REQUEST,
     )
 
-    apply_update()
+    apply_update(updater_state)
 
     # Schedule graceful shutdown
     os.kill(os.getpid(), signal.SIGTERM)
@@ -198,6 +217,7 @@ def apply_downloaded_update(
 @router.post(
     "/rollback",
     status_code=status.HTTP_200_OK,
+    response_model=UpdateActionResult,
 )
 def rollback_update(
     caller_badge: str = Security(
@@ -211,7 +231,7 @@ def rollback_update(
         caller_badge (str): Badge of the calling user.
 
     Returns:
-        dict: Status message.
+        UpdateActionResult: Status message.
 
     """
     validate(
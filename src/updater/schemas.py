@@ -51,3 +51,31 @@ class UpdateStatus(BaseModel):
     state: str = "idle"
     error: str | None = None
     backup_available: bool = False
+
+
+class DownloadResult(BaseModel):
+    """Outcome of downloading an update.
+
+    Attributes:
+        status (str): Download status.
+        file (str): Path to the downloaded file.
+        version (str): Version that was downloaded.
+
+    """
+
+    status: str
+    file: str
+    version: str
+
+
+class UpdateActionResult(BaseModel):
+    """Outcome of applying or rolling back an update.
+
+    Attributes:
+        status (str): Action status.
+        message (str): Human-readable description of what happens next.
+
+    """
+
+    status: str
+    message: str
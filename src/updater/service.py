@@ -1,9 +1,12 @@
 """Module providing core update logic for TAP self-updates."""
 
+import atexit
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 
@@ -17,16 +20,60 @@ from src.updater.schemas import ReleaseInfo, UpdateStatus
 formatter = CustomFormatter("%(asctime)s")
 logger = get_logger(__name__, formatter)
 
-_state_lock = Lock()
-_state: dict = {
-    "latest_version": None,
-    "update_available": False,
-    "last_checked": None,
-    "download_progress": None,
-    "downloaded_file": None,
-    "state": "idle",
-    "error": None,
-}
+
+class UpdaterState:
+    """Mutable state of the updater, guarded by its own lock.
+
+    Attributes:
+        lock (Lock): Lock to hold while reading or changing the state.
+        latest_version (str | None): Latest version seen on GitHub.
+        update_available (bool): Whether a newer version exists.
+        last_checked (str | None): ISO timestamp of last check.
+        download_progress (float | None): Download progress 0-100.
+        downloaded_file (str | None): Path to downloaded file.
+        state (str): Current state of the updater.
+        error (str | None): Error message if state is error.
+        release_url (str | None): Releases URL the cached ETag belongs to.
+        release_etag (str | None): ETag of the last release response.
+        release_info (ReleaseInfo | None): Result of the last check,
+            reused when GitHub answers 304 Not Modified.
+
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.latest_version: str | None = None
+        self.update_available: bool = False
+        self.last_checked: str | None = None
+        self.download_progress: float | None = None
+        self.downloaded_file: str | None = None
+        self.state: str = "idle"
+        self.error: str | None = None
+        self.release_url: str | None = None
+        self.release_etag: str | None = None
+        self.release_info: ReleaseInfo | None = None
+
+
+_updater_state = UpdaterState()
+
+# Up to three numeric parts after an optional "v" prefix; any further
+# parts are accepted but ignored
+_VERSION_RE = re.compile(r"^v*(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:\.\d+)*$")
+
+# Shared client for GitHub API calls, so repeated update checks reuse the
+# pooled connection instead of a new TCP and TLS handshake each time
+_http_client = httpx.Client(timeout=30)
+atexit.register(_http_client.close)
+
+
+def get_updater_state() -> UpdaterState:
+    """Get the updater state shared by the running application.
+
+    Returns:
+        UpdaterState: The process-wide updater state.
+
+    """
+    return _updater_state
 
 
 def get_current_version() -> str:
@@ -41,6 +88,28 @@ def get_current_version() -> str:
     return app.version
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> tuple[int, int, int]:
+    """Parse a semver string into a (major, minor, patch) tuple.
+
+    Args:
+        version (str): Version string, optionally "v"-prefixed.
+
+    Returns:
+        tuple[int, int, int]: Version parts, missing parts padded with 0.
+
+    Raises:
+        ValueError: If the string is not a dotted numeric version.
+
+    """
+    match = _VERSION_RE.match(version)
+    if not match:
+        raise ValueError(f"Invalid version string: {version!r}")
+    major, minor, patch = match.groups(default="0")
+    return int(major), int(minor), int(patch)
+
+
+@lru_cache(maxsize=256)
 def compare_versions(current: str, latest: str) -> int:
     """Compare two semver version strings.
 
@@ -52,35 +121,21 @@ def compare_versions(current: str, latest: str) -> int:
         int: -1 if current < latest, 0 if equal, 1 if current > latest.
 
     """
-    def parse(v: str) -> list[int]:
-        clean = v.lstrip("v")
-        parts = clean.split(".")
-        return [int(p) for p in parts[:3]]
-
-    current_parts = parse(current)
-    latest_parts = parse(latest)
-
-    # Pad to 3 parts
-    while len(current_parts) < 3:
-        current_parts.append(0)
-    while len(latest_parts) < 3:
-        latest_parts.append(0)
-
-    for c, l in zip(current_parts, latest_parts):
-        if c < l:
-            return -1
-        if c > l:
-            return 1
-    return 0
+    current_parts = _parse_version(current)
+    latest_parts = _parse_version(latest)
+    return (current_parts > latest_parts) - (current_parts < latest_parts)
 
 
 def check_for_update(
     settings: Settings,
+    updater_state: UpdaterState | None = None,
 ) -> ReleaseInfo | None:
     """Check GitHub Releases for a newer version.
 
     Args:
         settings (Settings): Application settings with GITHUB_REPO.
+        updater_state (UpdaterState | None): State to record the check
+            in. Defaults to the application's updater state.
 
     Returns:
         ReleaseInfo | None: Release info if update available,
@@ -93,9 +148,10 @@ def check_for_update(
     if not settings.GITHUB_REPO:
         raise ValueError("GITHUB_REPO is not configured")
 
-    with _state_lock:
-        _state["state"] = "checking"
-        _state["error"] = None
+    updater_state = updater_state or get_updater_state()
+    with updater_state.lock:
+        updater_state.state = "checking"
+        updater_state.error = None
 
     try:
         headers = {"Accept": "application/vnd.github+json"}
@@ -107,9 +163,32 @@ def check_for_update(
             f"{settings.GITHUB_REPO}/releases/latest"
         )
 
-        response = httpx.get(url, headers=headers, timeout=30)
+        with updater_state.lock:
+            etag = (
+                updater_state.release_etag
+                if updater_state.release_url == url
+                else None
+            )
+        if etag:
+            headers["If-None-Match"] = etag
+
+        response = _http_client.get(url, headers=headers)
+
+        # Unchanged release: reuse the last result without re-parsing.
+        # Conditional requests answered with 304 also do not count
+        # against the GitHub rate limit.
+        if etag and response.status_code == 304:
+            now = datetime.now(timezone.utc).isoformat()
+            with updater_state.lock:
+                updater_state.last_checked = now
+                updater_state.state = "idle"
+                return updater_state.release_info
+
         response.raise_for_status()
         data = response.json()
+        # Only cached together with a result, so a release that fails to
+        # parse is fetched in full again on the next check
+        release_etag = response.headers.get("ETag")
 
         tag_name = data.get("tag_name", "")
         version = tag_name.lstrip("v")
@@ -125,23 +204,29 @@ def check_for_update(
 
         now = datetime.now(timezone.utc).isoformat()
 
-        with _state_lock:
-            _state["last_checked"] = now
-            _state["state"] = "idle"
+        with updater_state.lock:
+            updater_state.last_checked = now
+            updater_state.state = "idle"
 
         if not zip_asset:
             logger.warning(
                 f"No TAP-*.zip asset found in release {tag_name}"
             )
-            with _state_lock:
-                _state["update_available"] = False
-                _state["latest_version"] = version
+            with updater_state.lock:
+                updater_state.update_available = False
+                updater_state.latest_version = version
+                updater_state.release_url = url
+                updater_state.release_etag = release_etag
+                updater_state.release_info = None
             return None
 
         if compare_versions(current, version) >= 0:
-            with _state_lock:
-                _state["update_available"] = False
-                _state["latest_version"] = version
+            with updater_state.lock:
+                updater_state.update_available = False
+                updater_state.latest_version = version
+                updater_state.release_url = url
+                updater_state.release_etag = release_etag
+                updater_state.release_info = None
             return None
 
         release_info = ReleaseInfo(
@@ -154,9 +239,12 @@ def check_for_update(
             asset_size=zip_asset["size"],
         )
 
-        with _state_lock:
-            _state["update_available"] = True
-            _state["latest_version"] = version
+        with updater_state.lock:
+            updater_state.update_available = True
+            updater_state.latest_version = version
+            updater_state.release_url = url
+            updater_state.release_etag = release_etag
+            updater_state.release_info = release_info
 
         logger.info(
             f"Update available: {current} -> {version}"
@@ -165,21 +253,25 @@ def check_for_update(
 
     except Exception as e:
         logger.error(f"Failed to check for updates: {e}")
-        with _state_lock:
-            _state["state"] = "error"
-            _state["error"] = str(e)
+        with updater_state.lock:
+            updater_state.state = "error"
+            updater_state.release_etag = None
+            updater_state.error = str(e)
         raise
 
 
 def download_update(
     release_info: ReleaseInfo,
     settings: Settings,
+    updater_state: UpdaterState | None = None,
 ) -> str:
     """Download an update asset from GitHub.
 
     Args:
         release_info (ReleaseInfo): Release info with download URL.
         settings (Settings): Application settings.
+        updater_state (UpdaterState | None): State to track the download
+            in. Defaults to the application's updater state.
 
     Returns:
         str: Path to the downloaded file.
@@ -188,12 +280,13 @@ def download_update(
         RuntimeError: If a download is already in progress.
 
     """
-    with _state_lock:
-        if _state["state"] == "downloading":
+    updater_state = updater_state or get_updater_state()
+    with updater_state.lock:
+        if updater_state.state == "downloading":
             raise RuntimeError("Download already in progress")
-        _state["state"] = "downloading"
-        _state["download_progress"] = 0.0
-        _state["error"] = None
+        updater_state.state = "downloading"
+        updater_state.download_progress = 0.0
+        updater_state.error = None
 
     try:
         # Determine download directory
@@ -226,16 +319,16 @@ def download_update(
                     downloaded += len(chunk)
                     if total > 0:
                         progress = (downloaded / total) * 100
-                        with _state_lock:
-                            _state["download_progress"] = round(
+                        with updater_state.lock:
+                            updater_state.download_progress = round(
                                 progress, 1
                             )
 
         file_path = str(download_path)
-        with _state_lock:
-            _state["state"] = "ready"
-            _state["download_progress"] = 100.0
-            _state["downloaded_file"] = file_path
+        with updater_state.lock:
+            updater_state.state = "ready"
+            updater_state.download_progress = 100.0
+            updater_state.downloaded_file = file_path
 
         logger.info(
             f"Update downloaded: {release_info.asset_name}"
@@ -244,10 +337,10 @@ def download_update(
 
     except Exception as e:
         logger.error(f"Download failed: {e}")
-        with _state_lock:
-            _state["state"] = "error"
-            _state["error"] = str(e)
-            _state["download_progress"] = None
+        with updater_state.lock:
+            updater_state.state = "error"
+            updater_state.error = str(e)
+            updater_state.download_progress = None
         raise
 
 
@@ -285,12 +378,16 @@ def get_backup_path() -> Path | None:
     return backups[0] if backups else None
 
 
-def apply_update() -> None:
+def apply_update(updater_state: UpdaterState | None = None) -> None:
     """Apply a downloaded update by launching the helper script.
 
     The helper script waits for the current process to exit, then
     replaces the backend files and restarts the service.
 
+    Args:
+        updater_state (UpdaterState | None): State holding the downloaded
+            update. Defaults to the application's updater state.
+
     Raises:
         RuntimeError: If not running as frozen exe or no download ready.
         FileNotFoundError: If the apply script is missing.
@@ -301,17 +398,18 @@ def apply_update() -> None:
             "Updates can only be applied to packaged deployments"
         )
 
-    with _state_lock:
-        downloaded = _state.get("downloaded_file")
-        if not downloaded or _state["state"] != "ready":
+    updater_state = updater_state or get_updater_state()
+    with updater_state.lock:
+        downloaded = updater_state.downloaded_file
+        if not downloaded or updater_state.state != "ready":
             raise RuntimeError("No downloaded update ready to apply")
-        _state["state"] = "applying"
+        updater_state.state = "applying"
 
     script_path = get_apply_script_path()
     if not script_path.exists():
-        with _state_lock:
-            _state["state"] = "error"
-            _state["error"] = "apply-update.ps1 not found"
+        with updater_state.lock:
+            updater_state.state = "error"
+            updater_state.error = "apply-update.ps1 not found"
         raise FileNotFoundError(
             f"Apply script not found: {script_path}"
         )
@@ -395,34 +493,28 @@ def rollback() -> None:
     )
 
 
-def get_status() -> UpdateStatus:
+def get_status(updater_state: UpdaterState | None = None) -> UpdateStatus:
     """Get the current update status.
 
+    Args:
+        updater_state (UpdaterState | None): State to report on. Defaults
+            to the application's updater state.
+
     Returns:
         UpdateStatus: Current state of the updater.
 
     """
-    with _state_lock:
+    updater_state = updater_state or get_updater_state()
+    with updater_state.lock:
         return UpdateStatus(
             current_version=get_current_version(),
-            latest_version=_state["latest_version"],
-            update_available=_state["update_available"],
-            last_checked=_state["last_checked"],
-            download_progress=_state["download_progress"],
-            downloaded_file=_state["downloaded_file"],
-            state=_state["state"],
-            error=_state["error"],
+            latest_version=updater_state.latest_version,
+            update_available=updater_state.update_available,
+            last_checked=updater_state.last_checked,
+            download_progress=updater_state.download_progress,
+            downloaded_file=updater_state.downloaded_file,
+            state=updater_state.state,
+            error=updater_state.error,
             backup_available=get_backup_path() is not None,
         )
 
-
-def reset_state() -> None:
-    """Reset the updater state to idle. Used for testing."""
-    with _state_lock:
-        _state["latest_version"] = None
-        _state["update_available"] = False
-        _state["last_checked"] = None
-        _state["download_progress"] = None
-        _state["downloaded_file"] = None
-        _state["state"] = "idle"
-        _state["error"] = None
@@ -19,7 +19,6 @@ from src.database import get_db
 from src.config import settings
 import src.services as services
 from src.services import (
-    algorithm,
     create_event_log,
     generate_access_token,
     generate_refresh_token,
@@ -216,8 +215,9 @@ def update_user_password(
     is_self_update = caller_badge == badge_number
     caller_user = get_user_by_badge_number_from_db(caller_badge, db)
     has_admin_permission = any(
-        "user.update" in [perm.resource for perm in role.permissions]
+        perm.resource == "user.update"
         for role in caller_user.auth_roles
+        for perm in role.permissions
     )
 
     # If user is changing their own password, verify current password
@@ -362,9 +362,7 @@ def refresh_token(
     )
 
     try:
-        payload = jwt.decode(
-            refresh_token, services.verifying_bytes, algorithms=[algorithm]
-        )
+        payload = services.verify_jwt_token(refresh_token)
         badge_number = payload.get("badge_number")
         validate(
             badge_number,
@@ -1,12 +1,31 @@
+import contextlib
+import functools
+import io
+import os
 import random
-from datetime import date
+import secrets
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import MappingProxyType
 
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import and_, create_engine, delete, event, select
 from sqlalchemy.orm import Session, sessionmaker
 
-from src import services
+# Must be set before `src` is imported: in development mode importing the app
+# wipes and reseeds the dev database, which every xdist worker would then do
+# concurrently. Tests use their own database, so skip it.
+os.environ.setdefault("ENVIRONMENT", "test")
+# Production-strength bcrypt dominates the run time of every test that
+# creates a user or logs in; 4 is the lowest cost bcrypt accepts.
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+
+from src import services  # noqa: E402
 from src.auth_role.constants import BASE_URL as AUTH_ROLE_URL
 from src.auth_role.models import (
     AuthRole,
@@ -18,8 +37,14 @@ from src.database import Base, get_db
 from src.department.constants import BASE_URL as DEPARTMENT_URL
 from src.employee.constants import BASE_URL as EMPLOYEE_URL
 from src.employee.models import Employee
+from src.employee.repository import (
+    create_employee as create_employee_in_db,
+)
+from src.employee.schemas import EmployeeBase, EmployeeExtended
 from src.event_log.constants import BASE_URL as EVENT_LOG_URL
 from src.holiday_group.constants import BASE_URL as HOLIDAY_GROUP_URL
+import src.license.key_generator as key_gen_module
+from src.license.repository import create_license, deactivate_all_licenses
 from tools.license_generator import (
     generate_key_pair,
     generate_license_key as _generate_license_key,
@@ -28,20 +53,89 @@ from src.config import settings
 from src.main import app
 from src.org_unit.constants import BASE_URL as ORG_UNIT_URL
 from src.org_unit.models import OrgUnit
+from src.org_unit.repository import (
+    create_org_unit as create_org_unit_in_db,
+)
+from src.org_unit.schemas import OrgUnitBase, OrgUnitExtended
+from src.services import set_license_activated
 from src.timeclock.constants import BASE_URL as TIMECLOCK_URL
+from src.timeclock.models import TimeclockEntry
+from src.updater.service import UpdaterState, get_updater_state
 from src.user.constants import BASE_URL as USER_URL
 from src.user.models import User
+from src.user.schemas import UserResponse
 
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "no_rollback: commit for real instead of rolling back after the test",
+    )
+
+
+# A single client (and transport) is shared by every test module. TestClient
+# is already an httpx.Client, and httpx.ASGITransport only supports async
+# clients, so the sync suite keeps TestClient; see `async_client` otherwise.
 test_app = TestClient(app)
 settings.ENVIRONMENT = "test"
 
-TEST_DATABASE_URL = "sqlite:///tap_test.sqlite"
-engine = create_engine(TEST_DATABASE_URL)
+# Each pytest-xdist worker gets its own database file so modules running in
+# parallel never share (or drop) each other's tables.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DATABASE_URL = (
+    f"sqlite:///tap_test_{XDIST_WORKER}.sqlite"
+    if XDIST_WORKER
+    else "sqlite:///tap_test.sqlite"
+)
+engine = create_engine(
+    TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+)
 TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
 
 
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+def enable_savepoints(sqlite_engine) -> None:
+    """Let sessions on a SQLite engine join an outer transaction.
+
+    pysqlite manages transactions itself and breaks SAVEPOINT semantics, so
+    the engine takes over BEGIN instead. Needed for sessions created with
+    `join_transaction_mode="create_savepoint"`.
+
+    Args:
+        sqlite_engine (Engine): Engine to register the listeners on.
+    """
+    event.listen(sqlite_engine, "connect", _disable_pysqlite_transactions)
+    event.listen(sqlite_engine, "begin", _emit_begin)
+
+
+# Engine for per-test rollbacks. The default `engine` keeps pysqlite's
+# behaviour, which lets concurrent writers wait on each other instead of
+# deadlocking.
+rollback_engine = create_engine(
+    TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+)
+enable_savepoints(rollback_engine)
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(rollback_engine, "connect")
+def _skip_fsync(dbapi_connection, connection_record):
+    # The test database is rebuilt every session, so durability is not needed
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.close()
+
+
 def override_get_db():
     try:
         session = TestingSessionLocal()
@@ -91,16 +185,70 @@ def generate_unique_string(existing_names: list, length: int) -> str:
     return name
 
 
-@pytest.fixture
-def auth_role_data() -> dict:
-    return {
-        "name": generate_unique_string(chosen_auth_role_names, 10),
-        "permissions": [
+# Read-only templates for the constant parts of each payload. Builders
+# copy them so tests can freely mutate the dicts they receive.
+AUTH_ROLE_TEMPLATE = MappingProxyType(
+    {
+        "permissions": (
             {"resource": "employee.read"},
             {"resource": "event_log.create"},
             {"resource": "event_log.read"},
-        ],
+        ),
     }
+)
+EMPLOYEE_TEMPLATE = MappingProxyType(
+    {
+        "payroll_type": "hourly",
+        "workweek_type": "standard",
+        "time_type": True,
+        "allow_clocking": True,
+        "external_clock_allowed": True,
+        "allow_delete": True,
+        "org_unit_id": 1,
+        "manager_id": None,
+        "holiday_group_id": None,
+    }
+)
+USER_TEMPLATE = MappingProxyType({"badge_number": None})
+# Every test user shares one password so `create_user_direct` only has to
+# run bcrypt for it once per session.
+TEST_USER_PASSWORD = "password"
+
+
+def from_template(template: MappingProxyType, **fields) -> dict:
+    """Build a mutable payload from a read-only template.
+
+    Args:
+        template (MappingProxyType): Constant payload fields.
+        **fields: Per-call fields, such as unique names, to add.
+
+    Returns:
+        dict: A shallow copy of the template merged with the given fields.
+            Nested values are shared with the template, so builders must
+            copy any they hand out for mutation.
+    """
+    return {**template, **fields}
+
+
+def new_auth_role_data() -> dict:
+    """Build a fresh auth role payload with a unique name.
+
+    Returns:
+        dict: Auth role payload with read-only permissions.
+    """
+    auth_role_data = from_template(
+        AUTH_ROLE_TEMPLATE,
+        name=generate_unique_string(chosen_auth_role_names, 10),
+    )
+    auth_role_data["permissions"] = [
+        dict(permission) for permission in auth_role_data["permissions"]
+    ]
+    return auth_role_data
+
+
+@pytest.fixture
+def auth_role_data() -> dict:
+    return new_auth_role_data()
 
 
 def create_auth_role(auth_role_data: dict, test_client: TestClient) -> dict:
@@ -128,29 +276,54 @@ def create_department_membership(
     test_client.post(f"{DEPARTMENT_URL}/{department_id}/employees/{user_id}")
 
 
+def new_employee_data() -> dict:
+    """Build a fresh employee payload with a unique badge number.
+
+    Returns:
+        dict: Employee payload assigned to the default org unit.
+    """
+    return from_template(
+        EMPLOYEE_TEMPLATE,
+        badge_number=generate_unique_string(chosen_badge_numbers, 10),
+        first_name=random_string(10),
+        last_name=random_string(10),
+        payroll_sync=date.today().isoformat(),
+    )
+
+
 @pytest.fixture
 def employee_data() -> dict:
-    return {
-        "badge_number": generate_unique_string(chosen_badge_numbers, 10),
-        "first_name": random_string(10),
-        "last_name": random_string(10),
-        "payroll_type": "hourly",
-        "payroll_sync": date.today().isoformat(),
-        "workweek_type": "standard",
-        "time_type": True,
-        "allow_clocking": True,
-        "external_clock_allowed": True,
-        "allow_delete": True,
-        "org_unit_id": 1,
-        "manager_id": None,
-        "holiday_group_id": None,
-    }
+    return new_employee_data()
 
 
 def create_employee(employee_data: dict, test_client: TestClient) -> dict:
     return test_client.post(EMPLOYEE_URL, json=employee_data).json()
 
 
+def create_employee_direct(employee_data: dict) -> dict:
+    """Insert an employee through the repository, skipping the HTTP stack.
+
+    For setup only; tests of the employee endpoints should use
+    `create_employee`.
+
+    Args:
+        employee_data (dict): Employee payload.
+
+    Returns:
+        dict: The created employee, shaped like the API response.
+    """
+    test_session = TestingSessionLocal()
+    try:
+        employee = create_employee_in_db(
+            EmployeeBase(**employee_data), test_session
+        )
+        return EmployeeExtended.model_validate(
+            employee, from_attributes=True
+        ).model_dump(mode="json")
+    finally:
+        test_session.close()
+
+
 @pytest.fixture
 def event_log_data() -> dict:
     return {
@@ -189,31 +362,186 @@ def create_holiday_group(
     return test_client.post(HOLIDAY_GROUP_URL, json=holiday_group_data).json()
 
 
+def new_org_unit_data() -> dict:
+    """Build a fresh org unit payload with a unique name.
+
+    Returns:
+        dict: Org unit payload.
+    """
+    return {"name": generate_unique_string(chosen_org_unit_names, 10)}
+
+
 @pytest.fixture
 def org_unit_data() -> dict:
-    return {"name": generate_unique_string(chosen_org_unit_names, 10)}
+    return new_org_unit_data()
 
 
 def create_org_unit(org_unit_data: dict, test_client: TestClient) -> dict:
     return test_client.post(ORG_UNIT_URL, json=org_unit_data).json()
 
 
+def create_org_unit_direct(org_unit_data: dict) -> dict:
+    """Insert an org unit through the repository, skipping the HTTP stack.
+
+    For setup only; tests of the org unit endpoints should use
+    `create_org_unit`.
+
+    Args:
+        org_unit_data (dict): Org unit payload.
+
+    Returns:
+        dict: The created org unit, shaped like the API response.
+    """
+    test_session = TestingSessionLocal()
+    try:
+        org_unit = create_org_unit_in_db(
+            OrgUnitBase(**org_unit_data), test_session
+        )
+        return OrgUnitExtended.model_validate(
+            org_unit, from_attributes=True
+        ).model_dump(mode="json")
+    finally:
+        test_session.close()
+
+
+@pytest.fixture
+def employee_with_org(
+    employee_data: dict, org_unit_data: dict, test_client: TestClient
+) -> dict:
+    """Employee created in a fresh org unit of its own."""
+    org_unit = create_org_unit_direct(org_unit_data)
+    employee_data["org_unit_id"] = org_unit["id"]
+    return create_employee_direct(employee_data)
+
+
+@pytest.fixture
+def disallowed_employee(
+    employee_data: dict, org_unit_data: dict, test_client: TestClient
+) -> dict:
+    """Employee in a fresh org unit who is not allowed to clock in."""
+    org_unit = create_org_unit_direct(org_unit_data)
+    employee_data["org_unit_id"] = org_unit["id"]
+    employee_data["allow_clocking"] = False
+    return create_employee_direct(employee_data)
+
+
 def clock_employee(badge_number: str, test_client: TestClient) -> dict:
     return test_client.post(f"{TIMECLOCK_URL}/{badge_number}").json()
 
 
+def seed_clock_pair(
+    badge_number: str,
+    clock_in: datetime | None = None,
+    clock_out: datetime | None = None,
+) -> int:
+    """Insert a completed timeclock entry directly into the test database.
+
+    Use this when a test only needs a finished clock in/out pair to exist;
+    tests of the clocking endpoints themselves should keep using
+    `clock_employee`.
+
+    Args:
+        badge_number (str): Badge number of the employee to clock.
+        clock_in (datetime): Clock-in timestamp. Defaults to now (UTC).
+        clock_out (datetime): Clock-out timestamp. Defaults to clock_in.
+
+    Returns:
+        int: ID of the inserted timeclock entry.
+    """
+    clock_in = clock_in or datetime.now(timezone.utc)
+    entry = TimeclockEntry(
+        badge_number=badge_number,
+        clock_in=clock_in,
+        clock_out=clock_out or clock_in,
+    )
+    test_session = TestingSessionLocal()
+    try:
+        test_session.add(entry)
+        test_session.commit()
+        return entry.id
+    finally:
+        test_session.close()
+
+
+@pytest.fixture(scope="module")
+def clocked_employee(test_client: TestClient) -> dict:
+    """Employee with one completed clock in/out pair for today.
+
+    Module-scoped so read-only report tests share a single setup instead
+    of creating an org unit, employee and two punches per test.
+    """
+    org_unit = create_org_unit_direct(new_org_unit_data())
+    employee_data = new_employee_data()
+    employee_data["org_unit_id"] = org_unit["id"]
+    employee = create_employee_direct(employee_data)
+    seed_clock_pair(employee["badge_number"])
+
+    return employee
+
+
+def new_user_data() -> dict:
+    """Build a fresh user payload with the shared test password.
+
+    Returns:
+        dict: User payload without a badge number assigned.
+    """
+    return from_template(USER_TEMPLATE, password=TEST_USER_PASSWORD)
+
+
 @pytest.fixture
 def user_data() -> dict:
-    return {
-        "badge_number": None,
-        "password": random_string(10),
-    }
+    return new_user_data()
 
 
 def create_user(user_data: dict, test_client: TestClient) -> dict:
     return test_client.post(USER_URL, json=user_data).json()
 
 
+@functools.cache
+def _hash_password(password: str) -> str:
+    return services.hash_password(password)
+
+
+def create_user_direct(user_data: dict) -> dict:
+    """Insert a user through the ORM, skipping the HTTP stack.
+
+    Reuses the session-wide hash of the password instead of running bcrypt
+    per user. For setup only; tests of the user endpoints should use
+    `create_user`.
+
+    Args:
+        user_data (dict): User payload.
+
+    Returns:
+        dict: The created user, shaped like the API response.
+    """
+    test_session = TestingSessionLocal()
+    try:
+        user = User(
+            badge_number=user_data["badge_number"],
+            password=_hash_password(user_data["password"]),
+        )
+        test_session.add(user)
+        test_session.commit()
+        test_session.refresh(user)
+        return UserResponse.model_validate(
+            user, from_attributes=True
+        ).model_dump(mode="json")
+    finally:
+        test_session.close()
+
+
+@pytest.fixture
+def seeded_user(employee_with_org: dict, user_data: dict) -> dict:
+    """User account for an employee in a fresh org unit.
+
+    `user_data` gets the employee's badge number, so tests can log in
+    with it as the new user.
+    """
+    user_data["badge_number"] = employee_with_org["badge_number"]
+    return create_user_direct(user_data)
+
+
 def login_user(user_data: dict, test_client: TestClient) -> dict:
     test_client.cookies.clear()
     test_client.headers.clear()
@@ -227,6 +555,141 @@ def login_user(user_data: dict, test_client: TestClient) -> dict:
     )
 
 
+def login_user_fast(
+    badge_number: str, test_client: TestClient, scopes: list[str] = None
+) -> None:
+    """Authenticate `test_client` with tokens minted in-process.
+
+    Skips the login endpoint and its password check, for tests that only
+    need to be logged in as a user. Tests of login itself should use
+    `login_user`.
+
+    Args:
+        badge_number (str): Badge number of the user to act as.
+        test_client (TestClient): Client to authenticate.
+        scopes (list[str]): Scopes to grant. Defaults to none.
+    """
+    now = datetime.now(timezone.utc)
+    access_token = services.encode_jwt_token(
+        badge_number,
+        now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRY_MINUTES),
+        scopes,
+    )
+    refresh_token = services.encode_jwt_token(
+        badge_number,
+        now + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRY_MINUTES),
+        scopes,
+    )
+    test_client.cookies.clear()
+    test_client.headers.clear()
+    test_client.cookies["refresh_token"] = refresh_token
+    test_client.headers.update({"Authorization": f"Bearer {access_token}"})
+
+
+STUB_PDF = b"%PDF-1.4\n%%EOF"
+
+
+@pytest.fixture
+def pdf_fast(monkeypatch):
+    """Replace the ReportLab renderer with a stub PDF for HTTP-level tests."""
+    monkeypatch.setattr(
+        "src.report.routes.generate_pdf_report",
+        lambda *args, **kwargs: io.BytesIO(STUB_PDF),
+    )
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_client(test_client: TestClient):
+    """Async client sharing the app and auth headers of `test_client`.
+
+    Lets tests `asyncio.gather` setup requests that do not depend on each
+    other. Tests using it must be marked with `pytest.mark.anyio`.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url=str(test_client.base_url),
+        headers=test_client.headers,
+        follow_redirects=test_client.follow_redirects,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def limited_user_token(test_client: TestClient, request) -> str:
+    """Log in once per module as a user with only two read permissions.
+
+    The user holds employee.read and event_log.read and nothing else. The
+    user, its employee and its auth role are created a single time and the
+    resulting access token is reused by every test that needs it.
+    """
+    org_unit = create_org_unit_direct(new_org_unit_data())
+    employee_data = new_employee_data()
+    employee_data["org_unit_id"] = org_unit["id"]
+    employee = create_employee_direct(employee_data)
+    user_data = new_user_data()
+    user_data["badge_number"] = employee["badge_number"]
+    user = create_user_direct(user_data)
+
+    auth_role_data = new_auth_role_data()
+    auth_role_data["permissions"] = [
+        {"resource": "employee.read"},
+        {"resource": "event_log.read"},
+    ]
+    auth_role = create_auth_role(auth_role_data, test_client)
+    create_auth_role_membership(auth_role["id"], user["id"], test_client)
+
+    login_user(user_data, test_client)
+    token = test_client.headers["Authorization"]
+
+    # Log back in as the default admin for the rest of the module setup
+    test_client.cookies.clear()
+    test_client.headers.update(
+        {
+            "Authorization": (
+                f"Bearer {_module_auth_token[request.module.__name__]}"
+            )
+        }
+    )
+    return token
+
+
+@pytest.fixture
+def limited_user_client(
+    limited_user_token: str, test_client: TestClient
+) -> TestClient:
+    """Test client authenticated as the user from `limited_user_token`.
+
+    For tests that only need to be logged in without some permission. The
+    default admin token is restored after the test by `restore_auth`.
+    """
+    test_client.headers.update({"Authorization": limited_user_token})
+    return test_client
+
+
+@contextlib.contextmanager
+def no_auth(test_client: TestClient):
+    """Temporarily send requests from `test_client` without credentials.
+
+    The original headers are restored even if the body raises, so a failed
+    assertion cannot leave the shared client unauthenticated.
+
+    Args:
+        test_client (TestClient): The client to strip headers from.
+    """
+    saved_headers = test_client.headers.copy()
+    test_client.headers.clear()
+    try:
+        yield test_client
+    finally:
+        test_client.headers.clear()
+        test_client.headers.update(saved_headers)
+
+
 def create_root_user():
     test_session = TestingSessionLocal()
 
@@ -284,7 +747,7 @@ def create_root_user():
     test_session.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_client():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
@@ -294,6 +757,94 @@ def test_client():
     yield test_app
 
 
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """Undo per-test changes to process-wide app state.
+
+    The client and app are shared by the whole session, so dependency
+    overrides added by a test are dropped, and each test gets its own
+    updater state.
+    """
+    saved_overrides = dict(app.dependency_overrides)
+    updater_state = UpdaterState()
+    app.dependency_overrides[get_updater_state] = lambda: updater_state
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved_overrides)
+
+
+def snapshot_primary_keys() -> dict:
+    """Record the primary keys of every row currently in the test database.
+
+    Returns:
+        dict: Set of primary key tuples per table.
+    """
+    with engine.connect() as connection:
+        return {
+            table: {
+                tuple(row)
+                for row in connection.execute(
+                    select(*table.primary_key.columns)
+                )
+            }
+            for table in Base.metadata.sorted_tables
+        }
+
+
+def delete_rows_since(snapshot: dict) -> None:
+    """Delete every row added to the test database since `snapshot`.
+
+    Tables are cleared children first so foreign keys stay satisfied.
+
+    Args:
+        snapshot (dict): Primary keys from `snapshot_primary_keys`.
+    """
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            columns = list(table.primary_key.columns)
+            for row in connection.execute(select(*columns)).all():
+                if tuple(row) in snapshot[table]:
+                    continue
+                connection.execute(
+                    delete(table).where(
+                        and_(*(c == v for c, v in zip(columns, row)))
+                    )
+                )
+
+
+@pytest.fixture(autouse=True)
+def transactional_db(test_client: TestClient, request):
+    """Run each test inside a transaction that is rolled back afterwards.
+
+    Every session created from `TestingSessionLocal` during the test (those
+    of the app's requests included) joins one outer transaction through a
+    SAVEPOINT, so request-level commits are discarded on teardown and the
+    schema only has to be built once per session. Tests that need genuinely
+    separate, concurrent transactions opt out with `no_rollback`; the rows
+    they commit are deleted again afterwards.
+    """
+    if request.node.get_closest_marker("no_rollback"):
+        snapshot = snapshot_primary_keys()
+        try:
+            yield
+        finally:
+            delete_rows_since(snapshot)
+        return
+
+    session_kw = dict(TestingSessionLocal.kw)
+    connection = rollback_engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal.configure(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    try:
+        yield
+    finally:
+        TestingSessionLocal.kw = session_kw
+        transaction.rollback()
+        connection.close()
+
+
 # Cache the root user auth token per module to avoid repeated logins
 _module_auth_token = {}
 
@@ -305,9 +856,6 @@ def setup_test_module(test_client: TestClient, request):
     This fixture runs once per test module to reduce overhead from
     repeated login and license activation/deactivation operations.
     """
-    from src.license.repository import create_license, deactivate_all_licenses
-    from src.services import set_license_activated
-
     module_name = request.module.__name__
 
     # Login once per module and cache the token
@@ -365,9 +913,6 @@ def restore_auth(test_client: TestClient, request):
 
 # Generate a test key pair once for the entire test session
 # generate_key_pair returns file paths, so we need to read the key content
-import tempfile
-from pathlib import Path
-
 _test_keys_dir = Path(tempfile.mkdtemp())
 _test_private_key_path, _test_public_key_path = generate_key_pair(_test_keys_dir)
 _test_private_key = _test_private_key_path.read_bytes()
@@ -377,7 +922,6 @@ _test_public_key = _test_public_key_path.read_bytes()
 _test_signatures = {}
 
 # Patch the PUBLIC_KEY_PEM in the key_generator module to use test public key
-import src.license.key_generator as key_gen_module
 key_gen_module.PUBLIC_KEY_PEM = _test_public_key
 
 
@@ -389,10 +933,6 @@ def generate_test_license_key() -> str:
     Returns:
         str: Hex-encoded Ed25519 signature (128 characters).
     """
-    import secrets
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-    from cryptography.hazmat.primitives import serialization
-
     # Generate a unique message for each license key
     random_message = secrets.token_bytes(32)
 
@@ -14,9 +14,9 @@ from tests.conftest import (
     chosen_auth_role_names,
     create_auth_role,
     create_auth_role_membership,
-    create_employee,
-    create_org_unit,
-    create_user,
+    create_employee_direct,
+    create_org_unit_direct,
+    create_user_direct,
     random_string,
 )
 
@@ -27,10 +27,11 @@ def test_create_auth_role_201(
 ):
     response = test_client.post(url=BASE_URL, json=auth_role_data)
 
-    auth_role_data["id"] = response.json()["id"]
+    data = response.json()
+    auth_role_data["id"] = data["id"]
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == auth_role_data
+    assert data == auth_role_data
 
 
 def test_create_auth_role_400_invalid_resource(
@@ -62,11 +63,11 @@ def test_give_user_auth_role_201(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
 
     response = test_client.post(
@@ -98,11 +99,11 @@ def test_give_user_auth_role_409_user_already_has_auth_role(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -166,11 +167,11 @@ def test_get_users_by_auth_role_200_nonempty_list(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -307,11 +308,11 @@ def test_delete_auth_role_by_id_409_users_assigned(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -328,11 +329,11 @@ def test_remove_auth_role_from_user_200(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -365,11 +366,11 @@ def test_remove_auth_role_from_user_404_user_not_member(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
 
     response = test_client.delete(
@@ -13,8 +13,8 @@ from tests.conftest import (
     chosen_department_names,
     create_department,
     create_department_membership,
-    create_employee,
-    create_org_unit,
+    create_employee_direct,
+    create_org_unit_direct,
     random_string,
 )
 
@@ -25,10 +25,11 @@ def test_create_department_201(
 ):
     response = test_client.post(BASE_URL, json=department_data)
 
-    department_data["id"] = response.json()["id"]
+    data = response.json()
+    department_data["id"] = data["id"]
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == department_data
+    assert data == department_data
 
 
 def test_create_department_409_name_already_exists(
@@ -49,9 +50,9 @@ def test_add_employee_to_department_201(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
 
     response = test_client.post(
@@ -83,9 +84,9 @@ def test_add_employee_to_department_409_employee_already_member(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
     create_department_membership(department["id"], employee["id"], test_client)
 
@@ -150,9 +151,9 @@ def test_get_employees_by_department_200_nonempty_list(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
     create_department_membership(department["id"], employee["id"], test_client)
     employee["departments"] = [department]
@@ -160,8 +161,9 @@ def test_get_employees_by_department_200_nonempty_list(
     response = test_client.get(f"{BASE_URL}/{department["id"]}/employees")
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.json()) == 1
-    assert response.json() == [employee]
+    data = response.json()
+    assert len(data) == 1
+    assert data == [employee]
 
 
 def test_get_employees_by_department_404_department_not_found(
@@ -263,9 +265,9 @@ def test_delete_department_by_id_409_employees_assigned(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
     create_department_membership(department["id"], employee["id"], test_client)
 
@@ -281,9 +283,9 @@ def test_remove_employee_from_department_200(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
     create_department_membership(department["id"], employee["id"], test_client)
 
@@ -315,9 +317,9 @@ def test_remove_employee_from_department_404_employee_not_member(
     org_unit_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     department = create_department(department_data, test_client)
 
     response = test_client.delete(
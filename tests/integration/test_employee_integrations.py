@@ -12,7 +12,7 @@ from tests.conftest import (
     create_employee,
     create_holiday_group,
     create_org_unit,
-    create_user,
+    create_user_direct,
     generate_unique_string,
     login_user,
 )
@@ -31,13 +31,14 @@ def test_create_employee_201(
         json=employee_data,
     )
 
-    employee_data["id"] = response.json()["id"]
+    data = response.json()
+    employee_data["id"] = data["id"]
     employee_data["org_unit"] = org_unit
     employee_data["holiday_group"] = None
     employee_data["departments"] = []
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == employee_data
+    assert data == employee_data
 
 
 def test_get_employees_200(
@@ -374,8 +375,9 @@ def test_update_employee_by_id_200(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == employee
-    assert response.json()["first_name"] == "Updated Employee Name"
+    data = response.json()
+    assert data == employee
+    assert data["first_name"] == "Updated Employee Name"
 
 
 def test_update_employee_by_id_404_employee_not_found(
@@ -434,7 +436,7 @@ def test_update_employee_badge_number_200_with_user(
     employee_data["org_unit_id"] = org_unit["id"]
     employee = create_employee(employee_data, test_client)
     user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = create_user_direct(user_data)
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -15,8 +15,9 @@ def test_create_event_log_201(
     response = test_client.post(BASE_URL, json=event_log_data)
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["badge_number"] == event_log_data["badge_number"]
-    assert response.json()["log"] == event_log_data["log"]
+    data = response.json()
+    assert data["badge_number"] == event_log_data["badge_number"]
+    assert data["log"] == event_log_data["log"]
 
 
 def test_get_event_logs_200(
@@ -110,8 +111,9 @@ def test_get_event_log_by_id_200(
     response = test_client.get(f"{BASE_URL}/{event_log_id}")
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["badge_number"] == event_log_data["badge_number"]
-    assert response.json()["log"] == event_log_data["log"]
+    data = response.json()
+    assert data["badge_number"] == event_log_data["badge_number"]
+    assert data["log"] == event_log_data["log"]
 
 
 def test_get_event_log_by_id_404_not_found(
@@ -10,9 +10,9 @@ from src.holiday_group.constants import (
 )
 from tests.conftest import (
     chosen_holiday_group_names,
-    create_employee,
+    create_employee_direct,
     create_holiday_group,
-    create_org_unit,
+    create_org_unit_direct,
     random_string,
 )
 
@@ -26,10 +26,11 @@ def test_create_holiday_group_201(
         json=holiday_group_data,
     )
 
-    holiday_group_data["id"] = response.json()["id"]
+    data = response.json()
+    holiday_group_data["id"] = data["id"]
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == holiday_group_data
+    assert data == holiday_group_data
 
 
 def test_create_holiday_group_400_end_date_before_start_date(
@@ -138,10 +139,10 @@ def test_get_employees_by_holiday_group_200_nonempty_list(
     test_client: TestClient,
 ):
     holiday_group = create_holiday_group(holiday_group_data, test_client)
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["holiday_group_id"] = holiday_group["id"]
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
 
     response = test_client.get(f"{BASE_URL}/{holiday_group["id"]}/employees")
 
@@ -178,8 +179,9 @@ def test_update_holiday_group_by_id_200(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == holiday_group
-    assert response.json()["name"] == new_name
+    data = response.json()
+    assert data == holiday_group
+    assert data["name"] == new_name
 
 
 def test_update_holiday_group_by_id_200_add_holiday(
@@ -206,7 +208,8 @@ def test_update_holiday_group_by_id_200_add_holiday(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == holiday_group
+    data = response.json()
+    assert data == holiday_group
     assert {
         "name": "New Holiday",
         "start_date": "2023-12-25",
@@ -217,7 +220,7 @@ def test_update_holiday_group_by_id_200_add_holiday(
         "recurrence_day": None,
         "recurrence_weekday": None,
         "recurrence_week": None,
-    } in response.json()["holidays"]
+    } in data["holidays"]
 
 
 def test_update_holiday_group_by_id_200_remove_holiday(
@@ -233,8 +236,9 @@ def test_update_holiday_group_by_id_200_remove_holiday(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == holiday_group
-    assert response.json()["holidays"] == []
+    data = response.json()
+    assert data == holiday_group
+    assert data["holidays"] == []
 
 
 def test_update_holiday_group_by_id_400_end_date_before_start_date(
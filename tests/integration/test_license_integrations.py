@@ -10,7 +10,7 @@ from src.license.constants import (
     EXC_MSG_INVALID_LICENSE_KEY,
     EXC_MSG_LICENSE_NOT_FOUND,
 )
-from tests.conftest import generate_test_license_key
+from tests.conftest import generate_test_license_key, no_auth
 
 
 def mock_license_server_response(activation_key: str = "b" * 128):
@@ -37,9 +37,10 @@ def test_get_license_status_200_no_license(test_client: TestClient):
     response = test_client.get(f"{BASE_URL}/status")
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["is_active"] is False
-    assert response.json()["license_key"] is None
-    assert response.json()["activated_at"] is None
+    data = response.json()
+    assert data["is_active"] is False
+    assert data["license_key"] is None
+    assert data["activated_at"] is None
 
 
 @patch("src.license.routes.httpx.Client")
@@ -58,10 +59,11 @@ def test_activate_license_201(mock_client, test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["license_key"] == license_key
-    assert response.json()["is_active"] is True
-    assert "activated_at" in response.json()
-    assert "id" in response.json()
+    data = response.json()
+    assert data["license_key"] == license_key
+    assert data["is_active"] is True
+    assert "activated_at" in data
+    assert "id" in data
 
 
 def test_activate_license_400_invalid_format(test_client: TestClient):
@@ -154,9 +156,10 @@ def test_get_license_status_200_with_active_license(
     response = test_client.get(f"{BASE_URL}/status")
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["is_active"] is True
-    assert response.json()["license_key"] == license_key
-    assert response.json()["activated_at"] is not None
+    data = response.json()
+    assert data["is_active"] is True
+    assert data["license_key"] == license_key
+    assert data["activated_at"] is not None
 
 
 @patch("src.license.routes.httpx.Client")
@@ -224,57 +227,40 @@ def test_activate_replaces_previous_license(
 
     # Verify only second license is active
     status_response = test_client.get(f"{BASE_URL}/status")
-    assert status_response.json()["is_active"] is True
-    assert status_response.json()["license_key"] == license_key2
+    status_data = status_response.json()
+    assert status_data["is_active"] is True
+    assert status_data["license_key"] == license_key2
 
 
 def test_license_status_public_no_auth_required(test_client: TestClient):
     """Test that license status endpoint does not require authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
     # Should still work without auth
-    response = test_client.get(f"{BASE_URL}/status")
+    with no_auth(test_client):
+        response = test_client.get(f"{BASE_URL}/status")
 
     assert response.status_code == status.HTTP_200_OK
     assert "is_active" in response.json()
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 @patch("src.license.routes.httpx.Client")
 def test_activate_license_requires_auth(mock_client, test_client: TestClient):
     """Test that activating a license requires authentication."""
     license_key = generate_test_license_key()
 
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
-    response = test_client.post(
-        f"{BASE_URL}/activate",
-        json={"license_key": license_key},
-    )
+    with no_auth(test_client):
+        response = test_client.post(
+            f"{BASE_URL}/activate",
+            json={"license_key": license_key},
+        )
 
     # Should fail without auth
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_deactivate_license_requires_auth(test_client: TestClient):
     """Test that deactivating a license requires authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
-    response = test_client.delete(f"{BASE_URL}/deactivate")
+    with no_auth(test_client):
+        response = test_client.delete(f"{BASE_URL}/deactivate")
 
     # Should fail without auth
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    # Restore headers
-    test_client.headers.update(original_headers)
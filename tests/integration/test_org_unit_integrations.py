@@ -24,10 +24,11 @@ def test_create_org_unit_201(
         json=org_unit_data,
     )
 
-    org_unit_data["id"] = response.json()["id"]
+    data = response.json()
+    org_unit_data["id"] = data["id"]
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == org_unit_data
+    assert data == org_unit_data
 
 
 def test_create_org_unit_409_name_already_exists(
@@ -136,8 +137,9 @@ def test_update_org_unit_by_id_200(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == org_unit
-    assert response.json()["name"] == new_name
+    data = response.json()
+    assert data == org_unit
+    assert data["name"] == new_name
 
 
 def test_update_org_unit_by_id_404_not_found(
@@ -3,6 +3,7 @@
 import concurrent.futures
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 
@@ -12,6 +13,9 @@ from src.registered_browser.constants import BASE_URL as BROWSER_URL
 from src.registered_browser.models import RegisteredBrowser
 from tests.conftest import TestingSessionLocal, generate_test_license_key
 
+# The requests in these tests race each other in separate transactions
+pytestmark = pytest.mark.no_rollback
+
 
 def _count_browsers_with_uuid(uuid: str) -> int:
     """Count browsers with a given UUID in the test database."""
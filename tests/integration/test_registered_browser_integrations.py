@@ -23,10 +23,11 @@ def test_register_browser_201_with_auto_generated_uuid(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert "browser_uuid" in response.json()
-    assert response.json()["browser_name"] == "Auto UUID Test Browser"
+    data = response.json()
+    assert "browser_uuid" in data
+    assert data["browser_name"] == "Auto UUID Test Browser"
     # Verify UUID format: WORD-WORD-WORD-NUMBER
-    uuid_parts = response.json()["browser_uuid"].split("-")
+    uuid_parts = data["browser_uuid"].split("-")
     assert len(uuid_parts) == 4
     assert uuid_parts[0].isupper() and uuid_parts[0].isalpha()
     assert uuid_parts[1].isupper() and uuid_parts[1].isalpha()
@@ -48,8 +49,9 @@ def test_register_browser_201_with_custom_uuid(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["browser_uuid"] == custom_uuid
-    assert response.json()["browser_name"] == "Custom UUID Test Browser"
+    data = response.json()
+    assert data["browser_uuid"] == custom_uuid
+    assert data["browser_name"] == "Custom UUID Test Browser"
 
 
 def test_register_browser_400_invalid_uuid_format(test_client: TestClient):
@@ -147,9 +149,10 @@ def test_verify_browser_by_uuid(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["verified"] is True
-    assert response.json()["browser_uuid"] == browser_uuid
-    assert response.json()["browser_name"] == "Verify Test Browser"
+    data = response.json()
+    assert data["verified"] is True
+    assert data["browser_uuid"] == browser_uuid
+    assert data["browser_name"] == "Verify Test Browser"
 
 
 def test_verify_browser_by_fingerprint(test_client: TestClient):
@@ -175,9 +178,10 @@ def test_verify_browser_by_fingerprint(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["verified"] is True
-    assert response.json()["browser_uuid"] == browser_uuid
-    assert response.json()["restored"] is True  # UUID was restored from fingerprint
+    data = response.json()
+    assert data["verified"] is True
+    assert data["browser_uuid"] == browser_uuid
+    assert data["restored"] is True  # UUID was restored from fingerprint
 
 
 def test_verify_browser_not_found(test_client: TestClient):
@@ -191,8 +195,9 @@ def test_verify_browser_not_found(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["verified"] is False
-    assert response.json()["browser_uuid"] is None
+    data = response.json()
+    assert data["verified"] is False
+    assert data["browser_uuid"] is None
 
 
 def test_recover_browser_200(test_client: TestClient):
@@ -220,9 +225,10 @@ def test_recover_browser_200(test_client: TestClient):
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["browser_uuid"] == device_id
-    assert response.json()["browser_name"] == "Recovery Test Browser"
-    assert response.json()["recovered"] is True
+    data = response.json()
+    assert data["browser_uuid"] == device_id
+    assert data["browser_name"] == "Recovery Test Browser"
+    assert data["recovered"] is True
 
 
 def test_recover_browser_400_invalid_format(test_client: TestClient):
@@ -269,9 +275,10 @@ def test_get_registered_browsers_200(test_client: TestClient):
     response = test_client.get(BASE_URL)
 
     assert response.status_code == status.HTTP_200_OK
-    assert isinstance(response.json(), list)
+    data = response.json()
+    assert isinstance(data, list)
     # Check that our registered browser is in the list
-    uuids = [browser["browser_uuid"] for browser in response.json()]
+    uuids = [browser["browser_uuid"] for browser in data]
     assert browser_uuid in uuids
 
 
@@ -286,8 +293,9 @@ def test_delete_registered_browser_204(test_client: TestClient):
             "user_agent": "Test Agent",
         },
     )
-    browser_id = register_response.json()["id"]
-    browser_uuid = register_response.json()["browser_uuid"]
+    registered = register_response.json()
+    browser_id = registered["id"]
+    browser_uuid = registered["browser_uuid"]
 
     response = test_client.delete(f"{BASE_URL}/{browser_id}")
 
@@ -2,80 +2,65 @@
 
 from datetime import date, timedelta
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from src.report.constants import BASE_URL
 from tests.conftest import (
-    clock_employee,
     create_department,
     create_department_membership,
-    create_employee,
-    create_org_unit,
+    create_employee_direct,
+    create_org_unit_direct,
+    seed_clock_pair,
 )
 
-
-def test_create_report_200_all_employees(
-    employee_data: dict,
-    org_unit_data: dict,
-    test_client: TestClient,
-):
-    """Test generating a report for all employees."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Generate report
-    today = date.today()
-    response = test_client.post(
-        BASE_URL,
-        json={
-            "start_date": today.isoformat(),
-            "end_date": today.isoformat(),
-        },
-    )
-
-    assert response.status_code == status.HTTP_200_OK
-    assert response.json()["report_type"] == "employee"  # Default is employee type
-    assert response.json()["start_date"] == today.isoformat()
-    assert response.json()["end_date"] == today.isoformat()
-    assert len(response.json()["employees"]) >= 1
-    assert "generated_at" in response.json()
+PDF_URL = f"{BASE_URL}/pdf"
 
 
-def test_create_report_200_single_employee(
-    employee_data: dict,
-    org_unit_data: dict,
+@pytest.mark.parametrize(
+    "filter_key, report_type, days_back",
+    [
+        (None, "employee", 0),
+        ("employee_id", "employee", 0),
+        ("org_unit_id", "org_unit", 0),
+        (None, "employee", 7),
+    ],
+    ids=["all_employees", "single_employee", "org_unit", "multi_day_period"],
+)
+def test_create_report_200(
+    filter_key: str | None,
+    report_type: str,
+    days_back: int,
+    clocked_employee: dict,
     test_client: TestClient,
 ):
-    """Test generating a report for a specific employee."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Generate report for specific employee
+    """Test generating a report with each kind of filter."""
+    filter_ids = {
+        "employee_id": clocked_employee["id"],
+        "org_unit_id": clocked_employee["org_unit_id"],
+    }
     today = date.today()
-    response = test_client.post(
-        BASE_URL,
-        json={
-            "start_date": today.isoformat(),
-            "end_date": today.isoformat(),
-            "employee_id": employee["id"],
-        },
-    )
+    start_date = today - timedelta(days=days_back)
+    request_body = {
+        "start_date": start_date.isoformat(),
+        "end_date": today.isoformat(),
+    }
+    if filter_key:
+        request_body[filter_key] = filter_ids[filter_key]
+
+    response = test_client.post(BASE_URL, json=request_body)
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["report_type"] == "employee"
-    assert len(response.json()["employees"]) == 1
-    assert response.json()["employees"][0]["employee_id"] == employee["id"]
+    data = response.json()
+    assert data["report_type"] == report_type
+    assert data["start_date"] == start_date.isoformat()
+    assert data["end_date"] == today.isoformat()
+    assert len(data["employees"]) >= 1
+    assert "generated_at" in data
+    if filter_key == "employee_id":
+        assert len(data["employees"]) == 1
+        assert data["employees"][0]["employee_id"] == clocked_employee["id"]
 
 
 def test_create_report_200_department(
@@ -85,15 +70,13 @@ def test_create_report_200_department(
     test_client: TestClient,
 ):
     """Test generating a report for a department."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     department = create_department(department_data, test_client)
+    employee_data["org_unit_id"] = org_unit["id"]
+    employee = create_employee_direct(employee_data)
     create_department_membership(department["id"], employee["id"], test_client)
 
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
+    seed_clock_pair(employee["badge_number"])
 
     # Generate report for department
     today = date.today()
@@ -107,38 +90,9 @@ def test_create_report_200_department(
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["report_type"] == "department"
-    assert len(response.json()["employees"]) == 1
-
-
-def test_create_report_200_org_unit(
-    employee_data: dict,
-    org_unit_data: dict,
-    test_client: TestClient,
-):
-    """Test generating a report for an org unit."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Generate report for org unit
-    today = date.today()
-    response = test_client.post(
-        BASE_URL,
-        json={
-            "start_date": today.isoformat(),
-            "end_date": today.isoformat(),
-            "org_unit_id": org_unit["id"],
-        },
-    )
-
-    assert response.status_code == status.HTTP_200_OK
-    assert response.json()["report_type"] == "org_unit"
-    assert len(response.json()["employees"]) >= 1
+    data = response.json()
+    assert data["report_type"] == "department"
+    assert len(data["employees"]) == 1
 
 
 def test_create_report_200_empty_period(
@@ -160,58 +114,23 @@ def test_create_report_200_empty_period(
     assert response.json()["report_type"] == "employee"
 
 
-def test_create_report_200_multi_day_period(
-    employee_data: dict,
-    org_unit_data: dict,
-    test_client: TestClient,
-):
-    """Test generating a report spanning multiple days."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Generate report for a week
-    today = date.today()
-    week_ago = today - timedelta(days=7)
-    response = test_client.post(
-        BASE_URL,
-        json={
-            "start_date": week_ago.isoformat(),
-            "end_date": today.isoformat(),
-        },
-    )
-
-    assert response.status_code == status.HTTP_200_OK
-    assert response.json()["start_date"] == week_ago.isoformat()
-    assert response.json()["end_date"] == today.isoformat()
-
-
-def test_export_pdf_200_summary_level(
-    employee_data: dict,
-    org_unit_data: dict,
+@pytest.mark.parametrize(
+    "detail_level", ["summary", "employee_summary", "detailed"]
+)
+def test_export_pdf_200_detail_levels(
+    detail_level: str,
+    clocked_employee: dict,
+    pdf_fast: None,
     test_client: TestClient,
 ):
-    """Test exporting a PDF report with summary detail level."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Export PDF
+    """Test exporting a PDF report at each detail level."""
     today = date.today()
     response = test_client.get(
-        f"{BASE_URL}/pdf",
+        PDF_URL,
         params={
             "start_date": today.isoformat(),
             "end_date": today.isoformat(),
-            "detail_level": "summary",
+            "detail_level": detail_level,
         },
     )
 
@@ -222,57 +141,27 @@ def test_export_pdf_200_summary_level(
     assert len(response.content) > 0  # PDF has content
 
 
-def test_export_pdf_200_employee_summary_level(
-    employee_data: dict,
-    org_unit_data: dict,
-    test_client: TestClient,
-):
-    """Test exporting a PDF report with employee summary detail level."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Export PDF with employee summary
-    today = date.today()
-    response = test_client.get(
-        f"{BASE_URL}/pdf",
-        params={
-            "start_date": today.isoformat(),
-            "end_date": today.isoformat(),
-            "detail_level": "employee_summary",
-        },
-    )
-
-    assert response.status_code == status.HTTP_200_OK
-    assert response.headers["content-type"] == "application/pdf"
-    assert len(response.content) > 0
-
-
-def test_export_pdf_200_detailed_level(
+def test_export_pdf_200_single_employee(
     employee_data: dict,
     org_unit_data: dict,
+    pdf_fast: None,
     test_client: TestClient,
 ):
-    """Test exporting a PDF report with detailed level."""
-    org_unit = create_org_unit(org_unit_data, test_client)
+    """Test exporting a PDF report for a specific employee."""
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
 
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
+    seed_clock_pair(employee["badge_number"])
 
-    # Export PDF with detailed level
+    # Export PDF for specific employee
     today = date.today()
     response = test_client.get(
-        f"{BASE_URL}/pdf",
+        PDF_URL,
         params={
             "start_date": today.isoformat(),
             "end_date": today.isoformat(),
+            "employee_id": employee["id"],
             "detail_level": "detailed",
         },
     )
@@ -282,72 +171,37 @@ def test_export_pdf_200_detailed_level(
     assert len(response.content) > 0
 
 
-def test_export_pdf_200_single_employee(
-    employee_data: dict,
-    org_unit_data: dict,
+@pytest.mark.parametrize(
+    "detail_level", ["summary", "employee_summary", "detailed"]
+)
+def test_export_pdf_200_real_renderer(
+    detail_level: str,
+    clocked_employee: dict,
     test_client: TestClient,
 ):
-    """Test exporting a PDF report for a specific employee."""
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-
-    # Clock in and out
-    clock_employee(employee["badge_number"], test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    # Export PDF for specific employee
+    """Test exporting a PDF report through the real ReportLab renderer."""
     today = date.today()
     response = test_client.get(
-        f"{BASE_URL}/pdf",
+        PDF_URL,
         params={
             "start_date": today.isoformat(),
             "end_date": today.isoformat(),
-            "employee_id": employee["id"],
-            "detail_level": "detailed",
+            "detail_level": detail_level,
         },
     )
 
     assert response.status_code == status.HTTP_200_OK
     assert response.headers["content-type"] == "application/pdf"
-    assert len(response.content) > 0
+    assert response.content.startswith(b"%PDF")
+    assert response.content.rstrip().endswith(b"%%EOF")
 
 
 def test_create_report_403_no_permission(
-    auth_role_data: dict,
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
-    test_client: TestClient,
+    limited_user_client: TestClient,
 ):
     """Test that generating reports requires permission."""
-    from tests.conftest import (
-        create_auth_role,
-        create_auth_role_membership,
-        create_user,
-        login_user,
-    )
-
-    # Create user without report permission
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
-
-    # Create auth role without report.read permission
-    auth_role_data["permissions"] = [
-        {"resource": "employee.read"},
-        {"resource": "event_log.read"},
-    ]
-    auth_role = create_auth_role(auth_role_data, test_client)
-    create_auth_role_membership(auth_role["id"], user["id"], test_client)
-
-    # Login as user without permission
-    login_user(user_data, test_client)
-
     today = date.today()
-    response = test_client.post(
+    response = limited_user_client.post(
         BASE_URL,
         json={
             "start_date": today.isoformat(),
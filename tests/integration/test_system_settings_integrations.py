@@ -11,6 +11,10 @@ from src.system_settings.constants import (
     EXC_MSG_LOGO_TOO_LARGE,
     MAX_LOGO_SIZE,
 )
+from src.system_settings.repository import get_settings
+from tests.conftest import TestingSessionLocal, no_auth
+
+LOGO_URL = f"{BASE_URL}/logo"
 
 
 def test_get_system_settings_200(test_client: TestClient):
@@ -30,18 +34,12 @@ def test_get_system_settings_200(test_client: TestClient):
 
 def test_get_system_settings_public_no_auth(test_client: TestClient):
     """Test that getting system settings does not require authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
-    response = test_client.get(BASE_URL)
+    with no_auth(test_client):
+        response = test_client.get(BASE_URL)
 
     assert response.status_code == status.HTTP_200_OK
     assert "primary_color" in response.json()
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_update_system_settings_200(test_client: TestClient):
     """Test successfully updating system settings."""
@@ -79,18 +77,12 @@ def test_update_system_settings_partial(test_client: TestClient):
 
 def test_update_system_settings_requires_auth(test_client: TestClient):
     """Test that updating system settings requires authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
     update_data = {"company_name": "Should Fail"}
-    response = test_client.put(BASE_URL, json=update_data)
+    with no_auth(test_client):
+        response = test_client.put(BASE_URL, json=update_data)
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_upload_logo_200(test_client: TestClient):
     """Test successfully uploading a logo."""
@@ -102,7 +94,7 @@ def test_upload_logo_200(test_client: TestClient):
     )
 
     files = {"file": ("logo.png", io.BytesIO(png_data), "image/png")}
-    response = test_client.post(f"{BASE_URL}/logo", files=files)
+    response = test_client.post(LOGO_URL, files=files)
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -113,7 +105,7 @@ def test_upload_logo_200(test_client: TestClient):
 def test_upload_logo_400_invalid_type(test_client: TestClient):
     """Test uploading a logo with invalid file type."""
     files = {"file": ("logo.txt", io.BytesIO(b"not an image"), "text/plain")}
-    response = test_client.post(f"{BASE_URL}/logo", files=files)
+    response = test_client.post(LOGO_URL, files=files)
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == EXC_MSG_INVALID_LOGO_TYPE
@@ -125,7 +117,7 @@ def test_upload_logo_400_too_large(test_client: TestClient):
     large_data = b"\x00" * (MAX_LOGO_SIZE + 1)
 
     files = {"file": ("logo.png", io.BytesIO(large_data), "image/png")}
-    response = test_client.post(f"{BASE_URL}/logo", files=files)
+    response = test_client.post(LOGO_URL, files=files)
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == EXC_MSG_LOGO_TOO_LARGE
@@ -133,19 +125,13 @@ def test_upload_logo_400_too_large(test_client: TestClient):
 
 def test_upload_logo_requires_auth(test_client: TestClient):
     """Test that uploading a logo requires authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
     png_data = b"\x89PNG\r\n\x1a\n"
     files = {"file": ("logo.png", io.BytesIO(png_data), "image/png")}
-    response = test_client.post(f"{BASE_URL}/logo", files=files)
+    with no_auth(test_client):
+        response = test_client.post(LOGO_URL, files=files)
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_get_logo_200(test_client: TestClient):
     """Test getting the logo after upload."""
@@ -156,10 +142,10 @@ def test_get_logo_200(test_client: TestClient):
         b"\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
     )
     files = {"file": ("logo.png", io.BytesIO(png_data), "image/png")}
-    test_client.post(f"{BASE_URL}/logo", files=files)
+    test_client.post(LOGO_URL, files=files)
 
     # Then retrieve it
-    response = test_client.get(f"{BASE_URL}/logo")
+    response = test_client.get(LOGO_URL)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.headers["content-type"] == "image/png"
@@ -169,27 +155,21 @@ def test_get_logo_200(test_client: TestClient):
 def test_get_logo_204_no_logo(test_client: TestClient):
     """Test getting logo when none exists."""
     # Delete any existing logo
-    test_client.delete(f"{BASE_URL}/logo")
+    test_client.delete(LOGO_URL)
 
-    response = test_client.get(f"{BASE_URL}/logo")
+    response = test_client.get(LOGO_URL)
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
 def test_get_logo_public_no_auth(test_client: TestClient):
     """Test that getting the logo does not require authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
-    response = test_client.get(f"{BASE_URL}/logo")
+    with no_auth(test_client):
+        response = test_client.get(LOGO_URL)
 
     # Should work without auth (either 200 or 204 depending on logo existence)
     assert response.status_code in [status.HTTP_200_OK, status.HTTP_204_NO_CONTENT]
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_delete_logo_204(test_client: TestClient):
     """Test successfully deleting the logo."""
@@ -200,31 +180,28 @@ def test_delete_logo_204(test_client: TestClient):
         b"\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
     )
     files = {"file": ("logo.png", io.BytesIO(png_data), "image/png")}
-    test_client.post(f"{BASE_URL}/logo", files=files)
+    test_client.post(LOGO_URL, files=files)
 
     # Delete logo
-    response = test_client.delete(f"{BASE_URL}/logo")
+    response = test_client.delete(LOGO_URL)
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    # Verify logo is deleted
-    settings_response = test_client.get(BASE_URL)
-    assert settings_response.json()["has_logo"] is False
+    # Verify logo is deleted directly in the database
+    db = TestingSessionLocal()
+    try:
+        assert get_settings(db).logo_data is None
+    finally:
+        db.close()
 
 
 def test_delete_logo_requires_auth(test_client: TestClient):
     """Test that deleting the logo requires authentication."""
-    # Clear authentication headers
-    original_headers = test_client.headers.copy()
-    test_client.headers.clear()
-
-    response = test_client.delete(f"{BASE_URL}/logo")
+    with no_auth(test_client):
+        response = test_client.delete(LOGO_URL)
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    # Restore headers
-    test_client.headers.update(original_headers)
-
 
 def test_update_settings_invalid_color_format(test_client: TestClient):
     """Test updating with invalid color format."""
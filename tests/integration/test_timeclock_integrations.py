@@ -9,17 +9,17 @@ from src.timeclock.constants import (
     EXC_MSG_EMPLOYEE_NOT_ALLOWED,
     EXC_MSG_TIMECLOCK_ENTRY_NOT_FOUND,
 )
-from tests.conftest import clock_employee, create_employee, create_org_unit
+from tests.conftest import (
+    clock_employee,
+    seed_clock_pair,
+)
 
 
 def test_clock_in_201(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
 
     response = test_client.post(f"{BASE_URL}/{employee["badge_number"]}")
 
@@ -28,13 +28,10 @@ def test_clock_in_201(
 
 
 def test_clock_out_201(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
     clock_employee(employee["badge_number"], test_client)
 
     response = test_client.post(f"{BASE_URL}/{employee["badge_number"]}")
@@ -44,14 +41,10 @@ def test_clock_out_201(
 
 
 def test_clock_in_403_employee_not_allowed(
-    employee_data: dict,
-    org_unit_data: dict,
+    disallowed_employee: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee_data["allow_clocking"] = False
-    employee = create_employee(employee_data, test_client)
+    employee = disallowed_employee
 
     response = test_client.post(f"{BASE_URL}/{employee["badge_number"]}")
 
@@ -60,13 +53,10 @@ def test_clock_in_403_employee_not_allowed(
 
 
 def test_check_status_200_clocked_in(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
     clock_employee(employee["badge_number"], test_client)
 
     response = test_client.get(f"{BASE_URL}/{employee["badge_number"]}/status")
@@ -76,13 +66,10 @@ def test_check_status_200_clocked_in(
 
 
 def test_check_status_200_clocked_out(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
     clock_employee(employee["badge_number"], test_client)
     clock_employee(employee["badge_number"], test_client)
 
@@ -93,14 +80,10 @@ def test_check_status_200_clocked_out(
 
 
 def test_check_status_403_not_allowed(
-    employee_data: dict,
-    org_unit_data: dict,
+    disallowed_employee: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee_data["allow_clocking"] = False
-    employee = create_employee(employee_data, test_client)
+    employee = disallowed_employee
 
     response = test_client.get(f"{BASE_URL}/{employee["badge_number"]}/status")
 
@@ -109,17 +92,15 @@ def test_check_status_403_not_allowed(
 
 
 def test_get_timeclock_entries_200(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    clock_employee(employee["badge_number"], test_client)
+    employee = employee_with_org
+    seed_clock_pair(employee["badge_number"])
 
-    start_timestamp = datetime.now(timezone.utc) - timedelta(days=1)
-    end_timestamp = datetime.now(timezone.utc) + timedelta(days=1)
+    now = datetime.now(timezone.utc)
+    start_timestamp = now - timedelta(days=1)
+    end_timestamp = now + timedelta(days=1)
     response = test_client.get(
         BASE_URL,
         params={
@@ -134,17 +115,15 @@ def test_get_timeclock_entries_200(
 
 
 def test_get_timeclock_entries_200_with_employee_id(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    clock_employee(employee["badge_number"], test_client)
+    employee = employee_with_org
+    seed_clock_pair(employee["badge_number"])
 
-    start_timestamp = datetime.now(timezone.utc) - timedelta(days=1)
-    end_timestamp = datetime.now(timezone.utc) + timedelta(days=1)
+    now = datetime.now(timezone.utc)
+    start_timestamp = now - timedelta(days=1)
+    end_timestamp = now + timedelta(days=1)
     response = test_client.get(
         BASE_URL,
         params={
@@ -159,52 +138,40 @@ def test_get_timeclock_entries_200_with_employee_id(
 
 
 def test_update_timeclock_entry_by_id_200(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    start_timestamp = datetime.now(timezone.utc) - timedelta(days=1)
-    end_timestamp = datetime.now(timezone.utc) + timedelta(days=1)
-    timeclock = test_client.get(
-        BASE_URL,
-        params={
-            "start_timestamp": start_timestamp.isoformat(),
-            "end_timestamp": end_timestamp.isoformat(),
-            "badge_number": employee["badge_number"],
-        },
-    ).json()[0]
+    employee = employee_with_org
+    timeclock_id = seed_clock_pair(employee["badge_number"])
 
     new_clock_in = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-    timeclock["badge_number"] = employee["badge_number"]
-    timeclock["clock_in"] = new_clock_in
-    del timeclock["first_name"]
-    del timeclock["last_name"]
+    timeclock = {
+        "id": timeclock_id,
+        "badge_number": employee["badge_number"],
+        "clock_in": new_clock_in,
+        "clock_out": None,
+    }
 
     response = test_client.put(
-        f"{BASE_URL}/{timeclock["id"]}",
+        f"{BASE_URL}/{timeclock_id}",
         json=timeclock,
     )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == timeclock
-    assert response.json()["clock_in"] == new_clock_in
+    data = response.json()
+    assert data == timeclock
+    assert data["clock_in"] == new_clock_in
 
 
 def test_update_timeclock_entry_by_id_400_clock_out_before_clock_in(
     test_client: TestClient,
 ):
+    now = datetime.now(timezone.utc)
     timeclock_data = {
         "id": 999,
         "badge_number": "0",
-        "clock_in": datetime.now(timezone.utc).isoformat(),
-        "clock_out": (
-            datetime.now(timezone.utc) - timedelta(days=1)
-        ).isoformat(),
+        "clock_in": now.isoformat(),
+        "clock_out": (now - timedelta(days=1)).isoformat(),
     }
 
     response = test_client.put(
@@ -219,11 +186,12 @@ def test_update_timeclock_entry_by_id_400_clock_out_before_clock_in(
 def test_update_timeclock_entry_by_id_404_not_found(
     test_client: TestClient,
 ):
+    now = datetime.now(timezone.utc).isoformat()
     timeclock_data = {
         "id": 999,
         "badge_number": "0",
-        "clock_in": datetime.now(timezone.utc).isoformat(),
-        "clock_out": datetime.now(timezone.utc).isoformat(),
+        "clock_in": now,
+        "clock_out": now,
     }
 
     response = test_client.put(
@@ -236,24 +204,11 @@ def test_update_timeclock_entry_by_id_404_not_found(
 
 
 def test_delete_timeclock_entry_by_id_204(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    clock_employee(employee["badge_number"], test_client)
-
-    start_timestamp = datetime.now(timezone.utc) - timedelta(days=1)
-    end_timestamp = datetime.now(timezone.utc) + timedelta(days=1)
-    timeclock_id = test_client.get(
-        BASE_URL,
-        params={
-            "start_timestamp": start_timestamp.isoformat(),
-            "end_timestamp": end_timestamp.isoformat(),
-        },
-    ).json()[0]["id"]
+    employee = employee_with_org
+    timeclock_id = seed_clock_pair(employee["badge_number"])
 
     response = test_client.delete(
         f"{BASE_URL}/{timeclock_id}",
@@ -274,13 +229,10 @@ def test_delete_timeclock_entry_by_id_404_not_found(
 
 
 def test_clock_in_with_client_timestamp(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
 
     client_ts = datetime(2025, 6, 15, 10, 30, 0, tzinfo=timezone.utc)
     response = test_client.post(
@@ -304,20 +256,14 @@ def test_clock_in_with_client_timestamp(
     ).json()
 
     assert len(entries) == 1
-    entry_clock_in = datetime.fromisoformat(entries[0]["clock_in"])
-    assert entry_clock_in.replace(tzinfo=None) == client_ts.replace(
-        tzinfo=None
-    )
+    assert entries[0]["clock_in"] == client_ts.replace(tzinfo=None).isoformat()
 
 
 def test_clock_out_with_client_timestamp(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
 
     clock_in_ts = datetime(2025, 6, 15, 8, 0, 0, tzinfo=timezone.utc)
     clock_out_ts = datetime(2025, 6, 15, 17, 0, 0, tzinfo=timezone.utc)
@@ -350,22 +296,16 @@ def test_clock_out_with_client_timestamp(
     ).json()
 
     assert len(entries) == 1
-    entry_in = datetime.fromisoformat(entries[0]["clock_in"])
-    entry_out = datetime.fromisoformat(entries[0]["clock_out"])
-    assert entry_in.replace(tzinfo=None) == clock_in_ts.replace(tzinfo=None)
-    assert entry_out.replace(tzinfo=None) == clock_out_ts.replace(
-        tzinfo=None
-    )
+    entry = entries[0]
+    assert entry["clock_in"] == clock_in_ts.replace(tzinfo=None).isoformat()
+    assert entry["clock_out"] == clock_out_ts.replace(tzinfo=None).isoformat()
 
 
 def test_clock_without_timestamp_uses_server_time(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
 
     before = datetime.now(timezone.utc)
     response = test_client.post(f"{BASE_URL}/{employee['badge_number']}")
@@ -392,13 +332,10 @@ def test_clock_without_timestamp_uses_server_time(
 
 
 def test_sequential_offline_punches_maintain_order(
-    employee_data: dict,
-    org_unit_data: dict,
+    employee_with_org: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = employee_with_org
 
     # Simulate two offline punches: clock in at T1, clock out at T2
     t1 = datetime(2025, 7, 1, 9, 0, 0, tzinfo=timezone.utc)
@@ -429,7 +366,6 @@ def test_sequential_offline_punches_maintain_order(
     ).json()
 
     assert len(entries) == 1
-    entry_in = datetime.fromisoformat(entries[0]["clock_in"])
-    entry_out = datetime.fromisoformat(entries[0]["clock_out"])
-    assert entry_in.replace(tzinfo=None) == t1.replace(tzinfo=None)
-    assert entry_out.replace(tzinfo=None) == t2.replace(tzinfo=None)
+    entry = entries[0]
+    assert entry["clock_in"] == t1.replace(tzinfo=None).isoformat()
+    assert entry["clock_out"] == t2.replace(tzinfo=None).isoformat()
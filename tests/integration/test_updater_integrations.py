@@ -1,14 +1,19 @@
 """Integration tests for updater routes."""
 
+from collections.abc import Callable
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from src.main import app
 from src.updater.constants import BASE_URL
 from src.updater.routes import _get_settings
-from src.updater.service import reset_state
+from tests.conftest import no_auth
+
+pytestmark = pytest.mark.anyio
 
 
 def _github_release_response(tag="v1.1.0"):
@@ -29,6 +34,10 @@ def _github_release_response(tag="v1.1.0"):
     }
 
 
+RELEASE_V1_1_0 = _github_release_response()
+RELEASE_V1_0_0 = _github_release_response(tag="v1.0.0")
+
+
 def _mock_settings(repo="owner/TAP", token=""):
     settings = MagicMock()
     settings.GITHUB_REPO = repo
@@ -36,9 +45,37 @@ def _mock_settings(repo="owner/TAP", token=""):
     return settings
 
 
-def test_get_status_200(test_client: TestClient):
-    reset_state()
-    response = test_client.get(f"{BASE_URL}/status")
+@pytest.fixture(autouse=True, scope="module")
+def github_api():
+    """Patch the GitHub API call once for the whole module.
+
+    Tests set the release payload on the shared response instead of
+    patching and building a new mock each time.
+    """
+    with patch("src.updater.service._http_client.get") as mock_get:
+        mock_get.return_value.json.return_value = RELEASE_V1_1_0
+        yield mock_get
+
+
+@pytest.fixture
+def mock_settings():
+    """Override the updater settings dependency for one test.
+
+    Yields:
+        Callable: Applies the override with the given repo and token.
+    """
+
+    def apply(repo="owner/TAP", token=""):
+        app.dependency_overrides[_get_settings] = lambda: _mock_settings(
+            repo, token
+        )
+
+    yield apply
+    app.dependency_overrides.pop(_get_settings, None)
+
+
+async def test_get_status_200(async_client: AsyncClient):
+    response = await async_client.get(f"{BASE_URL}/status")
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -47,25 +84,15 @@ def test_get_status_200(test_client: TestClient):
     assert data["update_available"] is False
 
 
-@patch("src.updater.service.httpx.get")
-def test_check_update_available(
-    mock_get, test_client: TestClient
+async def test_check_update_available(
+    github_api: MagicMock,
+    mock_settings: Callable,
+    async_client: AsyncClient,
 ):
-    reset_state()
-    mock_response = MagicMock()
-    mock_response.json.return_value = (
-        _github_release_response()
-    )
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
-
-    app.dependency_overrides[_get_settings] = lambda: (
-        _mock_settings()
-    )
-    try:
-        response = test_client.get(f"{BASE_URL}/check")
-    finally:
-        app.dependency_overrides.pop(_get_settings, None)
+    github_api.return_value.json.return_value = RELEASE_V1_1_0
+
+    mock_settings()
+    response = await async_client.get(f"{BASE_URL}/check")
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -74,80 +101,52 @@ def test_check_update_available(
     assert "TAP-1.1.0.zip" in data["asset_name"]
 
 
-@patch("src.updater.service.httpx.get")
-def test_check_no_update(
-    mock_get, test_client: TestClient
+async def test_check_no_update(
+    github_api: MagicMock,
+    mock_settings: Callable,
+    async_client: AsyncClient,
 ):
-    reset_state()
-    mock_response = MagicMock()
-    mock_response.json.return_value = (
-        _github_release_response(tag="v1.0.0")
-    )
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
-
-    app.dependency_overrides[_get_settings] = lambda: (
-        _mock_settings()
-    )
-    try:
-        response = test_client.get(f"{BASE_URL}/check")
-    finally:
-        app.dependency_overrides.pop(_get_settings, None)
+    github_api.return_value.json.return_value = RELEASE_V1_0_0
+
+    mock_settings()
+    response = await async_client.get(f"{BASE_URL}/check")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
-def test_check_repo_not_configured(
-    test_client: TestClient,
+async def test_check_repo_not_configured(
+    mock_settings: Callable,
+    async_client: AsyncClient,
 ):
-    reset_state()
-
-    app.dependency_overrides[_get_settings] = lambda: (
-        _mock_settings(repo="")
-    )
-    try:
-        response = test_client.get(f"{BASE_URL}/check")
-    finally:
-        app.dependency_overrides.pop(_get_settings, None)
+    mock_settings(repo="")
+    response = await async_client.get(f"{BASE_URL}/check")
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-def test_apply_not_frozen(test_client: TestClient):
-    reset_state()
-    response = test_client.post(f"{BASE_URL}/apply")
+async def test_apply_not_frozen(async_client: AsyncClient):
+    response = await async_client.post(f"{BASE_URL}/apply")
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-def test_rollback_not_frozen(test_client: TestClient):
-    reset_state()
-    response = test_client.post(f"{BASE_URL}/rollback")
+async def test_rollback_not_frozen(async_client: AsyncClient):
+    response = await async_client.post(f"{BASE_URL}/rollback")
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@patch("src.updater.service.httpx.get")
-def test_status_after_check(
-    mock_get, test_client: TestClient
+async def test_status_after_check(
+    github_api: MagicMock,
+    mock_settings: Callable,
+    async_client: AsyncClient,
 ):
-    reset_state()
-    mock_response = MagicMock()
-    mock_response.json.return_value = (
-        _github_release_response()
-    )
-    mock_response.raise_for_status = MagicMock()
-    mock_get.return_value = mock_response
-
-    app.dependency_overrides[_get_settings] = lambda: (
-        _mock_settings()
-    )
-    try:
-        test_client.get(f"{BASE_URL}/check")
-    finally:
-        app.dependency_overrides.pop(_get_settings, None)
-
-    response = test_client.get(f"{BASE_URL}/status")
+    github_api.return_value.json.return_value = RELEASE_V1_1_0
+
+    mock_settings()
+    await async_client.get(f"{BASE_URL}/check")
+
+    response = await async_client.get(f"{BASE_URL}/status")
     data = response.json()
 
     assert data["update_available"] is True
@@ -156,11 +155,6 @@ def test_status_after_check(
 
 
 def test_unauthorized_access(test_client: TestClient):
-    reset_state()
-    saved_headers = dict(test_client.headers)
-    test_client.headers.clear()
-
-    response = test_client.get(f"{BASE_URL}/status")
+    with no_auth(test_client):
+        response = test_client.get(f"{BASE_URL}/status")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    test_client.headers.update(saved_headers)
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
@@ -22,10 +23,10 @@ from src.user.constants import (
 from tests.conftest import (
     create_auth_role,
     create_auth_role_membership,
-    create_employee,
-    create_org_unit,
-    create_user,
+    create_employee_direct,
+    create_org_unit_direct,
     login_user,
+    login_user_fast,
 )
 
 
@@ -35,32 +36,26 @@ def test_create_user_201(
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
 
     response = test_client.post(BASE_URL, json=user_data)
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json() == {
-        "id": response.json()["id"],
+    data = response.json()
+    assert data == {
+        "id": data["id"],
         "badge_number": user_data["badge_number"],
     }
 
 
 def test_create_user_409_user_already_exists(
-    employee_data: dict,
-    org_unit_data: dict,
     user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    create_user(user_data, test_client)
-
     response = test_client.post(BASE_URL, json=user_data)
 
     assert response.status_code == status.HTTP_409_CONFLICT
@@ -68,16 +63,10 @@ def test_create_user_409_user_already_exists(
 
 
 def test_get_users_200(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     response = test_client.get(BASE_URL)
 
@@ -86,16 +75,10 @@ def test_get_users_200(
 
 
 def test_get_user_by_id_200(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     response = test_client.get(f"{BASE_URL}/{user["id"]}")
 
@@ -103,28 +86,11 @@ def test_get_user_by_id_200(
     assert response.json() == user
 
 
-def test_get_user_by_id_404_user_not_found(
-    test_client: TestClient,
-):
-    user_id = 999
-
-    response = test_client.get(f"{BASE_URL}/{user_id}")
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {"detail": EXC_MSG_USER_NOT_FOUND}
-
-
 def test_get_user_auth_roles_200_empty_list(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     response = test_client.get(f"{BASE_URL}/{user["id"]}/auth_roles")
 
@@ -134,16 +100,10 @@ def test_get_user_auth_roles_200_empty_list(
 
 def test_get_user_auth_roles_200_nonempty_list(
     auth_role_data: dict,
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
     auth_role = create_auth_role(auth_role_data, test_client)
     create_auth_role_membership(auth_role["id"], user["id"], test_client)
 
@@ -153,32 +113,16 @@ def test_get_user_auth_roles_200_nonempty_list(
     assert response.json() == [auth_role]
 
 
-def test_get_user_auth_roles_404_user_not_found(
-    test_client: TestClient,
-):
-    user_id = 999
-
-    response = test_client.get(f"{BASE_URL}/{user_id}/auth_roles")
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {"detail": EXC_MSG_USER_NOT_FOUND}
-
-
 def test_update_user_password_200(
-    employee_data: dict,
-    org_unit_data: dict,
     user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
     user_data["new_password"] = "new_password"
 
     # Login as the user to perform self-service password update
-    login_user(user_data, test_client)
+    login_user_fast(user["badge_number"], test_client)
     response = test_client.put(
         f"{BASE_URL}/{user["badge_number"]}",
         json=user_data,
@@ -207,49 +151,21 @@ def test_update_user_password_200(
     assert decoded_jwt["sub"] == user["badge_number"]
 
 
-def test_update_user_password_400_ids_do_not_match(
-    user_data: dict,
-    test_client: TestClient,
-):
-    user_data["badge_number"] = "0"
-    user_data["new_password"] = "new_password"
-
-    response = test_client.put(f"{BASE_URL}/1", json=user_data)
-
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.json() == {"detail": EXC_MSG_IDS_DO_NOT_MATCH}
-
-
-def test_update_user_password_404_user_not_found(
-    user_data: dict,
-    test_client: TestClient,
-):
-    user_data["badge_number"] = "999"
-    user_data["new_password"] = "new_password"
-
-    response = test_client.put(
-        f"{BASE_URL}/{user_data["badge_number"]}", json=user_data
-    )
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {"detail": EXC_MSG_USER_NOT_FOUND}
-
-
 def test_update_user_password_403_wrong_password(
     employee_data: dict,
     org_unit_data: dict,
     user_data: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
+    org_unit = create_org_unit_direct(org_unit_data)
     employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
+    employee = create_employee_direct(employee_data)
     user_data["badge_number"] = employee["badge_number"]
     original_password = user_data["password"]
     test_client.post(BASE_URL, json=user_data)
 
     # Login as the user, then try to update password with wrong current password
-    login_user(user_data, test_client)
+    login_user_fast(user_data["badge_number"], test_client)
     user_data["password"] = "wrong_password"
     user_data["new_password"] = "new_password"
 
@@ -262,44 +178,60 @@ def test_update_user_password_403_wrong_password(
 
 
 def test_delete_user_by_id_204(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     response = test_client.delete(f"{BASE_URL}/{user["id"]}")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
-def test_delete_user_by_id_404_user_not_found(
+@pytest.mark.parametrize(
+    "method, path, badge_number, expected_status, expected_detail",
+    [
+        ("GET", "/999", None, 404, EXC_MSG_USER_NOT_FOUND),
+        ("GET", "/999/auth_roles", None, 404, EXC_MSG_USER_NOT_FOUND),
+        ("PUT", "/1", "0", 400, EXC_MSG_IDS_DO_NOT_MATCH),
+        ("PUT", "/999", "999", 404, EXC_MSG_USER_NOT_FOUND),
+        ("DELETE", "/999", None, 404, EXC_MSG_USER_NOT_FOUND),
+    ],
+    ids=[
+        "get_user_by_id_404",
+        "get_user_auth_roles_404",
+        "update_user_password_400_ids_do_not_match",
+        "update_user_password_404",
+        "delete_user_by_id_404",
+    ],
+)
+def test_user_request_fails_without_seeded_user(
+    method: str,
+    path: str,
+    badge_number: str | None,
+    expected_status: int,
+    expected_detail: str,
+    user_data: dict,
     test_client: TestClient,
 ):
-    user_id = 999
+    json = None
+    if badge_number is not None:
+        user_data["badge_number"] = badge_number
+        user_data["new_password"] = "new_password"
+        json = user_data
 
-    response = test_client.delete(f"{BASE_URL}/{user_id}")
+    response = test_client.request(method, f"{BASE_URL}{path}", json=json)
 
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {"detail": EXC_MSG_USER_NOT_FOUND}
+    assert response.status_code == expected_status
+    assert response.json() == {"detail": expected_detail}
 
 
 def test_login_200(
-    employee_data: dict,
-    org_unit_data: dict,
     user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     test_client.headers.clear()
     test_client.cookies.clear()
@@ -326,16 +258,10 @@ def test_login_200(
 
 
 def test_login_401(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     login_data = {
         "username": str(user["id"]),
@@ -348,16 +274,11 @@ def test_login_401(
 
 
 def test_refresh_token_200(
-    employee_data: dict,
-    org_unit_data: dict,
     user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
     login_user(user_data, test_client)
 
     response = test_client.post(f"{BASE_URL}/refresh")
@@ -401,16 +322,10 @@ def test_refresh_token_401_refresh_token_invalid(
 
 
 def test_refresh_token_401_refresh_token_expired(
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
+    user = seeded_user
 
     token = services.encode_jwt_token(
         user["badge_number"],
@@ -426,17 +341,11 @@ def test_refresh_token_401_refresh_token_expired(
 
 
 def test_logout_200(
-    employee_data: dict,
-    org_unit_data: dict,
     user_data: dict,
+    seeded_user: dict,
     test_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    create_user(user_data, test_client)
-    login_user(user_data, test_client)
+    login_user_fast(seeded_user["badge_number"], test_client)
 
     response = test_client.post(f"{BASE_URL}/logout")
 
@@ -481,22 +390,9 @@ def test_logout_401_refresh_token_not_found(
 
 
 def test_create_employee_403_missing_permission(
-    auth_role_data: dict,
-    employee_data: dict,
-    org_unit_data: dict,
-    user_data: dict,
-    test_client: TestClient,
+    limited_user_client: TestClient,
 ):
-    org_unit = create_org_unit(org_unit_data, test_client)
-    employee_data["org_unit_id"] = org_unit["id"]
-    employee = create_employee(employee_data, test_client)
-    user_data["badge_number"] = employee["badge_number"]
-    user = create_user(user_data, test_client)
-    auth_role = create_auth_role(auth_role_data, test_client)
-    create_auth_role_membership(auth_role["id"], user["id"], test_client)
-    login_user(user_data, test_client)
-
-    response = test_client.get(BASE_URL)
+    response = limited_user_client.get(BASE_URL)
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
     assert response.json()["detail"] == EXC_MSG_MISSING_PERMISSION
@@ -1,5 +1,6 @@
 """Unit tests for holiday generation utility functions."""
 
+from dataclasses import dataclass
 from datetime import date
 
 import pytest
@@ -11,6 +12,28 @@ from src.holiday_group.utils import (
 )
 
 
+CHRISTMAS_2024 = date(2024, 12, 25)
+THANKSGIVING_2024 = date(2024, 11, 28)
+MEMORIAL_DAY_2024 = date(2024, 5, 27)
+INDEPENDENCE_DAY_2024 = date(2024, 7, 4)
+LABOR_DAY_2024 = date(2024, 9, 2)
+
+
+@dataclass(slots=True)
+class MockHoliday:
+    """Mock Holiday model for testing."""
+
+    name: str
+    start_date: date | None = None
+    end_date: date | None = None
+    is_recurring: bool = False
+    recurrence_type: str | None = None
+    recurrence_month: int | None = None
+    recurrence_day: int | None = None
+    recurrence_week: int | None = None
+    recurrence_weekday: int | None = None
+
+
 class TestGetNthWeekdayOfMonth:
     """Tests for get_nth_weekday_of_month function."""
 
@@ -35,13 +58,13 @@ class TestGetNthWeekdayOfMonth:
         """Test getting the fourth Thursday of November 2024 (Thanksgiving)."""
         result = get_nth_weekday_of_month(2024, 11, 3, 4)
         # Thanksgiving 2024 is November 28
-        assert result == date(2024, 11, 28)
+        assert result == THANKSGIVING_2024
 
     def test_last_monday_of_may_2024(self):
         """Test getting the last Monday of May 2024 (Memorial Day)."""
         result = get_nth_weekday_of_month(2024, 5, 0, 5)
         # Memorial Day 2024 is May 27
-        assert result == date(2024, 5, 27)
+        assert result == MEMORIAL_DAY_2024
 
     def test_first_sunday_of_june_2024(self):
         """Test getting the first Sunday of June 2024."""
@@ -78,6 +101,15 @@ class TestGetNthWeekdayOfMonth:
         # Last Tuesday of April 2024 is April 30
         assert result == date(2024, 4, 30)
 
+    def test_repeated_lookup_is_cached(self):
+        """Test that repeating a lookup is served from the cache."""
+        first = get_nth_weekday_of_month(2031, 9, 0, 1)
+        hits = get_nth_weekday_of_month.cache_info().hits
+        second = get_nth_weekday_of_month(2031, 9, 0, 1)
+
+        assert second is first
+        assert get_nth_weekday_of_month.cache_info().hits == hits + 1
+
 
 class TestGenerateHolidayForYear:
     """Tests for generate_holiday_for_year function."""
@@ -91,8 +123,8 @@ class TestGenerateHolidayForYear:
             12,
             recurrence_day=25,
         )
-        assert start_date == date(2024, 12, 25)
-        assert end_date == date(2024, 12, 25)
+        assert start_date == CHRISTMAS_2024
+        assert end_date == CHRISTMAS_2024
 
     def test_fixed_holiday_new_years(self):
         """Test generating New Year's Day (fixed date)."""
@@ -115,8 +147,8 @@ class TestGenerateHolidayForYear:
             7,
             recurrence_day=4,
         )
-        assert start_date == date(2024, 7, 4)
-        assert end_date == date(2024, 7, 4)
+        assert start_date == INDEPENDENCE_DAY_2024
+        assert end_date == INDEPENDENCE_DAY_2024
 
     def test_relative_holiday_thanksgiving(self):
         """Test generating Thanksgiving (4th Thursday of November)."""
@@ -128,8 +160,8 @@ class TestGenerateHolidayForYear:
             recurrence_week=4,
             recurrence_weekday=3,
         )
-        assert start_date == date(2024, 11, 28)
-        assert end_date == date(2024, 11, 28)
+        assert start_date == THANKSGIVING_2024
+        assert end_date == THANKSGIVING_2024
 
     def test_relative_holiday_labor_day(self):
         """Test generating Labor Day (1st Monday of September)."""
@@ -141,8 +173,8 @@ class TestGenerateHolidayForYear:
             recurrence_week=1,
             recurrence_weekday=0,
         )
-        assert start_date == date(2024, 9, 2)
-        assert end_date == date(2024, 9, 2)
+        assert start_date == LABOR_DAY_2024
+        assert end_date == LABOR_DAY_2024
 
     def test_relative_holiday_memorial_day(self):
         """Test generating Memorial Day (last Monday of May)."""
@@ -154,8 +186,8 @@ class TestGenerateHolidayForYear:
             recurrence_week=5,
             recurrence_weekday=0,
         )
-        assert start_date == date(2024, 5, 27)
-        assert end_date == date(2024, 5, 27)
+        assert start_date == MEMORIAL_DAY_2024
+        assert end_date == MEMORIAL_DAY_2024
 
     def test_invalid_recurrence_type(self):
         """Test that invalid recurrence type raises ValueError."""
@@ -207,35 +239,10 @@ class TestGenerateHolidayForYear:
 class TestGetHolidaysForYear:
     """Tests for get_holidays_for_year function."""
 
-    class MockHoliday:
-        """Mock Holiday model for testing."""
-
-        def __init__(
-            self,
-            name,
-            start_date=None,
-            end_date=None,
-            is_recurring=False,
-            recurrence_type=None,
-            recurrence_month=None,
-            recurrence_day=None,
-            recurrence_week=None,
-            recurrence_weekday=None,
-        ):
-            self.name = name
-            self.start_date = start_date
-            self.end_date = end_date
-            self.is_recurring = is_recurring
-            self.recurrence_type = recurrence_type
-            self.recurrence_month = recurrence_month
-            self.recurrence_day = recurrence_day
-            self.recurrence_week = recurrence_week
-            self.recurrence_weekday = recurrence_weekday
-
     def test_recurring_fixed_holiday(self):
         """Test generating a recurring fixed holiday."""
         holidays = [
-            self.MockHoliday(
+            MockHoliday(
                 "Christmas",
                 is_recurring=True,
                 recurrence_type="fixed",
@@ -248,13 +255,13 @@ class TestGetHolidaysForYear:
 
         assert len(result) == 1
         assert result[0]["name"] == "Christmas"
-        assert result[0]["start_date"] == date(2024, 12, 25)
-        assert result[0]["end_date"] == date(2024, 12, 25)
+        assert result[0]["start_date"] == CHRISTMAS_2024
+        assert result[0]["end_date"] == CHRISTMAS_2024
 
     def test_recurring_relative_holiday(self):
         """Test generating a recurring relative holiday."""
         holidays = [
-            self.MockHoliday(
+            MockHoliday(
                 "Thanksgiving",
                 is_recurring=True,
                 recurrence_type="relative",
@@ -268,13 +275,13 @@ class TestGetHolidaysForYear:
 
         assert len(result) == 1
         assert result[0]["name"] == "Thanksgiving"
-        assert result[0]["start_date"] == date(2024, 11, 28)
-        assert result[0]["end_date"] == date(2024, 11, 28)
+        assert result[0]["start_date"] == THANKSGIVING_2024
+        assert result[0]["end_date"] == THANKSGIVING_2024
 
     def test_one_time_holiday_in_year(self):
         """Test including a one-time holiday that falls in the target year."""
         holidays = [
-            self.MockHoliday(
+            MockHoliday(
                 "Special Event",
                 start_date=date(2024, 6, 15),
                 end_date=date(2024, 6, 15),
@@ -292,7 +299,7 @@ class TestGetHolidaysForYear:
     def test_one_time_holiday_not_in_year(self):
         """Test excluding a one-time holiday that doesn't fall in the target year."""
         holidays = [
-            self.MockHoliday(
+            MockHoliday(
                 "Past Event",
                 start_date=date(2023, 6, 15),
                 end_date=date(2023, 6, 15),
@@ -307,14 +314,14 @@ class TestGetHolidaysForYear:
     def test_mixed_holidays(self):
         """Test generating a mix of recurring and one-time holidays."""
         holidays = [
-            self.MockHoliday(
+            MockHoliday(
                 "Christmas",
                 is_recurring=True,
                 recurrence_type="fixed",
                 recurrence_month=12,
                 recurrence_day=25,
             ),
-            self.MockHoliday(
+            MockHoliday(
                 "Thanksgiving",
                 is_recurring=True,
                 recurrence_type="relative",
@@ -322,13 +329,13 @@ class TestGetHolidaysForYear:
                 recurrence_week=4,
                 recurrence_weekday=3,
             ),
-            self.MockHoliday(
+            MockHoliday(
                 "Company Anniversary",
                 start_date=date(2024, 3, 10),
                 end_date=date(2024, 3, 10),
                 is_recurring=False,
             ),
-            self.MockHoliday(
+            MockHoliday(
                 "Old Event",
                 start_date=date(2023, 3, 10),
                 end_date=date(2023, 3, 10),
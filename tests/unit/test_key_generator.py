@@ -1,8 +1,11 @@
 """Unit tests for license key generator functions."""
 
+import re
+import secrets
 from unittest.mock import MagicMock, patch
 
 import pytest
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
 )
@@ -21,6 +24,11 @@ from src.license.key_generator import (
 )
 
 
+def split_words(word_key: str) -> list[str]:
+    """Split a word-format key on both group and word separators."""
+    return re.split(r"[- ]", word_key)
+
+
 class TestWordList:
     """Tests for the word list loading."""
 
@@ -46,9 +54,7 @@ class TestHexToWords:
         """A valid 128-char hex string should produce 64 words."""
         hex_key = "00" * 64  # All zeros -> first word repeated
         result = hex_to_words(hex_key)
-        words = []
-        for group in result.split(" "):
-            words.extend(group.split("-"))
+        words = split_words(result)
         assert len(words) == 64
         # All bytes are 0x00, so all words should be the first word
         assert all(w == WORD_LIST[0] for w in words)
@@ -58,9 +64,7 @@ class TestHexToWords:
         # Use bytes 0-63, each repeated once to fill 128 hex chars
         hex_key = "".join(f"{i:02x}" for i in range(64))
         result = hex_to_words(hex_key)
-        words = []
-        for group in result.split(" "):
-            words.extend(group.split("-"))
+        words = split_words(result)
         # First 64 words should map to first 64 words in list
         for i in range(64):
             assert words[i] == WORD_LIST[i]
@@ -131,14 +135,21 @@ class TestHexWordsRoundtrip:
         recovered = words_to_hex(word_form)
         assert recovered == original
 
-    def test_all_byte_values(self):
+    @pytest.mark.parametrize("start", [0, 64, 128, 192])
+    def test_all_byte_values(self, start):
         """All 256 byte values should roundtrip correctly."""
-        # Use bytes 0-63 to fill exactly 64 bytes
-        hex_key = "".join(f"{i:02x}" for i in range(64))
+        # Four keys of 64 consecutive bytes cover every byte value
+        hex_key = bytes(range(start, start + 64)).hex()
         word_form = hex_to_words(hex_key)
         recovered = words_to_hex(word_form)
         assert recovered == hex_key
 
+    def test_random_keys_roundtrip(self):
+        """Randomly generated keys should roundtrip correctly."""
+        for _ in range(100):
+            hex_key = secrets.token_hex(64)
+            assert words_to_hex(hex_to_words(hex_key)) == hex_key
+
 
 class TestIsWordFormat:
     """Tests for is_word_format detection."""
@@ -220,16 +231,27 @@ class TestValidateLicenseKeyFormat:
 class TestVerifyActivationKey:
     """Tests for verify_activation_key with Ed25519 signatures."""
 
-    @pytest.fixture
-    def ed25519_keypair(self):
-        """Generate a fresh Ed25519 key pair for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ed25519_keypair(cls):
+        """Generate one Ed25519 key pair shared by the class's tests."""
         private_key = Ed25519PrivateKey.generate()
         public_key = private_key.public_key()
         return private_key, public_key
 
-    def test_valid_signature_verifies(self, ed25519_keypair):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def public_key_pem(cls, ed25519_keypair):
+        """PEM encoding of the shared test public key."""
+        _, public_key = ed25519_keypair
+        return public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+
+    def test_valid_signature_verifies(self, ed25519_keypair, public_key_pem):
         """A correctly signed activation key should verify."""
-        private_key, public_key = ed25519_keypair
+        private_key, _ = ed25519_keypair
         license_key = "ab" * 64
         machine_id = "test-machine-id"
 
@@ -238,32 +260,19 @@ class TestVerifyActivationKey:
         activation_key = signature.hex()
 
         # Patch the PUBLIC_KEY_PEM to use our test key
-        from cryptography.hazmat.primitives import serialization
-        test_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
-        with patch("src.license.key_generator.PUBLIC_KEY_PEM", test_pem):
+        with patch("src.license.key_generator.PUBLIC_KEY_PEM", public_key_pem):
             result = verify_activation_key(
                 license_key, activation_key, machine_id
             )
         assert result is True
 
-    def test_invalid_signature_fails(self, ed25519_keypair):
+    def test_invalid_signature_fails(self, public_key_pem):
         """An incorrect signature should fail verification."""
-        _, public_key = ed25519_keypair
         license_key = "ab" * 64
         machine_id = "test-machine-id"
         bad_activation = "ff" * 64  # Random bytes, not a valid signature
 
-        from cryptography.hazmat.primitives import serialization
-        test_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
-        with patch("src.license.key_generator.PUBLIC_KEY_PEM", test_pem):
+        with patch("src.license.key_generator.PUBLIC_KEY_PEM", public_key_pem):
             result = verify_activation_key(
                 license_key, bad_activation, machine_id
             )
@@ -0,0 +1,149 @@
+"""Unit tests for the license generator tool."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+import tools.license_generator as license_generator
+from tests.conftest import (
+    _test_private_key_path,
+    _test_public_key_path,
+    generate_test_license_key,
+)
+from tools.license_generator import (
+    generate_license_key,
+    main,
+    verify_license_keys,
+)
+
+VALID_KEY = generate_license_key(_test_private_key_path)
+# Well-formed signature over a different message
+WRONG_MESSAGE_KEY = generate_test_license_key()
+NOT_HEX_KEY = "zz" * 64
+SHORT_KEY = VALID_KEY[:64]
+
+
+def run_cli(*args: str) -> int:
+    """Run the license generator CLI with the given arguments.
+
+    Returns:
+        int: The exit code returned by `main`.
+    """
+    with patch("sys.argv", ["license_generator.py", *args]):
+        return main()
+
+
+class TestVerifyLicenseKeys:
+    """Tests for bulk license key verification."""
+
+    def test_results_follow_input_order(self):
+        """Each result lines up with the key at the same position."""
+        keys = [
+            VALID_KEY,
+            WRONG_MESSAGE_KEY,
+            NOT_HEX_KEY,
+            VALID_KEY,
+            SHORT_KEY,
+        ]
+
+        failures = verify_license_keys(keys, _test_public_key_path)
+
+        assert [failure is None for failure in failures] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert "hexadecimal" in failures[2]
+        assert "got 32 bytes" in failures[4]
+
+    def test_repeated_keys_verified_once(self):
+        """Duplicate keys reuse the first result instead of re-verifying."""
+        keys = [VALID_KEY, WRONG_MESSAGE_KEY, VALID_KEY, WRONG_MESSAGE_KEY]
+
+        checks = []
+        build_checker = license_generator._license_checker
+
+        def counting_checker(public_key):
+            check = Mock(wraps=build_checker(public_key))
+            checks.append(check)
+            return check
+
+        with patch.object(
+            license_generator, "_license_checker", counting_checker
+        ):
+            failures = verify_license_keys(keys, _test_public_key_path)
+
+        assert [failure is None for failure in failures] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert len(checks) == 1
+        assert checks[0].call_count == 2
+
+    def test_empty_list(self):
+        assert verify_license_keys([], _test_public_key_path) == []
+
+    def test_missing_public_key(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            verify_license_keys([VALID_KEY], tmp_path / "missing.pem")
+
+
+class TestVerifyLicensesFileCli:
+    """Tests for the --verify-licenses-file option."""
+
+    @pytest.mark.parametrize(
+        "keys, expected_exit_code",
+        [
+            ([VALID_KEY, VALID_KEY], 0),
+            ([VALID_KEY, WRONG_MESSAGE_KEY], 1),
+            ([NOT_HEX_KEY], 1),
+        ],
+        ids=["all_valid", "bad_signature", "bad_format"],
+    )
+    def test_exit_code(
+        self, keys: list[str], expected_exit_code: int, tmp_path: Path
+    ):
+        keys_file = tmp_path / "keys.txt"
+        keys_file.write_text("\n".join(keys) + "\n")
+
+        exit_code = run_cli(
+            "--verify-licenses-file",
+            str(keys_file),
+            "--public-key",
+            str(_test_public_key_path),
+        )
+
+        assert exit_code == expected_exit_code
+
+    def test_reports_each_key_and_skips_blank_lines(
+        self, tmp_path: Path, capsys
+    ):
+        keys_file = tmp_path / "keys.txt"
+        keys_file.write_text(f"{VALID_KEY}\n\n  {WRONG_MESSAGE_KEY}  \n")
+
+        run_cli(
+            "--verify-licenses-file",
+            str(keys_file),
+            "--public-key",
+            str(_test_public_key_path),
+        )
+
+        output = capsys.readouterr().out
+        assert "Verifying 2 license key(s)" in output
+        assert "License Key 1: VALID" in output
+        assert (
+            "License Key 2: INVALID (Verification failed: "
+            "signature does not match)" in output
+        )
+        assert "1 of 2 license key(s) are INVALID" in output
+
+    def test_requires_public_key(self, tmp_path: Path):
+        keys_file = tmp_path / "keys.txt"
+        keys_file.write_text(f"{VALID_KEY}\n")
+
+        assert run_cli("--verify-licenses-file", str(keys_file)) == 1
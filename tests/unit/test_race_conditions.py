@@ -1,15 +1,21 @@
 """Unit tests for race condition handling in browser registration and license activation."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 
+from src.license.models import License
+from src.license.routes import activate_license
 from src.registered_browser.constants import (
     EXC_MSG_BROWSER_ALREADY_REGISTERED,
     EXC_MSG_BROWSER_NAME_ALREADY_EXISTS,
 )
+from src.registered_browser.routes import register_browser
+
+LICENSE_COLUMNS = License.__table__.columns
+LICENSE_INDEX_NAMES = frozenset(idx.name for idx in License.__table__.indexes)
 
 
 class TestBrowserRegistrationRaceConditions:
@@ -20,6 +26,19 @@ class TestBrowserRegistrationRaceConditions:
     instead of using check-then-act patterns.
     """
 
+    @pytest.fixture(autouse=True)
+    def route_mocks(self):
+        """Patch the registration route's collaborators for every test."""
+        with patch.multiple(
+            "src.registered_browser.routes",
+            create_event_log=DEFAULT,
+            get_registered_browser_by_name=DEFAULT,
+            get_registered_browser_by_uuid=DEFAULT,
+            create_registered_browser_in_db=DEFAULT,
+            validate_uuid_format=Mock(return_value=True),
+        ) as mocks:
+            yield mocks
+
     def _make_request(self, uuid="TEST-RACE-UUID-01", name="Race Browser"):
         """Create a mock RegisteredBrowserCreate."""
         req = Mock()
@@ -37,47 +56,31 @@ class TestBrowserRegistrationRaceConditions:
         req.client.host = "127.0.0.1"
         return req
 
-    @patch("src.registered_browser.routes.create_event_log")
-    @patch("src.registered_browser.routes.get_registered_browser_by_name")
-    @patch("src.registered_browser.routes.get_registered_browser_by_uuid")
-    @patch("src.registered_browser.routes.create_registered_browser_in_db")
-    @patch("src.registered_browser.routes.validate_uuid_format", return_value=True)
-    def test_integrity_error_duplicate_uuid_returns_409(
-        self, mock_validate_fmt, mock_create, mock_get_uuid, mock_get_name,
-        mock_event_log
-    ):
-        """IntegrityError on duplicate UUID should return 409 with browser_uuid field."""
-        from src.registered_browser.routes import register_browser
-
-        mock_create.side_effect = IntegrityError(None, None, Exception("UNIQUE"))
-        mock_get_uuid.return_value = Mock()  # UUID exists
-        mock_get_name.return_value = None
-
-        db = MagicMock()
-        request = self._make_request()
-
-        with pytest.raises(HTTPException) as exc_info:
-            register_browser(request, self._make_http_request(), db, "0", None)
-
-        assert exc_info.value.status_code == 409
-        assert exc_info.value.detail["field"] == "browser_uuid"
-        assert exc_info.value.detail["message"] == EXC_MSG_BROWSER_ALREADY_REGISTERED
-
-    @patch("src.registered_browser.routes.create_event_log")
-    @patch("src.registered_browser.routes.get_registered_browser_by_name")
-    @patch("src.registered_browser.routes.get_registered_browser_by_uuid")
-    @patch("src.registered_browser.routes.create_registered_browser_in_db")
-    @patch("src.registered_browser.routes.validate_uuid_format", return_value=True)
-    def test_integrity_error_duplicate_name_returns_409(
-        self, mock_validate_fmt, mock_create, mock_get_uuid, mock_get_name,
-        mock_event_log
+    @pytest.mark.parametrize(
+        "uuid_exists, name_exists, expected_field, expected_msg",
+        [
+            (True, False, "browser_uuid", EXC_MSG_BROWSER_ALREADY_REGISTERED),
+            (False, True, "browser_name", EXC_MSG_BROWSER_NAME_ALREADY_EXISTS),
+            (False, False, None, "Browser registration conflict"),
+        ],
+        ids=["duplicate_uuid", "duplicate_name", "generic_conflict"],
+    )
+    def test_integrity_error_returns_409(
+        self,
+        uuid_exists: bool,
+        name_exists: bool,
+        expected_field: str | None,
+        expected_msg: str,
+        route_mocks,
     ):
-        """IntegrityError on duplicate name should return 409 with browser_name field."""
-        from src.registered_browser.routes import register_browser
+        """IntegrityError should return 409 naming the conflicting field, if any."""
+        mock_create = route_mocks["create_registered_browser_in_db"]
+        mock_get_uuid = route_mocks["get_registered_browser_by_uuid"]
+        mock_get_name = route_mocks["get_registered_browser_by_name"]
 
         mock_create.side_effect = IntegrityError(None, None, Exception("UNIQUE"))
-        mock_get_uuid.return_value = None
-        mock_get_name.return_value = Mock()  # Name exists
+        mock_get_uuid.return_value = Mock() if uuid_exists else None
+        mock_get_name.return_value = Mock() if name_exists else None
 
         db = MagicMock()
         request = self._make_request()
@@ -86,45 +89,14 @@ class TestBrowserRegistrationRaceConditions:
             register_browser(request, self._make_http_request(), db, "0", None)
 
         assert exc_info.value.status_code == 409
-        assert exc_info.value.detail["field"] == "browser_name"
-        assert exc_info.value.detail["message"] == EXC_MSG_BROWSER_NAME_ALREADY_EXISTS
-
-    @patch("src.registered_browser.routes.create_event_log")
-    @patch("src.registered_browser.routes.get_registered_browser_by_name")
-    @patch("src.registered_browser.routes.get_registered_browser_by_uuid")
-    @patch("src.registered_browser.routes.create_registered_browser_in_db")
-    @patch("src.registered_browser.routes.validate_uuid_format", return_value=True)
-    def test_integrity_error_generic_conflict(
-        self, mock_validate_fmt, mock_create, mock_get_uuid, mock_get_name,
-        mock_event_log
-    ):
-        """IntegrityError with neither constraint found should return generic 409."""
-        from src.registered_browser.routes import register_browser
-
-        mock_create.side_effect = IntegrityError(None, None, Exception("UNIQUE"))
-        mock_get_uuid.return_value = None
-        mock_get_name.return_value = None
+        assert exc_info.value.detail["message"] == expected_msg
+        if expected_field:
+            assert exc_info.value.detail["field"] == expected_field
 
-        db = MagicMock()
-        request = self._make_request()
-
-        with pytest.raises(HTTPException) as exc_info:
-            register_browser(request, self._make_http_request(), db, "0", None)
-
-        assert exc_info.value.status_code == 409
-        assert exc_info.value.detail["message"] == "Browser registration conflict"
-
-    @patch("src.registered_browser.routes.create_event_log")
-    @patch("src.registered_browser.routes.get_registered_browser_by_name")
-    @patch("src.registered_browser.routes.get_registered_browser_by_uuid")
-    @patch("src.registered_browser.routes.create_registered_browser_in_db")
-    @patch("src.registered_browser.routes.validate_uuid_format", return_value=True)
-    def test_rollback_called_on_integrity_error(
-        self, mock_validate_fmt, mock_create, mock_get_uuid, mock_get_name,
-        mock_event_log
-    ):
+    def test_rollback_called_on_integrity_error(self, route_mocks):
         """Database session should be rolled back when IntegrityError occurs."""
-        from src.registered_browser.routes import register_browser
+        mock_create = route_mocks["create_registered_browser_in_db"]
+        mock_get_uuid = route_mocks["get_registered_browser_by_uuid"]
 
         mock_create.side_effect = IntegrityError(None, None, Exception("UNIQUE"))
         mock_get_uuid.return_value = Mock()
@@ -137,17 +109,11 @@ class TestBrowserRegistrationRaceConditions:
 
         db.rollback.assert_called_once()
 
-    @patch("src.registered_browser.routes.create_event_log")
-    @patch("src.registered_browser.routes.get_registered_browser_by_name")
-    @patch("src.registered_browser.routes.get_registered_browser_by_uuid")
-    @patch("src.registered_browser.routes.create_registered_browser_in_db")
-    @patch("src.registered_browser.routes.validate_uuid_format", return_value=True)
-    def test_successful_creation_no_integrity_handling(
-        self, mock_validate_fmt, mock_create, mock_get_uuid, mock_get_name,
-        mock_event_log
-    ):
+    def test_successful_creation_no_integrity_handling(self, route_mocks):
         """Successful creation should not trigger any IntegrityError handling."""
-        from src.registered_browser.routes import register_browser
+        mock_create = route_mocks["create_registered_browser_in_db"]
+        mock_get_uuid = route_mocks["get_registered_browser_by_uuid"]
+        mock_get_name = route_mocks["get_registered_browser_by_name"]
 
         mock_browser = Mock()
         mock_browser.id = 1
@@ -166,6 +132,48 @@ class TestBrowserRegistrationRaceConditions:
         db.rollback.assert_not_called()
 
 
+def _mock_httpx_client(response):
+    """Build an httpx.Client stand-in whose POST returns the response.
+
+    A plain Mock with explicit __enter__/__exit__ is enough for the
+    `with httpx.Client() as client` block in the route.
+    """
+    client = Mock()
+    client.__enter__ = Mock(return_value=client)
+    client.__exit__ = Mock(return_value=False)
+    client.post.return_value = response
+    return client
+
+
+@pytest.fixture
+def license_route_mocks():
+    """Patch the activation route's collaborators.
+
+    Defaults describe a first-time activation: no license exists locally
+    or is active, and the key passes format checks. Tests adjust the
+    returned mocks for their scenario.
+    """
+    with patch.multiple(
+        "src.license.routes",
+        create_event_log=DEFAULT,
+        set_license_activated=DEFAULT,
+        create_license_in_db=DEFAULT,
+        reactivate_license_in_db=DEFAULT,
+        deactivate_all_licenses=DEFAULT,
+        get_active_license=DEFAULT,
+        get_machine_id=DEFAULT,
+        get_license_by_key=DEFAULT,
+        normalize_license_key=DEFAULT,
+        validate_license_key_format=DEFAULT,
+    ) as mocks:
+        mocks["get_active_license"].return_value = None
+        mocks["get_machine_id"].return_value = "test-machine"
+        mocks["get_license_by_key"].return_value = None
+        mocks["normalize_license_key"].return_value = "ab" * 64
+        mocks["validate_license_key_format"].return_value = True
+        yield mocks
+
+
 class TestLicenseActivationRaceConditions:
     """Tests for race condition handling in license activation.
 
@@ -173,19 +181,13 @@ class TestLicenseActivationRaceConditions:
     a non-atomic deactivate-then-activate sequence.
     """
 
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.validate_license_key_format", return_value=True)
-    @patch("src.license.routes.normalize_license_key", return_value="ab" * 64)
-    @patch("src.license.routes.get_license_by_key")
     def test_active_license_returned_without_server_call(
-        self, mock_get_by_key, mock_normalize, mock_validate_fmt, mock_event_log
+        self, license_route_mocks
     ):
         """If license is already active locally, skip license server call."""
-        from src.license.routes import activate_license
-
         mock_license = Mock()
         mock_license.is_active = True
-        mock_get_by_key.return_value = mock_license
+        license_route_mocks["get_license_by_key"].return_value = mock_license
 
         request = Mock()
         request.license_key = "ab" * 64
@@ -197,26 +199,10 @@ class TestLicenseActivationRaceConditions:
         assert result == mock_license
         mock_httpx.Client.assert_not_called()
 
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.set_license_activated")
-    @patch("src.license.routes.create_license_in_db")
-    @patch("src.license.routes.deactivate_all_licenses")
-    @patch("src.license.routes.get_active_license", return_value=None)
-    @patch("src.license.routes.get_machine_id", return_value="test-machine")
-    @patch("src.license.routes.get_license_by_key", return_value=None)
-    @patch("src.license.routes.normalize_license_key", return_value="ab" * 64)
-    @patch("src.license.routes.validate_license_key_format", return_value=True)
-    def test_deactivate_called_before_create(
-        self, mock_validate_fmt, mock_normalize, mock_get_by_key,
-        mock_machine_id, mock_get_active, mock_deactivate, mock_create,
-        mock_set_activated, mock_event_log
-    ):
+    def test_deactivate_called_before_create(self, license_route_mocks):
         """deactivate_all_licenses must be called before create_license_in_db."""
-        from src.license.routes import activate_license
-
         mock_new_license = Mock()
         mock_new_license.license_key = "ab" * 64
-        mock_create.return_value = mock_new_license
 
         # Mock the httpx response
         mock_response = Mock()
@@ -228,40 +214,27 @@ class TestLicenseActivationRaceConditions:
         db = MagicMock()
 
         call_order = []
-        mock_deactivate.side_effect = lambda *a, **k: call_order.append("deactivate")
-        mock_create.side_effect = lambda *a, **k: (call_order.append("create"), mock_new_license)[1]
+        license_route_mocks["deactivate_all_licenses"].side_effect = (
+            lambda *a, **k: call_order.append("deactivate")
+        )
+        license_route_mocks["create_license_in_db"].side_effect = (
+            lambda *a, **k: (call_order.append("create"), mock_new_license)[1]
+        )
 
         with patch("src.license.routes.httpx.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.__enter__ = Mock(return_value=mock_client)
-            mock_client.__exit__ = Mock(return_value=False)
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+            mock_client_cls.return_value = _mock_httpx_client(mock_response)
 
             activate_license(request, db, "0")
 
         assert call_order == ["deactivate", "create"]
 
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.set_license_activated")
-    @patch("src.license.routes.reactivate_license_in_db")
-    @patch("src.license.routes.deactivate_all_licenses")
-    @patch("src.license.routes.get_active_license", return_value=None)
-    @patch("src.license.routes.get_machine_id", return_value="test-machine")
-    @patch("src.license.routes.normalize_license_key", return_value="ab" * 64)
-    @patch("src.license.routes.validate_license_key_format", return_value=True)
-    def test_deactivate_called_before_reactivate(
-        self, mock_validate_fmt, mock_normalize, mock_machine_id,
-        mock_get_active, mock_deactivate, mock_reactivate,
-        mock_set_activated, mock_event_log
-    ):
+    def test_deactivate_called_before_reactivate(self, license_route_mocks):
         """deactivate_all_licenses must be called before reactivate_license_in_db."""
-        from src.license.routes import activate_license
-
         # Existing inactive license triggers reactivation path
         existing = Mock()
         existing.is_active = False
         existing.license_key = "ab" * 64
+        license_route_mocks["get_license_by_key"].return_value = existing
 
         mock_reactivated = Mock()
         mock_reactivated.license_key = "ab" * 64
@@ -275,41 +248,31 @@ class TestLicenseActivationRaceConditions:
         db = MagicMock()
 
         call_order = []
-        mock_deactivate.side_effect = lambda *a, **k: call_order.append("deactivate")
-        mock_reactivate.side_effect = lambda *a, **k: (call_order.append("reactivate"), mock_reactivated)[1]
+        license_route_mocks["deactivate_all_licenses"].side_effect = (
+            lambda *a, **k: call_order.append("deactivate")
+        )
+        license_route_mocks["reactivate_license_in_db"].side_effect = (
+            lambda *a, **k: (
+                call_order.append("reactivate"), mock_reactivated
+            )[1]
+        )
 
-        with patch("src.license.routes.get_license_by_key", return_value=existing):
-            with patch("src.license.routes.httpx.Client") as mock_client_cls:
-                mock_client = MagicMock()
-                mock_client.__enter__ = Mock(return_value=mock_client)
-                mock_client.__exit__ = Mock(return_value=False)
-                mock_client.post.return_value = mock_response
-                mock_client_cls.return_value = mock_client
+        with patch("src.license.routes.httpx.Client") as mock_client_cls:
+            mock_client_cls.return_value = _mock_httpx_client(mock_response)
 
-                activate_license(request, db, "0")
+            activate_license(request, db, "0")
 
         assert call_order == ["deactivate", "reactivate"]
 
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.set_license_activated")
-    @patch("src.license.routes.create_license_in_db")
-    @patch("src.license.routes.deactivate_all_licenses")
-    @patch("src.license.routes.get_active_license", return_value=None)
-    @patch("src.license.routes.get_machine_id", return_value="test-machine")
-    @patch("src.license.routes.get_license_by_key", return_value=None)
-    @patch("src.license.routes.normalize_license_key", return_value="ab" * 64)
-    @patch("src.license.routes.validate_license_key_format", return_value=True)
     def test_set_license_activated_called_after_create(
-        self, mock_validate_fmt, mock_normalize, mock_get_by_key,
-        mock_machine_id, mock_get_active, mock_deactivate, mock_create,
-        mock_set_activated, mock_event_log
+        self, license_route_mocks
     ):
         """set_license_activated(True) must be called after license is created."""
-        from src.license.routes import activate_license
-
         mock_new_license = Mock()
         mock_new_license.license_key = "ab" * 64
-        mock_create.return_value = mock_new_license
+        license_route_mocks["create_license_in_db"].return_value = (
+            mock_new_license
+        )
 
         mock_response = Mock()
         mock_response.status_code = 200
@@ -320,58 +283,34 @@ class TestLicenseActivationRaceConditions:
         db = MagicMock()
 
         with patch("src.license.routes.httpx.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.__enter__ = Mock(return_value=mock_client)
-            mock_client.__exit__ = Mock(return_value=False)
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+            mock_client_cls.return_value = _mock_httpx_client(mock_response)
 
             activate_license(request, db, "0")
 
-        mock_set_activated.assert_called_once_with(True)
+        license_route_mocks["set_license_activated"].assert_called_once_with(
+            True
+        )
 
 
 class TestLicenseActivationIntegrityError:
     """Tests for IntegrityError handling in license activation."""
 
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.set_license_activated")
-    @patch("src.license.routes.create_license_in_db")
-    @patch("src.license.routes.deactivate_all_licenses")
-    @patch(
-        "src.license.routes.get_active_license",
-        return_value=None,
-    )
-    @patch(
-        "src.license.routes.get_machine_id",
-        return_value="test-machine",
-    )
-    @patch(
-        "src.license.routes.normalize_license_key",
-        return_value="ab" * 64,
-    )
-    @patch(
-        "src.license.routes.validate_license_key_format",
-        return_value=True,
-    )
     def test_integrity_error_returns_existing_license(
-        self, mock_validate_fmt, mock_normalize,
-        mock_machine_id, mock_get_active,
-        mock_deactivate, mock_create,
-        mock_set_activated, mock_event_log
+        self, license_route_mocks
     ):
         """IntegrityError during create should return
         existing active license."""
-        from src.license.routes import activate_license
-
-        mock_create.side_effect = IntegrityError(
-            None, None, Exception("UNIQUE")
+        license_route_mocks["create_license_in_db"].side_effect = (
+            IntegrityError(None, None, Exception("UNIQUE"))
         )
 
         # After rollback, the existing license is found
         existing = Mock()
         existing.is_active = True
         existing.license_key = "ab" * 64
+        license_route_mocks["get_license_by_key"].side_effect = [
+            None, existing,
+        ]
 
         mock_response = Mock()
         mock_response.status_code = 200
@@ -384,66 +323,27 @@ class TestLicenseActivationIntegrityError:
         db = MagicMock()
 
         with patch(
-            "src.license.routes.get_license_by_key"
-        ) as mock_get_by_key:
-            mock_get_by_key.side_effect = [
-                None, existing,
-            ]
-            with patch(
-                "src.license.routes.httpx.Client"
-            ) as mock_client_cls:
-                mock_client = MagicMock()
-                mock_client.__enter__ = Mock(
-                    return_value=mock_client
-                )
-                mock_client.__exit__ = Mock(
-                    return_value=False
-                )
-                mock_client.post.return_value = (
-                    mock_response
-                )
-                mock_client_cls.return_value = mock_client
-
-                result = activate_license(
-                    request, db, "0"
-                )
+            "src.license.routes.httpx.Client"
+        ) as mock_client_cls:
+            mock_client_cls.return_value = _mock_httpx_client(mock_response)
+
+            result = activate_license(
+                request, db, "0"
+            )
 
         assert result == existing
         db.rollback.assert_called_once()
-        mock_set_activated.assert_called_once_with(True)
-
-    @patch("src.license.routes.create_event_log")
-    @patch("src.license.routes.set_license_activated")
-    @patch("src.license.routes.create_license_in_db")
-    @patch("src.license.routes.deactivate_all_licenses")
-    @patch(
-        "src.license.routes.get_active_license",
-        return_value=None,
-    )
-    @patch(
-        "src.license.routes.get_machine_id",
-        return_value="test-machine",
-    )
-    @patch(
-        "src.license.routes.normalize_license_key",
-        return_value="ab" * 64,
-    )
-    @patch(
-        "src.license.routes.validate_license_key_format",
-        return_value=True,
-    )
+        license_route_mocks["set_license_activated"].assert_called_once_with(
+            True
+        )
+
     def test_integrity_error_no_existing_raises_409(
-        self, mock_validate_fmt, mock_normalize,
-        mock_machine_id, mock_get_active,
-        mock_deactivate, mock_create,
-        mock_set_activated, mock_event_log
+        self, license_route_mocks
     ):
         """IntegrityError with no existing active license
         should raise 409."""
-        from src.license.routes import activate_license
-
-        mock_create.side_effect = IntegrityError(
-            None, None, Exception("UNIQUE")
+        license_route_mocks["create_license_in_db"].side_effect = (
+            IntegrityError(None, None, Exception("UNIQUE"))
         )
 
         mock_response = Mock()
@@ -457,26 +357,12 @@ class TestLicenseActivationIntegrityError:
         db = MagicMock()
 
         with patch(
-            "src.license.routes.get_license_by_key",
-            return_value=None,
-        ):
-            with patch(
-                "src.license.routes.httpx.Client"
-            ) as mock_client_cls:
-                mock_client = MagicMock()
-                mock_client.__enter__ = Mock(
-                    return_value=mock_client
-                )
-                mock_client.__exit__ = Mock(
-                    return_value=False
-                )
-                mock_client.post.return_value = (
-                    mock_response
-                )
-                mock_client_cls.return_value = mock_client
-
-                with pytest.raises(HTTPException) as exc:
-                    activate_license(request, db, "0")
+            "src.license.routes.httpx.Client"
+        ) as mock_client_cls:
+            mock_client_cls.return_value = _mock_httpx_client(mock_response)
+
+            with pytest.raises(HTTPException) as exc:
+                activate_license(request, db, "0")
 
         assert exc.value.status_code == 409
         db.rollback.assert_called_once()
@@ -487,17 +373,9 @@ class TestLicenseModelConstraints:
 
     def test_license_key_has_unique_constraint(self):
         """License.license_key column should have a unique constraint."""
-        from src.license.models import License
-
-        col = License.__table__.columns["license_key"]
-        assert col.unique is True
+        assert LICENSE_COLUMNS["license_key"].unique is True
 
     def test_single_active_partial_unique_index_exists(self):
         """License model should have a partial unique index enforcing
         at most one active license at a time."""
-        from src.license.models import License
-
-        index_names = [
-            idx.name for idx in License.__table__.indexes
-        ]
-        assert "ix_licenses_single_active" in index_names
+        assert "ix_licenses_single_active" in LICENSE_INDEX_NAMES
@@ -0,0 +1,51 @@
+"""Unit tests for registered_browser repository logic that needs no DB."""
+
+import pytest
+
+from src.registered_browser.models import RegisteredBrowser
+from src.registered_browser.repository import has_active_session_conflict
+
+
+def _make_browser(active_session_fingerprint=None):
+    """Create an unsaved RegisteredBrowser with the given active session.
+
+    Args:
+        active_session_fingerprint: Fingerprint of active session.
+
+    Returns:
+        RegisteredBrowser: A new browser model instance.
+
+    """
+    return RegisteredBrowser(
+        browser_uuid="uuid-1",
+        browser_name="Browser 1",
+        active_session_fingerprint=active_session_fingerprint,
+    )
+
+
+class TestHasActiveSessionConflict:
+    """Tests for has_active_session_conflict (pure logic)."""
+
+    @pytest.mark.parametrize(
+        "active_fingerprint, fingerprint, expected",
+        [
+            (None, "some-fingerprint", False),
+            ("matching-fingerprint", "matching-fingerprint", False),
+            ("fingerprint-A", "fingerprint-B", True),
+            # Empty string active session is falsy, so no conflict
+            ("", "some-fingerprint", False),
+        ],
+        ids=[
+            "no_active_session",
+            "same_fingerprint",
+            "different_fingerprint",
+            "empty_string_session",
+        ],
+    )
+    def test_conflict(self, active_fingerprint, fingerprint, expected):
+        """Conflict only when an active session has another fingerprint."""
+        browser = _make_browser(
+            active_session_fingerprint=active_fingerprint,
+        )
+        result = has_active_session_conflict(browser, fingerprint)
+        assert result is expected
@@ -3,31 +3,69 @@
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.database import Base
 from src.registered_browser.models import RegisteredBrowser
 from src.registered_browser.repository import (
     clear_active_session,
     clear_stale_sessions,
-    has_active_session_conflict,
     start_active_session,
 )
-
-TEST_DB_URL = "sqlite:///tap_unit_test_browser.sqlite"
-engine = create_engine(TEST_DB_URL)
+from tests.conftest import enable_savepoints
+
+TIMEOUT_MINUTES = 30
+# Session ages relative to the 30 minute timeout
+FRESH_AGE = timedelta(minutes=5)
+RECENT_AGE = timedelta(minutes=10)
+STALE_AGE = timedelta(minutes=45)
+OLD_AGE = timedelta(minutes=60)
+
+TEST_DB_URL = "sqlite:///:memory:"
+# StaticPool keeps the single in-memory connection alive between sessions
+engine = create_engine(
+    TEST_DB_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
 TestSession = sessionmaker(bind=engine)
+# Needed for the per-test rollback in `db`
+enable_savepoints(engine)
 
 
-@pytest.fixture
-def db():
-    """Provide a clean database session for each test."""
+@pytest.fixture(scope="module")
+def schema():
+    """Create the schema once for the module."""
     Base.metadata.create_all(bind=engine)
-    session = TestSession()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def now():
+    """Reference time shared by a test's timestamps."""
+    return datetime.now()
+
+
+@pytest.fixture
+def db(schema):
+    """Provide a session whose commits are rolled back after each test.
+
+    The session joins an outer transaction through a SAVEPOINT, so the
+    repository's commits only release the SAVEPOINT and the schema does
+    not have to be rebuilt between tests.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestSession(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
     yield session
     session.close()
-    Base.metadata.drop_all(bind=engine)
+    transaction.rollback()
+    connection.close()
 
 
 def _make_browser(
@@ -62,170 +100,151 @@ def _make_browser(
     )
 
 
-class TestHasActiveSessionConflict:
-    """Tests for has_active_session_conflict (pure logic)."""
+def _session_columns(db, browser_uuid="uuid-1"):
+    """Read a browser's session columns straight from the database.
 
-    def test_no_active_session_returns_false(self):
-        """No conflict when browser has no active session."""
-        browser = _make_browser(
-            active_session_fingerprint=None,
-        )
-        result = has_active_session_conflict(
-            browser, "some-fingerprint"
-        )
-        assert result is False
-
-    def test_same_fingerprint_returns_false(self):
-        """No conflict when fingerprint matches active session."""
-        fp = "matching-fingerprint"
-        browser = _make_browser(
-            active_session_fingerprint=fp,
-        )
-        result = has_active_session_conflict(browser, fp)
-        assert result is False
+    Args:
+        db: Database session to query with.
+        browser_uuid: Unique identifier of the browser to read.
 
-    def test_different_fingerprint_returns_true(self):
-        """Conflict when fingerprint differs from active session."""
-        browser = _make_browser(
-            active_session_fingerprint="fingerprint-A",
-        )
-        result = has_active_session_conflict(
-            browser, "fingerprint-B"
-        )
-        assert result is True
+    Returns:
+        Row: The browser's active_session_fingerprint,
+            active_session_started and last_seen.
 
-    def test_empty_string_session_returns_false(self):
-        """Empty string active session is falsy, so no conflict."""
-        browser = _make_browser(
-            active_session_fingerprint="",
-        )
-        result = has_active_session_conflict(
-            browser, "some-fingerprint"
-        )
-        assert result is False
+    """
+    return db.execute(
+        select(
+            RegisteredBrowser.active_session_fingerprint,
+            RegisteredBrowser.active_session_started,
+            RegisteredBrowser.last_seen,
+        ).where(RegisteredBrowser.browser_uuid == browser_uuid)
+    ).one()
 
 
 class TestClearStaleSessions:
     """Tests for clear_stale_sessions (requires DB)."""
 
-    def test_clears_sessions_older_than_timeout(self, db):
+    def test_clears_sessions_older_than_timeout(self, db, now):
         """Sessions older than timeout should be cleared."""
-        stale_time = datetime.now() - timedelta(minutes=45)
+        stale_time = now - STALE_AGE
         browser = _make_browser(
             active_session_fingerprint="fp-stale",
             active_session_started=stale_time,
             last_seen=stale_time,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint is None
-        assert browser.active_session_started is None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint is None
+        assert row.active_session_started is None
 
-    def test_keeps_sessions_within_timeout(self, db):
+    def test_keeps_sessions_within_timeout(self, db, now):
         """Sessions within the timeout window should be kept."""
-        recent_time = datetime.now() - timedelta(minutes=10)
+        recent_time = now - RECENT_AGE
         browser = _make_browser(
             active_session_fingerprint="fp-recent",
             active_session_started=recent_time,
             last_seen=recent_time,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint == "fp-recent"
-        assert browser.active_session_started is not None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint == "fp-recent"
+        assert row.active_session_started is not None
 
-    def test_handles_no_stale_sessions(self, db):
+    def test_handles_no_stale_sessions(self, db, now):
         """Should succeed when there are no stale sessions."""
-        recent_time = datetime.now() - timedelta(minutes=5)
+        recent_time = now - FRESH_AGE
         browser = _make_browser(
             active_session_fingerprint="fp-active",
             active_session_started=recent_time,
             last_seen=recent_time,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint == "fp-active"
+        row = _session_columns(db)
+        assert row.active_session_fingerprint == "fp-active"
 
     def test_handles_empty_database(self, db):
         """Should succeed when the database has no browsers."""
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-    def test_clears_only_stale_sessions(self, db):
+    def test_clears_only_stale_sessions(self, db, now):
         """Only stale sessions are cleared; fresh ones are kept."""
-        stale_time = datetime.now() - timedelta(minutes=60)
-        fresh_time = datetime.now() - timedelta(minutes=5)
-
-        stale_browser = _make_browser(
-            browser_uuid="uuid-stale",
-            browser_name="Stale Browser",
-            active_session_fingerprint="fp-stale",
-            active_session_started=stale_time,
-            last_seen=stale_time,
-        )
-        fresh_browser = _make_browser(
-            browser_uuid="uuid-fresh",
-            browser_name="Fresh Browser",
-            active_session_fingerprint="fp-fresh",
-            active_session_started=fresh_time,
-            last_seen=fresh_time,
+        stale_time = now - OLD_AGE
+        fresh_time = now - FRESH_AGE
+
+        db.execute(
+            insert(RegisteredBrowser),
+            [
+                dict(
+                    browser_uuid="uuid-stale",
+                    browser_name="Stale Browser",
+                    active_session_fingerprint="fp-stale",
+                    active_session_started=stale_time,
+                    last_seen=stale_time,
+                ),
+                dict(
+                    browser_uuid="uuid-fresh",
+                    browser_name="Fresh Browser",
+                    active_session_fingerprint="fp-fresh",
+                    active_session_started=fresh_time,
+                    last_seen=fresh_time,
+                ),
+            ],
         )
-        db.add_all([stale_browser, fresh_browser])
-        db.commit()
 
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-        db.refresh(stale_browser)
-        db.refresh(fresh_browser)
+        stale_browser = _session_columns(db, "uuid-stale")
+        fresh_browser = _session_columns(db, "uuid-fresh")
         assert stale_browser.active_session_fingerprint is None
         assert stale_browser.active_session_started is None
         assert fresh_browser.active_session_fingerprint == "fp-fresh"
         assert fresh_browser.active_session_started is not None
 
-    def test_ignores_browsers_without_active_session(self, db):
+    def test_ignores_browsers_without_active_session(self, db, now):
         """Browsers with no active session should be untouched."""
-        old_time = datetime.now() - timedelta(minutes=60)
+        old_time = now - OLD_AGE
         browser = _make_browser(
             active_session_fingerprint=None,
             active_session_started=None,
             last_seen=old_time,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
-        clear_stale_sessions(db, timeout_minutes=30)
+        clear_stale_sessions(db, timeout_minutes=TIMEOUT_MINUTES)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint is None
-        assert browser.active_session_started is None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint is None
+        assert row.active_session_started is None
 
-    def test_custom_timeout_value(self, db):
+    def test_custom_timeout_value(self, db, now):
         """Custom timeout of 10 minutes should clear 15-min-old."""
-        old_time = datetime.now() - timedelta(minutes=15)
+        old_time = now - timedelta(minutes=15)
         browser = _make_browser(
             active_session_fingerprint="fp-old",
             active_session_started=old_time,
             last_seen=old_time,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
         clear_stale_sessions(db, timeout_minutes=10)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint is None
-        assert browser.active_session_started is None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint is None
+        assert row.active_session_started is None
 
 
 class TestStartActiveSession:
@@ -235,81 +254,80 @@ class TestStartActiveSession:
         """Should set fingerprint, started, and last_seen."""
         browser = _make_browser()
         db.add(browser)
-        db.commit()
+        db.flush()
 
         before = datetime.now()
         start_active_session(browser, "fp-new", db)
         after = datetime.now()
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint == "fp-new"
-        assert browser.active_session_started is not None
-        assert before <= browser.active_session_started <= after
-        assert before <= browser.last_seen <= after
+        row = _session_columns(db)
+        assert row.active_session_fingerprint == "fp-new"
+        assert row.active_session_started is not None
+        assert before <= row.active_session_started <= after
+        assert before <= row.last_seen <= after
 
     def test_persists_to_database(self, db):
         """Session data should persist after commit."""
         browser = _make_browser()
         db.add(browser)
         db.commit()
-        browser_id = browser.id
 
         start_active_session(browser, "fp-persist", db)
 
-        fetched = db.get(RegisteredBrowser, browser_id)
-        assert fetched.active_session_fingerprint == "fp-persist"
-        assert fetched.active_session_started is not None
+        # Expiring forces the next attribute access to reload from the DB
+        db.expire(browser)
+        assert browser.active_session_fingerprint == "fp-persist"
+        assert browser.active_session_started is not None
 
-    def test_overwrites_existing_session(self, db):
+    def test_overwrites_existing_session(self, db, now):
         """Starting a new session should overwrite the old one."""
         browser = _make_browser(
             active_session_fingerprint="fp-old",
             active_session_started=(
-                datetime.now() - timedelta(hours=1)
+                now - OLD_AGE
             ),
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
         start_active_session(browser, "fp-new", db)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint == "fp-new"
+        row = _session_columns(db)
+        assert row.active_session_fingerprint == "fp-new"
 
 
 class TestClearActiveSession:
     """Tests for clear_active_session (requires DB)."""
 
-    def test_clears_session_fields(self, db):
+    def test_clears_session_fields(self, db, now):
         """Should set fingerprint and started to None."""
         browser = _make_browser(
             active_session_fingerprint="fp-active",
-            active_session_started=datetime.now(),
+            active_session_started=now,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
         clear_active_session(browser, db)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint is None
-        assert browser.active_session_started is None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint is None
+        assert row.active_session_started is None
 
-    def test_persists_to_database(self, db):
+    def test_persists_to_database(self, db, now):
         """Cleared session should persist after commit."""
         browser = _make_browser(
             active_session_fingerprint="fp-to-clear",
-            active_session_started=datetime.now(),
+            active_session_started=now,
         )
         db.add(browser)
         db.commit()
-        browser_id = browser.id
 
         clear_active_session(browser, db)
 
-        fetched = db.get(RegisteredBrowser, browser_id)
-        assert fetched.active_session_fingerprint is None
-        assert fetched.active_session_started is None
+        db.expire(browser)
+        assert browser.active_session_fingerprint is None
+        assert browser.active_session_started is None
 
     def test_clearing_already_empty_session(self, db):
         """Clearing a browser with no active session should succeed."""
@@ -318,10 +336,10 @@ class TestClearActiveSession:
             active_session_started=None,
         )
         db.add(browser)
-        db.commit()
+        db.flush()
 
         clear_active_session(browser, db)
 
-        db.refresh(browser)
-        assert browser.active_session_fingerprint is None
-        assert browser.active_session_started is None
+        row = _session_columns(db)
+        assert row.active_session_fingerprint is None
+        assert row.active_session_started is None
@@ -1,10 +1,18 @@
 """Unit tests for report service business logic."""
 
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+from src.database import Base
+from src.holiday_group.models import Holiday, HolidayGroup
 from src.report.constants import STANDARD_HOURS_PER_WEEK
 from src.report.schemas import EmployeeSummary
 from src.report.service import (
@@ -13,7 +21,27 @@ from src.report.service import (
     _get_holidays_for_employee,
     _organize_entries_by_month,
 )
-from src.timeclock.models import TimeclockEntry
+
+SHIFT_START = time(9, 0)
+SHIFT_END = time(17, 0)
+
+
+@dataclass(slots=True)
+class MockEntry:
+    """Mock TimeclockEntry model for testing."""
+
+    id: int
+    badge_number: str
+    clock_in: datetime
+    clock_out: datetime | None = None
+
+
+@dataclass(slots=True)
+class MockHoliday:
+    """Mock Holiday model for testing."""
+
+    start_date: date
+    end_date: date
 
 
 def create_mock_entry(
@@ -21,22 +49,59 @@ def create_mock_entry(
     badge_number: str,
     clock_in: datetime,
     clock_out: datetime | None = None,
-) -> TimeclockEntry:
+) -> MockEntry:
     """Create a mock timeclock entry for testing."""
-    entry = Mock(spec=TimeclockEntry)
-    entry.id = id
-    entry.badge_number = badge_number
-    entry.clock_in = clock_in
-    entry.clock_out = clock_out
-    return entry
+    return MockEntry(id, badge_number, clock_in, clock_out)
 
 
-def create_mock_holiday(start_date: date, end_date: date):
+def create_mock_holiday(start_date: date, end_date: date) -> MockHoliday:
     """Create a mock holiday for testing."""
-    holiday = Mock()
-    holiday.start_date = start_date
-    holiday.end_date = end_date
-    return holiday
+    return MockHoliday(start_date, end_date)
+
+
+def create_weekday_entries(
+    monday: date, clock_out: time, first_id: int = 1
+) -> list[MockEntry]:
+    """Create Mon-Fri entries clocking in at 9:00 for testing."""
+    weekdays = [monday + timedelta(days=i) for i in range(5)]
+    return [
+        create_mock_entry(
+            first_id + i,
+            "123",
+            datetime.combine(day, SHIFT_START),
+            datetime.combine(day, clock_out),
+        )
+        for i, day in enumerate(weekdays)
+    ]
+
+
+@contextmanager
+def count_queries(bind):
+    """Collect the SQL statements executed on an engine.
+
+    Args:
+        bind: Engine to listen on.
+
+    Yields:
+        list[str]: Statements executed while the context is open.
+
+    """
+    queries = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield queries
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="module")
+def monfri_8h() -> tuple[MockEntry, ...]:
+    """Mon-Fri of the week of 2024-01-15, 8 hours each (40 hours)."""
+    return tuple(create_weekday_entries(date(2024, 1, 15), SHIFT_END))
 
 
 class TestCalculataperiodHours:
@@ -235,46 +300,27 @@ class TestCalculateEmployeeSummary:
         assert summary.overtime_hours == 0.0
         assert summary.days_worked == 1
 
-    def test_calculate_summary_single_week_exactly_40(self):
+    def test_calculate_summary_single_week_exactly_40(self, monfri_8h):
         """Test calculating summary for exactly 40 hours in one week."""
-        monday = date(2024, 1, 15)
-        entries = [
-            create_mock_entry(
-                i + 1,
-                "123",
-                datetime.combine(monday + timedelta(days=i), time(9, 0)),
-                datetime.combine(monday + timedelta(days=i), time(17, 0)),
-            )
-            for i in range(5)  # Mon-Fri, 8 hours each
-        ]
-
-        summary = _calculate_employee_summary(entries, [])
+        summary = _calculate_employee_summary(list(monfri_8h), [])
 
         assert summary.total_hours == 40.0
         assert summary.regular_hours == 40.0
         assert summary.overtime_hours == 0.0
         assert summary.days_worked == 5
 
-    def test_calculate_summary_single_week_with_overtime(self):
+    def test_calculate_summary_single_week_with_overtime(self, monfri_8h):
         """Test calculating summary with overtime (over 40 hours/week)."""
-        monday = date(2024, 1, 15)
+        saturday = date(2024, 1, 20)
         entries = [
             # Mon-Fri: 8 hours each = 40 hours
-            *[
-                create_mock_entry(
-                    i + 1,
-                    "123",
-                    datetime.combine(monday + timedelta(days=i), time(9, 0)),
-                    datetime.combine(monday + timedelta(days=i), time(17, 0)),
-                )
-                for i in range(5)
-            ],
+            *monfri_8h,
             # Saturday: 5 hours overtime
             create_mock_entry(
                 6,
                 "123",
-                datetime.combine(monday + timedelta(days=5), time(9, 0)),
-                datetime.combine(monday + timedelta(days=5), time(14, 0)),
+                datetime.combine(saturday, SHIFT_START),
+                datetime.combine(saturday, time(14, 0)),
             ),
         ]
 
@@ -291,34 +337,10 @@ class TestCalculateEmployeeSummary:
         week2_monday = week1_monday + timedelta(days=7)
 
         entries = [
-            # Week 1: 35 hours (no overtime)
-            *[
-                create_mock_entry(
-                    i + 1,
-                    "123",
-                    datetime.combine(
-                        week1_monday + timedelta(days=i), time(9, 0)
-                    ),
-                    datetime.combine(
-                        week1_monday + timedelta(days=i), time(16, 0)
-                    ),
-                )
-                for i in range(5)  # 7 hours each
-            ],
-            # Week 2: 45 hours (5 hours overtime)
-            *[
-                create_mock_entry(
-                    i + 6,
-                    "123",
-                    datetime.combine(
-                        week2_monday + timedelta(days=i), time(9, 0)
-                    ),
-                    datetime.combine(
-                        week2_monday + timedelta(days=i), time(18, 0)
-                    ),
-                )
-                for i in range(5)  # 9 hours each
-            ],
+            # Week 1: 7 hours each = 35 hours (no overtime)
+            *create_weekday_entries(week1_monday, time(16, 0)),
+            # Week 2: 9 hours each = 45 hours (5 hours overtime)
+            *create_weekday_entries(week2_monday, time(18, 0), first_id=6),
         ]
 
         summary = _calculate_employee_summary(entries, [])
@@ -377,6 +399,25 @@ class TestCalculateEmployeeSummary:
         assert summary.total_hours == 16.0
         assert summary.holiday_hours == 16.0  # Both days are holidays
 
+    def test_calculate_summary_year_long_holiday(self):
+        """Test calculating summary with a holiday spanning a full year."""
+        holiday = create_mock_holiday(date(2024, 1, 1), date(2024, 12, 31))
+        entries = [
+            entry
+            for week in range(50)
+            for entry in create_weekday_entries(
+                date(2024, 1, 1) + timedelta(weeks=week),
+                SHIFT_END,
+                first_id=week * 5 + 1,
+            )
+        ]
+
+        summary = _calculate_employee_summary(entries, [holiday])
+
+        assert summary.days_worked == 250
+        assert summary.total_hours == 2000.0
+        assert summary.holiday_hours == 2000.0
+
     def test_calculate_summary_multiple_entries_same_day(self):
         """Test calculating summary with multiple entries on same day."""
         entries = [
@@ -429,14 +470,14 @@ class TestCalculateEmployeeSummary:
             create_mock_entry(
                 1,
                 "123",
-                datetime.combine(sunday, time(9, 0)),
+                datetime.combine(sunday, SHIFT_START),
                 datetime.combine(sunday, time(19, 0)),
             ),
             # Monday: 10 hours
             create_mock_entry(
                 2,
                 "123",
-                datetime.combine(monday, time(9, 0)),
+                datetime.combine(monday, SHIFT_START),
                 datetime.combine(monday, time(19, 0)),
             ),
         ]
@@ -457,7 +498,7 @@ class TestGetHolidaysForEmployee:
         employee = Mock()
         employee.holiday_group_id = None
 
-        db = MagicMock()
+        db = SimpleNamespace(scalars=Mock())
 
         holidays = _get_holidays_for_employee(
             employee, date(2024, 1, 1), date(2024, 1, 31), db
@@ -474,8 +515,13 @@ class TestGetHolidaysForEmployee:
         mock_holiday = create_mock_holiday(
             date(2024, 1, 15), date(2024, 1, 15)
         )
-        db = MagicMock()
-        db.scalars.return_value.all.return_value = [mock_holiday]
+        db = SimpleNamespace(
+            scalars=Mock(
+                return_value=SimpleNamespace(
+                    all=Mock(return_value=[mock_holiday])
+                )
+            )
+        )
 
         holidays = _get_holidays_for_employee(
             employee, date(2024, 1, 1), date(2024, 1, 31), db
@@ -484,3 +530,45 @@ class TestGetHolidaysForEmployee:
         assert len(holidays) == 1
         assert holidays[0] == mock_holiday
         db.scalars.assert_called_once()
+
+    def test_get_holidays_single_query(self, monfri_8h):
+        """Test that loading and using holidays takes a single query."""
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        employee = Mock()
+        employee.holiday_group_id = 1
+
+        with Session(engine) as db:
+            db.add(
+                HolidayGroup(
+                    id=1,
+                    name="Holidays",
+                    holidays=[
+                        Holiday(
+                            name=f"Holiday {day}",
+                            start_date=date(2024, 1, day),
+                            end_date=date(2024, 1, day),
+                        )
+                        for day in (1, 15, 29)
+                    ],
+                )
+            )
+            db.commit()
+            db.expunge_all()
+
+            with count_queries(engine) as queries:
+                holidays = _get_holidays_for_employee(
+                    employee, date(2024, 1, 1), date(2024, 1, 31), db
+                )
+                summary = _calculate_employee_summary(
+                    list(monfri_8h), holidays
+                )
+
+        engine.dispose()
+        assert len(holidays) == 3
+        assert summary.holiday_hours == 8.0
+        assert len(queries) == 1
@@ -10,20 +10,31 @@ from src.holiday_group.schemas import HolidayBase, HolidayGroupBase
 from src.system_settings.schemas import SystemSettingsBase
 from src.timeclock.schemas import TimeclockEntryBase, TimeclockEntryCreate
 
+# Timestamps on one day for the timeclock entry validators
+MORNING = datetime(2025, 1, 15, 8, 0, 0)
+EVENING = datetime(2025, 1, 15, 17, 0, 0)
+
+# Valid recurring fixed holiday that the HolidayBase tests override
+CHRISTMAS_FIXED = {
+    "name": "Christmas Day",
+    "start_date": date(2025, 12, 25),
+    "end_date": date(2025, 12, 25),
+    "is_recurring": True,
+    "recurrence_type": "fixed",
+    "recurrence_month": 12,
+    "recurrence_day": 25,
+}
+
+def assert_http_400(schema, **fields):
+    """Assert that building the schema from the fields raises a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        schema(**fields)
+    assert exc_info.value.status_code == 400
+
 
 class TestHolidayBaseValidator:
     """Tests for HolidayBase.check_values model validator."""
 
-    def test_start_date_after_end_date_raises(self):
-        """end_date before start_date raises HTTPException 400."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 12, 26),
-                end_date=date(2025, 12, 25),
-            )
-        assert exc_info.value.status_code == 400
-
     def test_start_date_equals_end_date_passes(self):
         """start_date equal to end_date is valid."""
         holiday = HolidayBase(
@@ -42,88 +53,44 @@ class TestHolidayBaseValidator:
         )
         assert holiday.start_date < holiday.end_date
 
-    def test_recurring_invalid_recurrence_type_raises(self):
-        """is_recurring=True with bad recurrence_type raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 12, 25),
-                end_date=date(2025, 12, 25),
-                is_recurring=True,
-                recurrence_type="weekly",
-                recurrence_month=12,
-            )
-        assert exc_info.value.status_code == 400
-
-    def test_recurring_none_recurrence_type_raises(self):
-        """is_recurring=True with no recurrence_type raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 12, 25),
-                end_date=date(2025, 12, 25),
-                is_recurring=True,
-                recurrence_type=None,
-                recurrence_month=12,
-            )
-        assert exc_info.value.status_code == 400
-
-    def test_recurring_missing_recurrence_month_raises(self):
-        """is_recurring=True without recurrence_month raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 12, 25),
-                end_date=date(2025, 12, 25),
-                is_recurring=True,
-                recurrence_type="fixed",
-                recurrence_month=None,
-            )
-        assert exc_info.value.status_code == 400
-
-    def test_recurring_fixed_missing_day_raises(self):
-        """Fixed recurrence without recurrence_day raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 12, 25),
-                end_date=date(2025, 12, 25),
-                is_recurring=True,
-                recurrence_type="fixed",
-                recurrence_month=12,
-                recurrence_day=None,
-            )
-        assert exc_info.value.status_code == 400
-
-    def test_recurring_relative_missing_week_raises(self):
-        """Relative recurrence without recurrence_week raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 11, 27),
-                end_date=date(2025, 11, 27),
-                is_recurring=True,
-                recurrence_type="relative",
-                recurrence_month=11,
-                recurrence_week=None,
-                recurrence_weekday=3,
-            )
-        assert exc_info.value.status_code == 400
-
-    def test_recurring_relative_missing_weekday_raises(self):
-        """Relative recurrence without recurrence_weekday raises."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayBase(
-                name="Test Holiday",
-                start_date=date(2025, 11, 27),
-                end_date=date(2025, 11, 27),
-                is_recurring=True,
-                recurrence_type="relative",
-                recurrence_month=11,
-                recurrence_week=4,
-                recurrence_weekday=None,
-            )
-        assert exc_info.value.status_code == 400
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"start_date": date(2025, 12, 26)},
+            {"recurrence_type": "weekly", "recurrence_month": 12},
+            {"recurrence_type": None, "recurrence_month": 12},
+            {"recurrence_type": "fixed", "recurrence_month": None},
+            {
+                "recurrence_type": "fixed",
+                "recurrence_month": 12,
+                "recurrence_day": None,
+            },
+            {
+                "recurrence_type": "relative",
+                "recurrence_month": 11,
+                "recurrence_week": None,
+                "recurrence_weekday": 3,
+            },
+            {
+                "recurrence_type": "relative",
+                "recurrence_month": 11,
+                "recurrence_week": 4,
+                "recurrence_weekday": None,
+            },
+        ],
+        ids=[
+            "start_date_after_end_date",
+            "invalid_recurrence_type",
+            "none_recurrence_type",
+            "missing_recurrence_month",
+            "fixed_missing_day",
+            "relative_missing_week",
+            "relative_missing_weekday",
+        ],
+    )
+    def test_invalid_holiday_raises(self, fields):
+        """Inverted dates or incomplete recurrence fields raise 400."""
+        assert_http_400(HolidayBase, **(CHRISTMAS_FIXED | fields))
 
     def test_non_recurring_without_recurrence_fields_passes(self):
         """Non-recurring holiday without recurrence fields is valid."""
@@ -139,15 +106,7 @@ class TestHolidayBaseValidator:
 
     def test_valid_recurring_fixed_holiday_passes(self):
         """Valid recurring fixed holiday passes validation."""
-        holiday = HolidayBase(
-            name="Christmas Day",
-            start_date=date(2025, 12, 25),
-            end_date=date(2025, 12, 25),
-            is_recurring=True,
-            recurrence_type="fixed",
-            recurrence_month=12,
-            recurrence_day=25,
-        )
+        holiday = HolidayBase(**CHRISTMAS_FIXED)
         assert holiday.is_recurring is True
         assert holiday.recurrence_type == "fixed"
         assert holiday.recurrence_month == 12
@@ -174,44 +133,58 @@ class TestHolidayBaseValidator:
 class TestHolidayGroupBaseValidator:
     """Tests for HolidayGroupBase.check_values duplicate check."""
 
-    def test_unique_holiday_names_passes(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def new_year_holiday(cls):
+        """New Year holiday shared by the class's tests."""
+        return HolidayBase(
+            name="New Year",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 1),
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def independence_day_holiday(cls):
+        """Independence Day holiday shared by the class's tests."""
+        return HolidayBase(
+            name="Independence Day",
+            start_date=date(2025, 7, 4),
+            end_date=date(2025, 7, 4),
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def christmas_holidays(cls):
+        """Two holidays named Christmas on different dates."""
+        return [
+            HolidayBase(
+                name="Christmas",
+                start_date=date(2025, 12, 25),
+                end_date=date(2025, 12, 25),
+            ),
+            HolidayBase(
+                name="Christmas",
+                start_date=date(2025, 12, 26),
+                end_date=date(2025, 12, 26),
+            ),
+        ]
+
+    def test_unique_holiday_names_passes(
+        self, new_year_holiday, independence_day_holiday
+    ):
         """List with unique holiday names passes validation."""
         group = HolidayGroupBase(
             name="US Holidays",
-            holidays=[
-                HolidayBase(
-                    name="New Year",
-                    start_date=date(2025, 1, 1),
-                    end_date=date(2025, 1, 1),
-                ),
-                HolidayBase(
-                    name="Independence Day",
-                    start_date=date(2025, 7, 4),
-                    end_date=date(2025, 7, 4),
-                ),
-            ],
+            holidays=[new_year_holiday, independence_day_holiday],
         )
         assert len(group.holidays) == 2
 
-    def test_duplicate_holiday_names_raises(self):
+    def test_duplicate_holiday_names_raises(self, christmas_holidays):
         """Duplicate holiday names in the list raises HTTPException."""
-        with pytest.raises(HTTPException) as exc_info:
-            HolidayGroupBase(
-                name="US Holidays",
-                holidays=[
-                    HolidayBase(
-                        name="Christmas",
-                        start_date=date(2025, 12, 25),
-                        end_date=date(2025, 12, 25),
-                    ),
-                    HolidayBase(
-                        name="Christmas",
-                        start_date=date(2025, 12, 26),
-                        end_date=date(2025, 12, 26),
-                    ),
-                ],
-            )
-        assert exc_info.value.status_code == 400
+        assert_http_400(
+            HolidayGroupBase, name="US Holidays", holidays=christmas_holidays
+        )
 
 
 class TestTimeclockEntryCreateValidator:
@@ -221,36 +194,34 @@ class TestTimeclockEntryCreateValidator:
         """clock_out >= clock_in passes validation."""
         entry = TimeclockEntryCreate(
             badge_number="EMP001",
-            clock_in=datetime(2025, 1, 15, 8, 0, 0),
-            clock_out=datetime(2025, 1, 15, 17, 0, 0),
+            clock_in=MORNING,
+            clock_out=EVENING,
         )
         assert entry.clock_out > entry.clock_in
 
     def test_clock_out_equals_clock_in_passes(self):
         """clock_out equal to clock_in passes validation."""
-        ts = datetime(2025, 1, 15, 8, 0, 0)
         entry = TimeclockEntryCreate(
             badge_number="EMP001",
-            clock_in=ts,
-            clock_out=ts,
+            clock_in=MORNING,
+            clock_out=MORNING,
         )
         assert entry.clock_out == entry.clock_in
 
     def test_clock_out_before_clock_in_raises(self):
         """clock_out < clock_in raises HTTPException 400."""
-        with pytest.raises(HTTPException) as exc_info:
-            TimeclockEntryCreate(
-                badge_number="EMP001",
-                clock_in=datetime(2025, 1, 15, 17, 0, 0),
-                clock_out=datetime(2025, 1, 15, 8, 0, 0),
-            )
-        assert exc_info.value.status_code == 400
+        assert_http_400(
+            TimeclockEntryCreate,
+            badge_number="EMP001",
+            clock_in=EVENING,
+            clock_out=MORNING,
+        )
 
     def test_clock_out_none_passes(self):
         """clock_out=None passes (employee still clocked in)."""
         entry = TimeclockEntryCreate(
             badge_number="EMP001",
-            clock_in=datetime(2025, 1, 15, 8, 0, 0),
+            clock_in=MORNING,
             clock_out=None,
         )
         assert entry.clock_out is None
@@ -264,54 +235,43 @@ class TestTimeclockEntryBaseValidator:
         entry = TimeclockEntryBase(
             id=1,
             badge_number="EMP001",
-            clock_in=datetime(2025, 1, 15, 8, 0, 0),
-            clock_out=datetime(2025, 1, 15, 17, 0, 0),
+            clock_in=MORNING,
+            clock_out=EVENING,
         )
         assert entry.id == 1
         assert entry.clock_out > entry.clock_in
 
     def test_clock_out_before_clock_in_raises(self):
         """clock_out before clock_in raises HTTPException 400."""
-        with pytest.raises(HTTPException) as exc_info:
-            TimeclockEntryBase(
-                id=1,
-                badge_number="EMP001",
-                clock_in=datetime(2025, 1, 15, 17, 0, 0),
-                clock_out=datetime(2025, 1, 15, 8, 0, 0),
-            )
-        assert exc_info.value.status_code == 400
+        assert_http_400(
+            TimeclockEntryBase,
+            id=1,
+            badge_number="EMP001",
+            clock_in=EVENING,
+            clock_out=MORNING,
+        )
 
 
 class TestSystemSettingsBaseValidator:
     """Tests for SystemSettingsBase.validate_colors field validator."""
 
-    def test_valid_hex_color_uppercase_passes(self):
-        """Valid uppercase hex color passes and stays uppercase."""
-        settings = SystemSettingsBase(
-            primary_color="#1976D2",
-        )
-        assert settings.primary_color == "#1976D2"
-
-    def test_valid_hex_color_lowercase_uppercased(self):
-        """Valid lowercase hex color is converted to uppercase."""
-        settings = SystemSettingsBase(
-            primary_color="#ff9800",
-        )
-        assert settings.primary_color == "#FF9800"
-
-    def test_invalid_color_name_raises(self):
-        """Non-hex color string 'red' raises ValidationError."""
-        with pytest.raises(ValidationError):
-            SystemSettingsBase(
-                primary_color="red",
-            )
-
-    def test_invalid_short_hex_raises(self):
-        """Invalid short hex '#GGG' raises ValidationError."""
+    @pytest.mark.parametrize(
+        "color, expected",
+        [("#1976D2", "#1976D2"), ("#ff9800", "#FF9800")],
+        ids=["uppercase", "lowercase_uppercased"],
+    )
+    def test_valid_color_passes(self, color, expected):
+        """Valid hex colors pass and are stored uppercase."""
+        settings = SystemSettingsBase(primary_color=color)
+        assert settings.primary_color == expected
+
+    @pytest.mark.parametrize(
+        "color", ["red", "#GGG"], ids=["color_name", "short_hex"]
+    )
+    def test_invalid_color_raises(self, color):
+        """Non-hex color strings raise ValidationError."""
         with pytest.raises(ValidationError):
-            SystemSettingsBase(
-                primary_color="#GGG",
-            )
+            SystemSettingsBase(primary_color=color)
 
     def test_none_colors_pass(self):
         """None values for optional color fields pass through."""
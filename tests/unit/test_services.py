@@ -1,15 +1,26 @@
 """Unit tests for core service functions."""
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import jwt as pyjwt
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import HTTPException
 
+from src import services
 from src.services import (
     create_event_log,
+    decode_jwt_token,
+    encode_jwt_token,
+    generate_access_token,
+    generate_refresh_token,
     get_scopes_from_user,
     hash_password,
+    requires_license,
+    set_license_activated,
     validate,
     verify_password,
 )
@@ -82,22 +93,33 @@ class TestHashPassword:
 class TestVerifyPassword:
     """Tests for password verification."""
 
-    def test_correct_password_verifies(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def hashed_correct(cls):
+        """Hash of "correctpassword" shared by the class's tests."""
+        return hash_password("correctpassword")
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def hashed_notempty(cls):
+        """Hash of "notempty" shared by the class's tests."""
+        return hash_password("notempty")
+
+    def test_correct_password_verifies(self, hashed_correct):
         """Correct password should return True."""
-        hashed = hash_password("correctpassword")
-        assert verify_password("correctpassword", hashed) is True
+        assert verify_password("correctpassword", hashed_correct) is True
 
-    def test_wrong_password_fails(self):
+    def test_wrong_password_fails(self, hashed_correct):
         """Wrong password should return False."""
-        hashed = hash_password("correctpassword")
-        assert verify_password("wrongpassword", hashed) is False
+        assert verify_password("wrongpassword", hashed_correct) is False
 
-    def test_empty_password_fails(self):
+    def test_empty_password_fails(self, hashed_notempty):
         """Empty password should not match a non-empty hash."""
-        hashed = hash_password("notempty")
-        assert verify_password("", hashed) is False
+        assert verify_password("", hashed_notempty) is False
 
 
+# The test keys are deliberately short; PyJWT warns about them
+@pytest.mark.filterwarnings("ignore:The RSA key is 1024 bits long")
 class TestGenerateAndDecodeTokens:
     """Tests for JWT token generation and decoding.
 
@@ -105,14 +127,19 @@ class TestGenerateAndDecodeTokens:
     signing/verifying bytes with a test key pair.
     """
 
-    @pytest.fixture(autouse=True)
-    def setup_test_keys(self):
-        """Generate test RSA keys for token operations."""
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
+    @pytest.fixture(scope="class")
+    @classmethod
+    def rsa_key_pems(cls):
+        """Generate one RSA key pair shared by the class's tests.
+
+        Returns:
+            tuple[bytes, bytes]: Private (signing) and public (verifying)
+                keys in PEM format.
 
+        """
+        # 1024-bit for test speed only; production keys are 2048-bit
         private_key = rsa.generate_private_key(
-            public_exponent=65537, key_size=2048
+            public_exponent=65537, key_size=1024
         )
         public_key = private_key.public_key()
 
@@ -125,92 +152,68 @@ class TestGenerateAndDecodeTokens:
             encoding=serialization.Encoding.PEM,
             format=serialization.PublicFormat.SubjectPublicKeyInfo,
         )
+        return test_signing, test_verifying
 
-        # Patch the module-level key bytes
-        self._signing_patch = patch(
-            "src.services.signing_bytes", test_signing
-        )
-        self._verifying_patch = patch(
-            "src.services.verifying_bytes", test_verifying
-        )
-        self._signing_patch.start()
-        self._verifying_patch.start()
-
-        yield
-
-        self._signing_patch.stop()
-        self._verifying_patch.stop()
-
-    def _make_mock_user(self, badge="EMP001", scopes=None):
+    @pytest.fixture(autouse=True)
+    def setup_test_keys(self, monkeypatch, rsa_key_pems):
+        """Patch the module-level key bytes with the test key pair."""
+        test_signing, test_verifying = rsa_key_pems
+        monkeypatch.setattr(services, "signing_bytes", test_signing)
+        monkeypatch.setattr(services, "verifying_bytes", test_verifying)
+
+    @staticmethod
+    def _make_mock_user(badge="EMP001", scopes=None):
         """Create a mock User with auth roles and permissions."""
         if scopes is None:
             scopes = ["employee.read", "timeclock.create"]
 
-        permissions = []
-        for scope in scopes:
-            perm = Mock()
-            perm.resource = scope
-            permissions.append(perm)
-
-        role = Mock()
-        role.permissions = permissions
-
-        user = Mock()
-        user.badge_number = badge
-        user.auth_roles = [role]
-        return user
-
-    def test_generate_access_token_contains_badge(self):
+        role = SimpleNamespace(
+            permissions=[SimpleNamespace(resource=scope) for scope in scopes]
+        )
+        return SimpleNamespace(badge_number=badge, auth_roles=[role])
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def access_token_payload(cls, rsa_key_pems):
+        """Decoded payload of one access token shared by the class's tests.
+
+        Class-scoped fixtures are set up before the per-test key patch, so
+        this one signs and verifies under its own patch of the key bytes.
+        """
+        test_signing, test_verifying = rsa_key_pems
+        user = cls._make_mock_user(badge="TEST001", scopes=["employee.read"])
+        with patch.multiple(
+            services,
+            signing_bytes=test_signing,
+            verifying_bytes=test_verifying,
+        ):
+            return decode_jwt_token(generate_access_token(user))
+
+    def test_generate_access_token_contains_badge(self, access_token_payload):
         """Access token payload should contain the badge number."""
-        from src.services import decode_jwt_token, generate_access_token
+        assert access_token_payload["badge_number"] == "TEST001"
 
-        user = self._make_mock_user(badge="TEST001")
-        token = generate_access_token(user)
-        payload = decode_jwt_token(token)
-        assert payload["badge_number"] == "TEST001"
-
-    def test_generate_access_token_contains_scopes(self):
+    def test_generate_access_token_contains_scopes(self, access_token_payload):
         """Access token payload should contain user scopes."""
-        from src.services import decode_jwt_token, generate_access_token
-
-        user = self._make_mock_user(scopes=["employee.read"])
-        token = generate_access_token(user)
-        payload = decode_jwt_token(token)
-        assert "employee.read" in payload["scopes"]
+        assert "employee.read" in access_token_payload["scopes"]
 
-    def test_generate_access_token_has_expiration(self):
+    def test_generate_access_token_has_expiration(self, access_token_payload):
         """Access token should have an exp claim."""
-        from src.services import decode_jwt_token, generate_access_token
-
-        user = self._make_mock_user()
-        token = generate_access_token(user)
-        payload = decode_jwt_token(token)
-        assert "exp" in payload
+        assert "exp" in access_token_payload
 
     def test_generate_refresh_token_contains_badge(self):
         """Refresh token payload should contain the badge number."""
-        from src.services import decode_jwt_token, generate_refresh_token
-
         user = self._make_mock_user(badge="REF001")
         token = generate_refresh_token(user)
         payload = decode_jwt_token(token)
         assert payload["badge_number"] == "REF001"
 
-    def test_decode_adds_sub_field(self):
+    def test_decode_adds_sub_field(self, access_token_payload):
         """Decoded token should have a 'sub' field matching badge_number."""
-        from src.services import decode_jwt_token, generate_access_token
-
-        user = self._make_mock_user(badge="SUB001")
-        token = generate_access_token(user)
-        payload = decode_jwt_token(token)
-        assert payload["sub"] == "SUB001"
+        assert access_token_payload["sub"] == "TEST001"
 
     def test_decode_expired_token_raises(self):
         """Decoding an expired token should raise an exception."""
-        import jwt as pyjwt
-
-        from src.services import decode_jwt_token, encode_jwt_token
-
         expired = datetime.now(timezone.utc) - timedelta(hours=1)
         token = encode_jwt_token("EXP001", expired, [])
         with pytest.raises(pyjwt.ExpiredSignatureError):
@@ -218,17 +221,11 @@ class TestGenerateAndDecodeTokens:
 
     def test_decode_invalid_token_raises(self):
         """Decoding a garbage token should raise an exception."""
-        import jwt as pyjwt
-
-        from src.services import decode_jwt_token
-
         with pytest.raises(pyjwt.InvalidTokenError):
             decode_jwt_token("not.a.valid.token")
 
     def test_encode_jwt_token_roundtrips(self):
         """encode_jwt_token and decode_jwt_token should roundtrip."""
-        from src.services import decode_jwt_token, encode_jwt_token
-
         exp = datetime.now(timezone.utc) + timedelta(hours=1)
         token = encode_jwt_token("RT001", exp, ["a.read", "b.write"])
         payload = decode_jwt_token(token)
@@ -236,55 +233,93 @@ class TestGenerateAndDecodeTokens:
         assert "a.read" in payload["scopes"]
         assert "b.write" in payload["scopes"]
 
+    def test_decode_cached_token_still_expires(self):
+        """A token verified earlier should be rejected once it expires."""
+        exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+        token = encode_jwt_token("CACHE001", exp, [])
+        decode_jwt_token(token)
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=10)
+        with patch("src.services.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            with pytest.raises(pyjwt.ExpiredSignatureError):
+                decode_jwt_token(token)
+
+    def test_decode_returns_independent_payloads(self):
+        """Changing a decoded payload should not affect later decodes."""
+        exp = datetime.now(timezone.utc) + timedelta(hours=1)
+        token = encode_jwt_token("CACHE002", exp, [])
+        decode_jwt_token(token)["badge_number"] = "CHANGED"
+
+        assert decode_jwt_token(token)["badge_number"] == "CACHE002"
+
+    def test_decode_after_key_change_reverifies(self):
+        """A token cached under an old key should fail under a new one."""
+        exp = datetime.now(timezone.utc) + timedelta(hours=1)
+        token = encode_jwt_token("CACHE003", exp, [])
+        decode_jwt_token(token)
+
+        other_verifying = (
+            rsa.generate_private_key(public_exponent=65537, key_size=1024)
+            .public_key()
+            .public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+        with patch("src.services.verifying_bytes", other_verifying):
+            with pytest.raises(pyjwt.InvalidSignatureError):
+                decode_jwt_token(token)
+
 
 class TestGetScopesFromUser:
     """Tests for get_scopes_from_user."""
 
     def test_user_with_no_roles(self):
         """User with no auth roles should have empty scopes."""
-        user = Mock()
-        user.auth_roles = []
+        user = SimpleNamespace(auth_roles=[])
         result = get_scopes_from_user(user)
         assert result == []
 
     def test_user_with_single_role(self):
         """User with one role should have that role's permissions."""
-        perm1 = Mock()
-        perm1.resource = "employee.read"
-        perm2 = Mock()
-        perm2.resource = "employee.create"
-
-        role = Mock()
-        role.permissions = [perm1, perm2]
-
-        user = Mock()
-        user.auth_roles = [role]
+        perm1 = SimpleNamespace(resource="employee.read")
+        perm2 = SimpleNamespace(resource="employee.create")
+        role = SimpleNamespace(permissions=[perm1, perm2])
+        user = SimpleNamespace(auth_roles=[role])
 
         result = get_scopes_from_user(user)
         assert set(result) == {"employee.read", "employee.create"}
 
     def test_user_with_multiple_roles_deduplicates(self):
         """Overlapping permissions across roles should be deduplicated."""
-        perm_read = Mock()
-        perm_read.resource = "employee.read"
-        perm_create = Mock()
-        perm_create.resource = "employee.create"
-        perm_read2 = Mock()
-        perm_read2.resource = "employee.read"  # duplicate
+        perm_read = SimpleNamespace(resource="employee.read")
+        perm_create = SimpleNamespace(resource="employee.create")
+        perm_read2 = SimpleNamespace(resource="employee.read")  # duplicate
 
-        role1 = Mock()
-        role1.permissions = [perm_read, perm_create]
-        role2 = Mock()
-        role2.permissions = [perm_read2]
-
-        user = Mock()
-        user.auth_roles = [role1, role2]
+        role1 = SimpleNamespace(permissions=[perm_read, perm_create])
+        role2 = SimpleNamespace(permissions=[perm_read2])
+        user = SimpleNamespace(auth_roles=[role1, role2])
 
         result = get_scopes_from_user(user)
         assert set(result) == {"employee.read", "employee.create"}
         # Should not contain duplicates
         assert len(result) == 2
 
+    def test_user_with_many_overlapping_roles(self):
+        """Scopes from many roles sharing permissions are deduplicated."""
+        permissions = [
+            SimpleNamespace(resource=f"resource{i}.read") for i in range(50)
+        ]
+        user = SimpleNamespace(
+            auth_roles=[
+                SimpleNamespace(permissions=permissions) for _ in range(100)
+            ]
+        )
+
+        result = get_scopes_from_user(user)
+        assert sorted(result) == sorted(p.resource for p in permissions)
+
 
 class TestCreateEventLog:
     """Tests for create_event_log."""
@@ -293,16 +328,14 @@ class TestCreateEventLog:
         """Should create and commit an EventLog with formatted message."""
         mock_db = MagicMock()
 
-        with patch("src.services.EVENT_LOG_MSGS", {
-            "employee": {"CREATE": "Employee {name} created"}
-        }):
-            create_event_log(
-                identifier="employee",
-                action="CREATE",
-                log_args={"name": "John Doe"},
-                caller_badge="0",
-                db=mock_db,
-            )
+        create_event_log(
+            identifier="employee",
+            action="CREATE",
+            log_args={"name": "John Doe"},
+            caller_badge="0",
+            db=mock_db,
+            messages={"employee": {"CREATE": "Employee {name} created"}},
+        )
 
         mock_db.add.assert_called_once()
         mock_db.commit.assert_called_once()
@@ -315,18 +348,18 @@ class TestCreateEventLog:
         """Should format message with multiple template args."""
         mock_db = MagicMock()
 
-        with patch("src.services.EVENT_LOG_MSGS", {
-            "department": {
-                "ADD_MEMBER": "Employee {badge} added to {dept_name}"
-            }
-        }):
-            create_event_log(
-                identifier="department",
-                action="ADD_MEMBER",
-                log_args={"badge": "EMP001", "dept_name": "Engineering"},
-                caller_badge="ADMIN",
-                db=mock_db,
-            )
+        create_event_log(
+            identifier="department",
+            action="ADD_MEMBER",
+            log_args={"badge": "EMP001", "dept_name": "Engineering"},
+            caller_badge="ADMIN",
+            db=mock_db,
+            messages={
+                "department": {
+                    "ADD_MEMBER": "Employee {badge} added to {dept_name}"
+                }
+            },
+        )
 
         event_log = mock_db.add.call_args[0][0]
         assert event_log.log == "Employee EMP001 added to Engineering"
@@ -335,31 +368,36 @@ class TestCreateEventLog:
 class TestLicenseActivationState:
     """Tests for license activation state management."""
 
-    def test_set_license_activated_true(self):
-        """Setting license activated to True should update global state."""
-        from src.services import set_license_activated
+    @pytest.fixture
+    def license_active(self, monkeypatch):
+        """Set the module-level activation flag for one test.
 
-        with patch("src.services.is_license_activated", False):
-            set_license_activated(True)
-            # The function sets the global directly
-            import src.services
-            assert src.services.is_license_activated is True
+        Yields:
+            Callable: Sets `src.services.is_license_activated`; the
+                original value is restored on teardown.
+        """
 
-    def test_requires_license_raises_when_not_activated(self):
-        """requires_license should raise 403 when license is not active."""
-        from src.services import requires_license
+        def apply(active):
+            monkeypatch.setattr(services, "is_license_activated", active)
 
-        with patch("src.services.is_license_activated", False):
-            mock_db = MagicMock()
-            with pytest.raises(HTTPException) as exc_info:
-                requires_license(db=mock_db)
-            assert exc_info.value.status_code == 403
+        yield apply
 
-    def test_requires_license_passes_when_activated(self):
-        """requires_license should not raise when license is active."""
-        from src.services import requires_license
+    def test_set_license_activated_true(self, license_active):
+        """Setting license activated to True should update global state."""
+        license_active(False)
+        set_license_activated(True)
+        # The function sets the global directly
+        assert services.is_license_activated is True
 
-        with patch("src.services.is_license_activated", True):
-            mock_db = MagicMock()
-            # Should not raise
-            requires_license(db=mock_db)
+    def test_requires_license_raises_when_not_activated(self, license_active):
+        """requires_license should raise 403 when license is not active."""
+        license_active(False)
+        with pytest.raises(HTTPException) as exc_info:
+            requires_license(db=MagicMock())
+        assert exc_info.value.status_code == 403
+
+    def test_requires_license_passes_when_activated(self, license_active):
+        """requires_license should not raise when license is active."""
+        license_active(True)
+        # Should not raise
+        requires_license(db=MagicMock())
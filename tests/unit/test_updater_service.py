@@ -1,94 +1,128 @@
 """Unit tests for updater service."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
 from src.updater.service import (
+    UpdaterState,
     check_for_update,
     compare_versions,
     get_status,
-    reset_state,
 )
 
 
-@pytest.fixture(autouse=True)
-def clean_state():
-    """Reset updater state before each test."""
-    reset_state()
-    yield
-    reset_state()
+GITHUB_RELEASE = {
+    "tag_name": "v1.1.0",
+    "published_at": "2026-01-15T00:00:00Z",
+    "body": "Bug fixes and improvements",
+    "assets": [
+        {
+            "name": "TAP-1.1.0.zip",
+            "browser_download_url": "https://github.com/dl/TAP-1.1.0.zip",
+            "size": 50000000,
+        }
+    ],
+}
 
 
-class TestCompareVersions:
-    def test_equal(self):
-        assert compare_versions("1.0.0", "1.0.0") == 0
+def _release_response(
+    payload: dict, etag: str | None = None, status_code: int = 200
+) -> httpx.Response:
+    """Build a GitHub releases API response."""
+    headers = {"ETag": etag} if etag else {}
+    return httpx.Response(
+        status_code,
+        json=payload,
+        headers=headers,
+        request=httpx.Request("GET", "https://api.github.com/"),
+    )
 
-    def test_current_older(self):
-        assert compare_versions("1.0.0", "1.1.0") == -1
 
-    def test_current_newer(self):
-        assert compare_versions("2.0.0", "1.9.9") == 1
+@pytest.fixture(scope="module")
+def _github_api_patch():
+    """Patch the GitHub API call once for the whole module."""
+    with patch("src.updater.service._http_client.get") as mock_get:
+        yield mock_get
 
-    def test_patch_older(self):
-        assert compare_versions("1.0.0", "1.0.1") == -1
 
-    def test_major_older(self):
-        assert compare_versions("1.9.9", "2.0.0") == -1
+@pytest.fixture
+def github_api(_github_api_patch: MagicMock) -> MagicMock:
+    """Shared GitHub API mock, cleared of any previous test's setup."""
+    _github_api_patch.reset_mock(return_value=True, side_effect=True)
+    return _github_api_patch
 
-    def test_v_prefix(self):
-        assert compare_versions("v1.0.0", "v1.0.0") == 0
-        assert compare_versions("v1.0.0", "v1.1.0") == -1
 
-    def test_short_version(self):
-        assert compare_versions("1.0", "1.0.0") == 0
-        assert compare_versions("1", "1.0.0") == 0
+@pytest.fixture
+def updater_state() -> UpdaterState:
+    """Fresh updater state for each test."""
+    return UpdaterState()
 
-    def test_mixed_prefix(self):
-        assert compare_versions("1.0.0", "v1.0.0") == 0
+
+class TestCompareVersions:
+    @pytest.mark.parametrize(
+        "current, latest, expected",
+        [
+            ("1.0.0", "1.0.0", 0),
+            ("1.0.0", "1.1.0", -1),
+            ("2.0.0", "1.9.9", 1),
+            ("1.0.0", "1.0.1", -1),
+            ("1.9.9", "2.0.0", -1),
+            ("v1.0.0", "v1.0.0", 0),
+            ("v1.0.0", "v1.1.0", -1),
+            ("1.0", "1.0.0", 0),
+            ("1", "1.0.0", 0),
+            ("1.0.0", "v1.0.0", 0),
+            ("1.0.0.9", "1.0.0", 0),
+        ],
+        ids=[
+            "equal",
+            "current_older",
+            "current_newer",
+            "patch_older",
+            "major_older",
+            "v_prefix_equal",
+            "v_prefix_older",
+            "short_minor",
+            "short_major",
+            "mixed_prefix",
+            "extra_parts_ignored",
+        ],
+    )
+    def test_compare(self, current, latest, expected):
+        assert compare_versions(current, latest) == expected
+
+    def test_repeat_comparison_is_cached(self):
+        compare_versions("1.0.0", "1.2.0")
+        hits = compare_versions.cache_info().hits
+
+        assert compare_versions("1.0.0", "1.2.0") == -1
+        assert compare_versions.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize("version", ["", "v", "1.x.0", "1.0.0-beta"])
+    def test_invalid_version(self, version):
+        with pytest.raises(ValueError):
+            compare_versions(version, "1.0.0")
 
 
 class TestCheckForUpdate:
     def _mock_settings(self, repo="owner/TAP", token=""):
-        settings = MagicMock()
-        settings.GITHUB_REPO = repo
-        settings.GITHUB_TOKEN = token
-        return settings
-
-    def _github_response(
-        self, tag="v1.1.0", asset_name="TAP-1.1.0.zip"
-    ):
-        return {
-            "tag_name": tag,
-            "published_at": "2026-01-15T00:00:00Z",
-            "body": "Bug fixes and improvements",
-            "assets": [
-                {
-                    "name": asset_name,
-                    "browser_download_url": (
-                        f"https://github.com/dl/{asset_name}"
-                    ),
-                    "size": 50000000,
-                }
-            ],
-        }
+        return SimpleNamespace(GITHUB_REPO=repo, GITHUB_TOKEN=token)
 
-    def test_repo_not_configured(self):
+    def test_repo_not_configured(self, updater_state):
         settings = self._mock_settings(repo="")
         with pytest.raises(ValueError, match="not configured"):
-            check_for_update(settings)
+            check_for_update(settings, updater_state)
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_new_version_available(self, mock_get, mock_ver):
+    def test_new_version_available(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.0.0"
-        mock_response = MagicMock()
-        mock_response.json.return_value = self._github_response()
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_response = _release_response(GITHUB_RELEASE)
+        github_api.return_value = mock_response
 
-        result = check_for_update(self._mock_settings())
+        result = check_for_update(self._mock_settings(), updater_state)
 
         assert result is not None
         assert result.version == "1.1.0"
@@ -96,82 +130,61 @@ class TestCheckForUpdate:
         assert "github.com" in result.download_url
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_up_to_date(self, mock_get, mock_ver):
+    def test_up_to_date(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.1.0"
-        mock_response = MagicMock()
-        mock_response.json.return_value = self._github_response(
-            tag="v1.1.0"
-        )
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        github_api.return_value = _release_response(GITHUB_RELEASE)
 
-        result = check_for_update(self._mock_settings())
+        result = check_for_update(self._mock_settings(), updater_state)
 
         assert result is None
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_current_newer(self, mock_get, mock_ver):
+    def test_current_newer(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "2.0.0"
-        mock_response = MagicMock()
-        mock_response.json.return_value = self._github_response(
-            tag="v1.1.0"
-        )
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        github_api.return_value = _release_response(GITHUB_RELEASE)
 
-        result = check_for_update(self._mock_settings())
+        result = check_for_update(self._mock_settings(), updater_state)
 
         assert result is None
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_no_zip_asset(self, mock_get, mock_ver):
+    def test_no_zip_asset(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.0.0"
-        data = self._github_response()
-        data["assets"] = [
-            {"name": "source.tar.gz", "size": 1000}
-        ]
-        mock_response = MagicMock()
-        mock_response.json.return_value = data
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        data = {
+            **GITHUB_RELEASE,
+            "assets": [{"name": "source.tar.gz", "size": 1000}],
+        }
+        mock_response = _release_response(data)
+        github_api.return_value = mock_response
 
-        result = check_for_update(self._mock_settings())
+        result = check_for_update(self._mock_settings(), updater_state)
 
         assert result is None
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_github_api_error(self, mock_get, mock_ver):
+    def test_github_api_error(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.0.0"
-        mock_get.side_effect = httpx.HTTPStatusError(
-            "Not found",
-            request=MagicMock(),
-            response=MagicMock(status_code=404),
+        github_api.return_value = _release_response(
+            {"message": "Not Found"}, status_code=404
         )
 
         with pytest.raises(httpx.HTTPStatusError):
-            check_for_update(self._mock_settings())
+            check_for_update(self._mock_settings(), updater_state)
 
-        status = get_status()
+        status = get_status(updater_state)
         assert status.state == "error"
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_with_auth_token(self, mock_get, mock_ver):
+    def test_with_auth_token(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.0.0"
-        mock_response = MagicMock()
-        mock_response.json.return_value = self._github_response()
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_response = _release_response(GITHUB_RELEASE)
+        github_api.return_value = mock_response
 
         check_for_update(
-            self._mock_settings(token="ghp_test123")
+            self._mock_settings(token="ghp_test123"), updater_state
         )
 
-        call_kwargs = mock_get.call_args
+        call_kwargs = github_api.call_args
         headers = call_kwargs.kwargs.get(
             "headers", call_kwargs[1].get("headers", {})
         )
@@ -179,12 +192,83 @@ class TestCheckForUpdate:
             "Authorization", ""
         )
 
+    @patch("src.updater.service.get_current_version")
+    def test_not_modified_reuses_last_result(
+        self, mock_ver, github_api, updater_state
+    ):
+        mock_ver.return_value = "1.0.0"
+        first = _release_response(GITHUB_RELEASE, etag='"abc"')
+        not_modified = MagicMock(status_code=304)
+        github_api.side_effect = [first, not_modified]
+
+        release = check_for_update(self._mock_settings(), updater_state)
+        cached = check_for_update(self._mock_settings(), updater_state)
+
+        assert cached is release
+        not_modified.json.assert_not_called()
+        not_modified.raise_for_status.assert_not_called()
+        headers = github_api.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert get_status(updater_state).state == "idle"
+
+    @patch("src.updater.service.get_current_version")
+    def test_etag_not_sent_for_other_repo(
+        self, mock_ver, github_api, updater_state
+    ):
+        mock_ver.return_value = "1.0.0"
+        github_api.return_value = _release_response(
+            GITHUB_RELEASE, etag='"abc"'
+        )
+
+        check_for_update(self._mock_settings(), updater_state)
+        check_for_update(
+            self._mock_settings(repo="other/TAP"), updater_state
+        )
+
+        assert "If-None-Match" not in github_api.call_args.kwargs["headers"]
+
+
+    @pytest.mark.parametrize(
+        "release, error",
+        [
+            ({**GITHUB_RELEASE, "tag_name": "vnext"}, ValueError),
+            (
+                {
+                    **GITHUB_RELEASE,
+                    "assets": [{"name": "TAP-1.1.0.zip", "size": 1}],
+                },
+                KeyError,
+            ),
+        ],
+        ids=["bad_tag", "asset_without_url"],
+    )
+    @patch("src.updater.service.get_current_version")
+    def test_failed_parse_not_cached(
+        self, mock_ver, release, error, github_api, updater_state
+    ):
+        mock_ver.return_value = "1.0.0"
+
+        def get(url, headers):
+            # GitHub answers 304 whenever the ETag is sent back
+            if headers.get("If-None-Match") == '"abc"':
+                return MagicMock(status_code=304)
+            return _release_response(release, etag='"abc"')
+
+        github_api.side_effect = get
+
+        for _ in range(2):
+            with pytest.raises(error):
+                check_for_update(self._mock_settings(), updater_state)
+            assert get_status(updater_state).state == "error"
+
+        assert "If-None-Match" not in github_api.call_args.kwargs["headers"]
+
 
 class TestGetStatus:
     @patch("src.updater.service.get_current_version")
-    def test_initial_state(self, mock_ver):
+    def test_initial_state(self, mock_ver, updater_state):
         mock_ver.return_value = "1.0.0"
-        status = get_status()
+        status = get_status(updater_state)
 
         assert status.current_version == "1.0.0"
         assert status.state == "idle"
@@ -194,32 +278,15 @@ class TestGetStatus:
         assert status.error is None
 
     @patch("src.updater.service.get_current_version")
-    @patch("src.updater.service.httpx.get")
-    def test_state_after_check(self, mock_get, mock_ver):
+    def test_state_after_check(self, mock_ver, github_api, updater_state):
         mock_ver.return_value = "1.0.0"
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "tag_name": "v1.1.0",
-            "published_at": "2026-01-15T00:00:00Z",
-            "body": "Changes",
-            "assets": [
-                {
-                    "name": "TAP-1.1.0.zip",
-                    "browser_download_url": "https://dl/TAP.zip",
-                    "size": 50000000,
-                }
-            ],
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        github_api.return_value = _release_response(GITHUB_RELEASE)
 
-        settings = MagicMock()
-        settings.GITHUB_REPO = "owner/TAP"
-        settings.GITHUB_TOKEN = ""
+        settings = SimpleNamespace(GITHUB_REPO="owner/TAP", GITHUB_TOKEN="")
 
-        check_for_update(settings)
+        check_for_update(settings, updater_state)
 
-        status = get_status()
+        status = get_status(updater_state)
         assert status.update_available is True
         assert status.latest_version == "1.1.0"
         assert status.last_checked is not None
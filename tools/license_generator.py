@@ -9,18 +9,23 @@ Usage:
     python license_generator.py --generate-keypair
     python license_generator.py --generate-license --private-key private.pem
     python license_generator.py --verify-license <license_key> --public-key public.pem
+    python license_generator.py --verify-licenses-file keys.txt --public-key public.pem
 """
 
 import argparse
 import sys
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.ed25519 import (
-    Ed25519PrivateKey,
-    Ed25519PublicKey,
-)
+from typing import TYPE_CHECKING
+
+# cryptography is imported inside the functions that use it, so --help and
+# argument errors do not pay its import time
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+        Ed25519PublicKey,
+    )
 
 # Standard message that gets signed to create license keys
 LICENSE_MESSAGE = b"TAP-License-v1"
@@ -35,6 +40,11 @@ def generate_key_pair(output_dir: Path = Path(".")):
     Returns:
         tuple: (private_key_path, public_key_path)
     """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+    )
+
     print("Generating Ed25519 key pair...")
 
     # Generate private key
@@ -85,6 +95,97 @@ def generate_key_pair(output_dir: Path = Path(".")):
     return private_key_path, public_key_path
 
 
+@lru_cache(maxsize=8)
+def _load_private_key(path: str, mtime_ns: int) -> "Ed25519PrivateKey":
+    """Load an Ed25519 private key from a PEM file.
+
+    Results are cached per path and modification time, so a rewritten key
+    file is parsed again.
+
+    Args:
+        path: Resolved path to the private key PEM file
+        mtime_ns: Modification time of the file, in nanoseconds
+
+    Returns:
+        Ed25519PrivateKey: The loaded private key
+
+    Raises:
+        ValueError: If the file does not hold an Ed25519 private key
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+    )
+
+    private_key = serialization.load_pem_private_key(
+        Path(path).read_bytes(), password=None
+    )
+
+    if not isinstance(private_key, Ed25519PrivateKey):
+        raise ValueError("Invalid private key type - must be Ed25519")
+
+    return private_key
+
+
+@lru_cache(maxsize=8)
+def _load_public_key(path: str, mtime_ns: int) -> "Ed25519PublicKey":
+    """Load an Ed25519 public key from a PEM file.
+
+    Results are cached per path and modification time, so a rewritten key
+    file is parsed again.
+
+    Args:
+        path: Resolved path to the public key PEM file
+        mtime_ns: Modification time of the file, in nanoseconds
+
+    Returns:
+        Ed25519PublicKey: The loaded public key
+
+    Raises:
+        ValueError: If the file does not hold an Ed25519 public key
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PublicKey,
+    )
+
+    public_key = serialization.load_pem_public_key(Path(path).read_bytes())
+
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise ValueError("Invalid public key type - must be Ed25519")
+
+    return public_key
+
+
+def _read_private_key(private_key_path: Path) -> "Ed25519PrivateKey":
+    """Load the Ed25519 private key used to sign license keys.
+
+    Args:
+        private_key_path: Path to the private key PEM file
+
+    Returns:
+        Ed25519PrivateKey: The loaded private key
+    """
+    if not private_key_path.exists():
+        raise FileNotFoundError(f"Private key not found: {private_key_path}")
+
+    return _load_private_key(
+        str(private_key_path.resolve()), private_key_path.stat().st_mtime_ns
+    )
+
+
+def _sign_license(private_key: "Ed25519PrivateKey") -> str:
+    """Sign the standard license message with an already loaded key.
+
+    Args:
+        private_key: The Ed25519 private key
+
+    Returns:
+        str: The Ed25519 signature in hex format (128 characters)
+    """
+    return private_key.sign(LICENSE_MESSAGE).hex()
+
+
 def generate_license_key(private_key_path: Path) -> str:
     """Generate a license key by signing the standard license message.
 
@@ -94,23 +195,64 @@ def generate_license_key(private_key_path: Path) -> str:
     Returns:
         str: The Ed25519 signature in hex format (128 characters)
     """
-    if not private_key_path.exists():
-        raise FileNotFoundError(f"Private key not found: {private_key_path}")
+    return _sign_license(_read_private_key(private_key_path))
 
-    # Load private key
-    private_key_pem = private_key_path.read_bytes()
-    private_key = serialization.load_pem_private_key(
-        private_key_pem, password=None
+
+def _read_public_key(public_key_path: Path) -> "Ed25519PublicKey":
+    """Load the Ed25519 public key used to verify license keys.
+
+    Args:
+        public_key_path: Path to the public key PEM file
+
+    Returns:
+        Ed25519PublicKey: The loaded public key
+    """
+    if not public_key_path.exists():
+        raise FileNotFoundError(f"Public key not found: {public_key_path}")
+
+    return _load_public_key(
+        str(public_key_path.resolve()), public_key_path.stat().st_mtime_ns
     )
 
-    if not isinstance(private_key, Ed25519PrivateKey):
-        raise ValueError("Invalid private key type - must be Ed25519")
 
-    # Sign the standard license message
-    signature = private_key.sign(LICENSE_MESSAGE)
+def _license_checker(
+    public_key: "Ed25519PublicKey",
+) -> Callable[[str], str | None]:
+    """Build a license key check bound to an already loaded public key.
+
+    cryptography's exception type is imported here, once per batch,
+    instead of on every key.
+
+    Args:
+        public_key: The Ed25519 public key
+
+    Returns:
+        Callable[[str], str | None]: Takes a license key and returns why it
+            is invalid, or None if the signature is valid
+    """
+    from cryptography.exceptions import InvalidSignature
+
+    def check(license_key: str) -> str | None:
+        # Validate format, decoding the signature only once
+        try:
+            signature_bytes = bytes.fromhex(license_key)
+        except ValueError:
+            return "Invalid format: License key must be valid hexadecimal"
+
+        if len(signature_bytes) != 64:
+            return (
+                "Invalid format: License key must encode a 64-byte "
+                f"Ed25519 signature (got {len(signature_bytes)} bytes)"
+            )
 
-    # Return as hex string
-    return signature.hex()
+        try:
+            # Verify signature against the standard license message
+            public_key.verify(signature_bytes, LICENSE_MESSAGE)
+        except InvalidSignature:
+            return "Verification failed: signature does not match"
+        return None
+
+    return check
 
 
 def verify_license_key(license_key: str, public_key_path: Path) -> bool:
@@ -123,40 +265,36 @@ def verify_license_key(license_key: str, public_key_path: Path) -> bool:
     Returns:
         bool: True if the signature is valid
     """
-    if not public_key_path.exists():
-        raise FileNotFoundError(f"Public key not found: {public_key_path}")
+    check = _license_checker(_read_public_key(public_key_path))
+    failure = check(license_key)
+    if failure:
+        print(f"[FAIL] {failure}")
+    return failure is None
 
-    # Validate format
-    if len(license_key) != 128:
-        print(
-            f"[FAIL] Invalid format: License key must be 128 characters (got {len(license_key)})"
-        )
-        return False
 
-    try:
-        bytes.fromhex(license_key)
-    except ValueError:
-        print("[FAIL] Invalid format: License key must be valid hexadecimal")
-        return False
+def verify_license_keys(
+    license_keys: list[str], public_key_path: Path
+) -> list[str | None]:
+    """Verify many license keys against the public key.
 
-    # Load public key
-    public_key_pem = public_key_path.read_bytes()
-    public_key = serialization.load_pem_public_key(public_key_pem)
+    The public key is loaded once. Ed25519 signatures over the fixed
+    license message are deterministic, so repeated keys are only
+    verified once.
 
-    if not isinstance(public_key, Ed25519PublicKey):
-        raise ValueError("Invalid public key type - must be Ed25519")
-
-    try:
-        # Decode signature from hex
-        signature_bytes = bytes.fromhex(license_key)
-
-        # Verify signature against the standard license message
-        public_key.verify(signature_bytes, LICENSE_MESSAGE)
-        return True
+    Args:
+        license_keys: The license keys (hex-encoded Ed25519 signatures)
+        public_key_path: Path to the public key PEM file
 
-    except (InvalidSignature, ValueError) as e:
-        print(f"[FAIL] Verification failed: {e}")
-        return False
+    Returns:
+        list[str | None]: Why each key is invalid, or None for valid keys,
+            in input order
+    """
+    check = _license_checker(_read_public_key(public_key_path))
+    failures: dict[str, str | None] = {}
+    for license_key in license_keys:
+        if license_key not in failures:
+            failures[license_key] = check(license_key)
+    return [failures[license_key] for license_key in license_keys]
 
 
 def main():
@@ -177,6 +315,9 @@ Examples:
 
   # Verify a license key
   python license_generator.py --verify-license <key> --public-key tap_public_key.pem
+
+  # Verify a file of license keys, one per line
+  python license_generator.py --verify-licenses-file keys.txt --public-key tap_public_key.pem
         """,
     )
 
@@ -199,6 +340,13 @@ Examples:
         help="Verify a license key",
     )
 
+    parser.add_argument(
+        "--verify-licenses-file",
+        type=Path,
+        metavar="FILE",
+        help="Verify license keys listed one per line in FILE",
+    )
+
     parser.add_argument(
         "--private-key",
         type=Path,
@@ -233,7 +381,12 @@ Examples:
 
     # Validate arguments
     if not any(
-        [args.generate_keypair, args.generate_license, args.verify_license]
+        [
+            args.generate_keypair,
+            args.generate_license,
+            args.verify_license,
+            args.verify_licenses_file,
+        ]
     ):
         parser.print_help()
         sys.exit(1)
@@ -256,11 +409,14 @@ Examples:
             print(f"Generating {args.count} license key(s)...")
             print()
 
-            for i in range(args.count):
-                license_key = generate_license_key(args.private_key)
-                print(f"License Key {i+1}:")
-                print(f"  {license_key}")
-                print()
+            # Write all keys at once rather than printing per key
+            private_key = _read_private_key(args.private_key)
+            sys.stdout.write(
+                "".join(
+                    f"License Key {i+1}:\n  {_sign_license(private_key)}\n\n"
+                    for i in range(args.count)
+                )
+            )
 
             print(f"[OK] Generated {args.count} license key(s) successfully")
             return 0
@@ -283,6 +439,43 @@ Examples:
                 print("[FAIL] License key is INVALID")
                 return 1
 
+        # Verify a file of license keys
+        if args.verify_licenses_file:
+            if not args.public_key:
+                print(
+                    "Error: --public-key is required for license verification"
+                )
+                return 1
+
+            license_keys = [
+                line.strip()
+                for line in args.verify_licenses_file.read_text().splitlines()
+                if line.strip()
+            ]
+            # Collect the whole report and write it at once
+            failures = verify_license_keys(license_keys, args.public_key)
+            lines = [f"Verifying {len(license_keys)} license key(s)...", ""]
+            for i, failure in enumerate(failures):
+                lines.append(
+                    f"License Key {i+1}: INVALID ({failure})"
+                    if failure
+                    else f"License Key {i+1}: VALID"
+                )
+            lines.append("")
+
+            invalid = sum(failure is not None for failure in failures)
+            if invalid:
+                lines.append(
+                    f"[FAIL] {invalid} of {len(failures)} license key(s) "
+                    "are INVALID"
+                )
+            else:
+                lines.append(
+                    f"[OK] All {len(failures)} license key(s) are VALID"
+                )
+            sys.stdout.write("\n".join(lines) + "\n")
+            return 1 if invalid else 0
+
     except Exception as e:
         print(f"Error: {e}")
         return 1